@@ -20,6 +20,14 @@ from src.config import (
     MIXTURE_API_NUM_OF_ROWS,
     MIXTURE_API_SERVICE_KEY,
 )
+from src.data.incremental_sync import (
+    compute_delta,
+    find_conflicting_keys,
+    format_delta,
+    load_sync_state,
+    record_fingerprint,
+    save_sync_state,
+)
 from src.vectorstore.supabase_store import get_supabase_client
 
 # Mixture 테이블 컬럼
@@ -45,6 +53,20 @@ MIXTURE_COLUMNS = [
     "DEL_YN",
 ]
 
+# 혼합성분 레코드 식별 키 (증분 동기화용 복합 키, 소프트 삭제는 마지막 컬럼을 in 필터로 묶음)
+MIXTURE_KEY_COLUMNS = ["TYPE_NAME", "INGR_CODE", "MIXTURE_INGR_CODE"]
+
+# upsert on_conflict 대상 복합 키 유니크 제약 (mixtures 테이블 생성 후 SQL Editor에서 1회 실행)
+MIXTURE_KEY_UNIQUE_SQL = (
+    'ALTER TABLE mixtures ADD CONSTRAINT mixtures_key_unique UNIQUE ("TYPE_NAME", "INGR_CODE", "MIXTURE_INGR_CODE");'
+)
+
+# 소프트 삭제 in 필터 한 번에 넣을 최대 키 수 (URL 길이 제한)
+SOFT_DELETE_BATCH_SIZE = 200
+
+# 증분 동기화 상태 파일 (복합 키 → 지문)
+MIXTURE_SYNC_STATE_PATH = "data/raw/mixture_sync_state.json"
+
 
 def fetch_page(base_url: str, page_no: int, num_of_rows: int = MIXTURE_API_NUM_OF_ROWS,
                service_key: Optional[str] = None) -> dict:
@@ -138,6 +160,7 @@ def ensure_table_exists(table_name: str = "mixtures") -> None:
     (테이블 생성은 Supabase 대시보드에서 수동으로 진행)
     """
     print(f"  '{table_name}' 테이블이 Supabase에 이미 생성되어 있다고 가정합니다.")
+    print(f"  복합 키 upsert에는 유니크 제약이 필요합니다: {MIXTURE_KEY_UNIQUE_SQL}")
 
 
 def upsert_to_supabase(rows: list[dict], table_name: str = "mixtures", batch_size: int = 500) -> None:
@@ -154,11 +177,72 @@ def upsert_to_supabase(rows: list[dict], table_name: str = "mixtures", batch_siz
         end = start + batch_size
         batch = rows[start:end]
         print(f"  배치 {i+1}/{batches} upsert 중 ({len(batch)}건)...")
-        client.table(table_name).upsert(batch).execute()
+        # 복합 키 기준으로 갱신 (대리 키 테이블에서 변경 레코드가 중복 삽입되지 않도록)
+        client.table(table_name).upsert(batch, on_conflict=",".join(MIXTURE_KEY_COLUMNS)).execute()
 
     print(f"  upsert 완료: {total}건")
 
 
+def mixture_record_key(record: dict) -> str:
+    """복합 키 컬럼 값을 JSON 배열 문자열로 만듭니다. (상태 파일 키, 삭제 시 역변환)"""
+    return json.dumps([record.get(col, "") for col in MIXTURE_KEY_COLUMNS], ensure_ascii=False)
+
+
+def check_unique_keys(rows: list[dict]) -> None:
+    """복합 키가 같은데 내용이 다른 레코드가 있으면 ValueError를 발생시킵니다.
+
+    상태 파일과 upsert가 키당 한 레코드만 반영하므로, 이런 레코드는 동기화할 때마다 일부가 사라집니다.
+    """
+    conflicts = find_conflicting_keys(rows, mixture_record_key, MIXTURE_COLUMNS)
+    if conflicts:
+        sample = ", ".join(f"{key} x{count}" for key, count in list(conflicts.items())[:5])
+        raise ValueError(
+            f"복합 키 {MIXTURE_KEY_COLUMNS}가 같은데 내용이 다른 레코드가 {len(conflicts)}개 키에 있습니다: {sample}"
+        )
+
+
+def soft_delete_from_supabase(keys: list[str], table_name: str = "mixtures") -> None:
+    """원본에서 사라진 복합 키 레코드를 DEL_YN = TRUE로 표시합니다.
+
+    앞 키 컬럼(TYPE_NAME, INGR_CODE)이 같은 키끼리 묶어 마지막 컬럼 in 필터로 한 번에 갱신합니다.
+    """
+    client = get_supabase_client()
+    groups: dict[tuple, list] = {}
+    for key in keys:
+        *prefix, last = json.loads(key)
+        groups.setdefault(tuple(prefix), []).append(last)
+
+    prefix_columns, last_column = MIXTURE_KEY_COLUMNS[:-1], MIXTURE_KEY_COLUMNS[-1]
+    requests_sent = 0
+    for prefix, values in groups.items():
+        for i in range(0, len(values), SOFT_DELETE_BATCH_SIZE):
+            query = client.table(table_name).update({"DEL_YN": True})
+            for col, value in zip(prefix_columns, prefix):
+                query = query.eq(col, value)
+            query.in_(last_column, values[i : i + SOFT_DELETE_BATCH_SIZE]).execute()
+            requests_sent += 1
+    if keys:
+        print(f"  소프트 삭제 완료: {len(keys)}건 (요청 {requests_sent}회)")
+
+
+def sync_mixture_to_supabase(rows: list[dict], table_name: str = "mixtures",
+                             state_path: str = MIXTURE_SYNC_STATE_PATH) -> dict:
+    """이전 동기화 상태와 비교해 신규/변경 레코드만 upsert하고, 사라진 레코드는 소프트 삭제합니다."""
+    check_unique_keys(rows)
+    previous = load_sync_state(state_path)
+    if not previous:
+        print(f"  동기화 상태 파일 없음({state_path}): 전체 레코드를 신규로 처리합니다")
+    delta = compute_delta(rows, mixture_record_key, MIXTURE_COLUMNS, previous)
+    print(f"  변경분: {format_delta(delta)}")
+
+    upsert_to_supabase(delta["new"] + delta["changed"], table_name=table_name)
+    soft_delete_from_supabase(delta["deleted"], table_name=table_name)
+
+    # 업로드가 모두 끝난 뒤에만 상태 갱신 (중간 실패 시 다음 실행에서 다시 반영)
+    save_sync_state(state_path, delta["fingerprints"])
+    return delta
+
+
 def fetch_mixture_data(save_path: Optional[str] = None) -> list[dict]:
     """API에서 혼합성분 데이터를 수집합니다."""
     if not MIXTURE_API_BASE_URL:
@@ -181,8 +265,11 @@ def fetch_mixture_data(save_path: Optional[str] = None) -> list[dict]:
     return items
 
 
-def ingest_mixture_to_supabase(save_raw: bool = False) -> None:
-    """혼합성분 데이터 수집 → 정제 → Supabase 업로드 마스터 함수."""
+def ingest_mixture_to_supabase(save_raw: bool = False, incremental: bool = False) -> None:
+    """혼합성분 데이터 수집 → 정제 → Supabase 업로드 마스터 함수.
+
+    incremental=True면 지문이 바뀐 레코드만 upsert하고 사라진 레코드는 소프트 삭제합니다.
+    """
     print("=" * 60)
     print("혼합성분 데이터 수집 및 업로드")
     print("=" * 60)
@@ -205,7 +292,15 @@ def ingest_mixture_to_supabase(save_raw: bool = False) -> None:
 
     # 4) Supabase에 upsert
     print("Supabase에 데이터 업로드 중...")
-    upsert_to_supabase(cleaned_items, table_name="mixtures")
+    if incremental:
+        sync_mixture_to_supabase(cleaned_items, table_name="mixtures")
+    else:
+        upsert_to_supabase(cleaned_items, table_name="mixtures")
+        # 다음 증분 동기화의 비교 기준 저장
+        save_sync_state(
+            MIXTURE_SYNC_STATE_PATH,
+            {mixture_record_key(r): record_fingerprint(r, MIXTURE_COLUMNS) for r in cleaned_items},
+        )
     print()
     print("=" * 60)
     print("완료!")
@@ -213,4 +308,4 @@ def ingest_mixture_to_supabase(save_raw: bool = False) -> None:
 
 
 if __name__ == "__main__":
-    ingest_mixture_to_supabase(save_raw=True)
+    ingest_mixture_to_supabase(save_raw=True, incremental="--incremental" in sys.argv)
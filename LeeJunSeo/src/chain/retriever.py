@@ -54,6 +54,10 @@ def format_drug_info(row: dict) -> str:
     """drugs 테이블의 행 1건을 읽기 좋은 텍스트로 포맷합니다.
     HTML 태그 및 마크다운 취소선 형식만 제거."""
     import re
+
+    # 적재 시 미리 정제·렌더링된 컨텍스트가 있으면 정규식 처리 없이 사용
+    if row.get("context_block"):
+        return row["context_block"]
     
     def clean_value(value):
         """값에서 HTML 태그 및 마크다운 취소선만 제거."""
@@ -0,0 +1,86 @@
+"""DUR 충돌 행렬(DUR_ENGINE=matrix)과 그래프 쌍별 순회의 상호 병용금지 계산 시간을 비교합니다.
+
+dur_list.json을 로드해 성분 2~200개 처방을 무작위로 만들고,
+두 방식의 결과가 같은지 확인한 뒤 크기별 중앙값 지연 시간을 출력합니다.
+(기존 Supabase 방식은 성분 쌍마다 2번, 총 N(N-1)번 왕복합니다.)
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.chain.dur_graph import DurGraph
+from src.chain.dur_matrix import DurConflictMatrix
+
+DUR_JSON_PATH = Path(__file__).parent.parent / "data" / "raw" / "dur_list.json"
+
+
+def timed(func, *args) -> tuple[float, object]:
+    """func(*args) 실행 시간(ms)과 결과를 반환합니다."""
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def warning_keys(warnings: list[dict]) -> list[tuple]:
+    return sorted((w["drug1"], w["drug2"], w["reason"]) for w in warnings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default=str(DUR_JSON_PATH), help="dur_list.json 경로")
+    parser.add_argument("--sizes", default="2,5,10,20,50,100,200", help="처방 성분 수 (쉼표 구분)")
+    parser.add_argument("--samples", type=int, default=20, help="크기별 샘플 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Loading DUR data from: {args.path}")
+    with open(args.path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    print(f"Loaded {len(rows)} records")
+
+    build_ms, graph = timed(DurGraph, rows)
+    print(f"Graph build: {build_ms:.1f} ms ({len(graph)} nodes)")
+    build_ms, matrix = timed(DurConflictMatrix.from_graph, graph)
+    print(f"Matrix build: {build_ms:.1f} ms ({len(matrix)}x{len(matrix)}, {matrix.matrix.nbytes / 1024:.0f} KiB)")
+
+    rng = random.Random(args.seed)
+    nodes = list(graph.edges)
+    mismatches = 0
+    print(f"{'size':>5} {'pairs':>7} {'graph ms':>10} {'matrix ms':>10} {'conflicts':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        graph_ms, matrix_ms, found = [], [], []
+        for _ in range(args.samples):
+            ingredients = rng.sample(nodes, min(size, len(nodes)))
+            # 성분명 → 노드 해석은 두 방식이 공유 (캐시 후 비교)
+            groups = [graph.resolve_nodes(ingr) for ingr in ingredients]
+
+            elapsed, expected = timed(graph.mutual, ingredients)
+            graph_ms.append(elapsed)
+            elapsed, result = timed(matrix.conflicts, groups)
+            matrix_ms.append(elapsed)
+            found.append(len(result))
+
+            if warning_keys(result) != warning_keys(expected):
+                mismatches += 1
+        print(
+            f"{size:>5} {size * (size - 1) // 2:>7} {statistics.median(graph_ms):>10.3f}"
+            f" {statistics.median(matrix_ms):>10.3f} {statistics.median(found):>10.0f}"
+        )
+
+    if mismatches:
+        print(f"{mismatches} mismatches")
+        sys.exit(1)
+    print("All results match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""dur_list.json을 로컬 SQLite에 적재해 상호 병용금지 쌍 조회를 검증하고 지연 시간을 측정합니다.
+
+find_mutual_contraindications(RPC)와 같은 SQL 로직을 SQLite에서 실행하고,
+기존 이중 루프 방식(Python 참조 구현)과 결과가 같은지 비교합니다.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.chain.dur_graph import get_dur_field, is_deleted_row, to_mutual_warning
+from src.chain.dur_sql import find_mutual_contraindications_sqlite, load_dur_sqlite
+
+DUR_JSON_PATH = Path(__file__).parent.parent / "data" / "raw" / "dur_list.json"
+
+
+def reference_mutual(rows: list[dict], ingredients: list[str]) -> list[dict]:
+    """기존 이중 루프(성분 쌍 × 양방향 ILIKE)와 같은 판정을 메모리에서 수행합니다."""
+    active = [
+        (row.get("id", i), row)
+        for i, row in enumerate(rows, start=1)
+        if not is_deleted_row(row)
+    ]
+    matched = {}
+    for i, ingr1 in enumerate(ingredients):
+        for ingr2 in ingredients[i + 1 :]:
+            for a, b in ((ingr1, ingr2), (ingr2, ingr1)):
+                a, b = a.lower(), b.lower()
+                for row_id, row in active:
+                    if (
+                        a in get_dur_field(row, "INGR_KOR_NAME").lower()
+                        and b in get_dur_field(row, "MIXTURE_INGR_KOR_NAME").lower()
+                    ):
+                        matched[row_id] = row
+    return [to_mutual_warning(matched[row_id]) for row_id in sorted(matched)]
+
+
+def sample_ingredient_sets(rows: list[dict], size: int, count: int, seed: int) -> list[list[str]]:
+    """병용금지 쌍이 포함되도록 DUR 성분명에서 무작위 성분 목록을 뽑습니다."""
+    rng = random.Random(seed)
+    pairs = [
+        (get_dur_field(row, "INGR_KOR_NAME"), get_dur_field(row, "MIXTURE_INGR_KOR_NAME"))
+        for row in rows
+        if get_dur_field(row, "INGR_KOR_NAME") and get_dur_field(row, "MIXTURE_INGR_KOR_NAME")
+    ]
+    names = sorted({name for pair in pairs for name in pair})
+    sets = []
+    for _ in range(count):
+        chosen = list(rng.choice(pairs)) if size >= 2 else []
+        while len(chosen) < size:
+            chosen.append(rng.choice(names))
+        sets.append(list(dict.fromkeys(chosen)))
+    return sets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default=str(DUR_JSON_PATH), help="dur_list.json 경로")
+    parser.add_argument("--sizes", default="2,3,5,10", help="성분 목록 크기 (쉼표 구분)")
+    parser.add_argument("--samples", type=int, default=20, help="크기별 샘플 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"Loading DUR data from: {args.path}")
+    with open(args.path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    print(f"Loaded {len(rows)} records")
+
+    start = time.perf_counter()
+    conn = load_dur_sqlite(rows)
+    print(f"SQLite load: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    mismatches = 0
+    for size in (int(s) for s in args.sizes.split(",")):
+        sqlite_ms, reference_ms = [], []
+        for ingredients in sample_ingredient_sets(rows, size, args.samples, args.seed):
+            start = time.perf_counter()
+            result = find_mutual_contraindications_sqlite(conn, ingredients)
+            sqlite_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            expected = reference_mutual(rows, ingredients)
+            reference_ms.append((time.perf_counter() - start) * 1000)
+
+            if result != expected:
+                mismatches += 1
+                print(f"  MISMATCH {ingredients}: sqlite={len(result)} reference={len(expected)}")
+
+        print(
+            f"size={size:>3}  sqlite median {statistics.median(sqlite_ms):8.2f} ms"
+            f"  reference median {statistics.median(reference_ms):8.2f} ms"
+        )
+
+    conn.close()
+    if mismatches:
+        print(f"{mismatches} mismatches")
+        sys.exit(1)
+    print("All results match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""적재 파이프라인이 만든 SQLite 복제본으로 FTS5(trigram) 검색과 instr 부분 일치 검색을 비교합니다.
+
+복제본의 약품명/성분명/DUR 성분명에서 검색어를 무작위로 뽑아(시드 고정) 두 방식의
+결과 집합이 같은지 확인한 뒤 조회 종류별 중앙값 지연 시간을 출력합니다.
+같은 복제본 파일과 시드를 쓰면 어느 노드에서든 같은 질의 집합으로 측정됩니다.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import SQLITE_DB_PATH
+from src.repository.sqlite_repository import FTS_MIN_QUERY_CHARS, SQLiteRepository
+
+
+def timed(func, *args) -> tuple[float, object]:
+    """func(*args) 실행 시간(ms)과 결과를 반환합니다."""
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def sample_terms(values: list[str], count: int, rng: random.Random) -> list[str]:
+    """값의 일부 구간(3~6글자)을 검색어로 뽑습니다."""
+    values = [value for value in values if value and len(value) >= FTS_MIN_QUERY_CHARS]
+    terms = []
+    for value in rng.sample(values, min(count, len(values))):
+        size = rng.randint(FTS_MIN_QUERY_CHARS, min(6, len(value)))
+        start = rng.randint(0, len(value) - size)
+        terms.append(value[start : start + size])
+    return terms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default=SQLITE_DB_PATH, help="SQLite 복제본 경로")
+    parser.add_argument("--queries", type=int, default=50, help="조회 종류별 검색어 수")
+    parser.add_argument("--limit", type=int, default=50, help="검색 결과 최대 행 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"{args.path} 파일이 없습니다. 먼저 적재 파이프라인(scripts/ingest_to_supabase.py)을 실행해주세요.")
+        sys.exit(1)
+
+    repository = SQLiteRepository(args.path)
+    print(f"Replica: {args.path} {repository.replica_info()}")
+    if not repository.fts_enabled:
+        print("이 SQLite 빌드는 FTS5 trigram을 지원하지 않습니다.")
+        sys.exit(1)
+
+    rng = random.Random(args.seed)
+    drugs = repository.fetch_all("drugs", "item_name,main_item_ingr")
+    dur_names = [row["INGR_KOR_NAME"] for row in repository.fetch_all("dur", "INGR_KOR_NAME", order="id")]
+    cases = [
+        ("item_name", sample_terms([row["item_name"] for row in drugs], args.queries, rng)),
+        ("main_item_ingr", sample_terms([row["main_item_ingr"] for row in drugs], args.queries, rng)),
+        ("dur", sample_terms(sorted(set(dur_names)), args.queries, rng)),
+    ]
+
+    def run(column: str, term: str, limit: int) -> list:
+        if column == "dur":
+            return [row["id"] for row in repository.search_dur_by_name(term, limit)]
+        return [row["item_seq"] for row in repository.search_drugs(column, term, ["item_seq"], limit)]
+
+    mismatches = 0
+    print(f"{'query':>15} {'terms':>6} {'fts ms':>10} {'instr ms':>10} {'rows':>6}")
+    for column, terms in cases:
+        fts_ms, instr_ms, found = [], [], []
+        for term in terms:
+            # 결과 집합 비교는 limit 없이 (FTS는 순위순, instr은 저장 순서로 잘림)
+            repository.fts_enabled = True
+            expected_all = run(column, term, 1_000_000)
+            elapsed, result = timed(run, column, term, args.limit)
+            fts_ms.append(elapsed)
+            found.append(len(result))
+
+            repository.fts_enabled = False
+            if sorted(run(column, term, 1_000_000)) != sorted(expected_all):
+                mismatches += 1
+            elapsed, _ = timed(run, column, term, args.limit)
+            instr_ms.append(elapsed)
+        repository.fts_enabled = True
+        if not terms:
+            continue
+        print(
+            f"{column:>15} {len(terms):>6} {statistics.median(fts_ms):>10.3f}"
+            f" {statistics.median(instr_ms):>10.3f} {statistics.median(found):>6.0f}"
+        )
+
+    if mismatches:
+        print(f"{mismatches} mismatches")
+        sys.exit(1)
+    print("All results match")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Postgres(Supabase) 스키마 마이그레이션 CLI.
+
+  print   전체 마이그레이션 SQL 출력 (Supabase SQL Editor에 붙여넣기용)
+  apply   적용되지 않은 마이그레이션을 순서대로 적용
+  verify  적용 기록, pg_trgm 확장, trigram 인덱스 사용 여부 점검
+  bench   로컬 Postgres에서 trigram GIN 인덱스 전후의 ILIKE 실행 계획/지연 시간 비교
+
+print 외에는 DATABASE_URL(또는 --url)과 psycopg2(pip install psycopg2-binary)가 필요합니다.
+bench는 별도 스키마(trgm_bench)를 만들어 측정한 뒤 삭제합니다. (운영 DB 대신 로컬 Postgres에서 실행)
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import DATABASE_URL
+from src.repository.migrations import (
+    apply_migrations,
+    explain,
+    ilike_sql,
+    migrations_sql,
+    trgm_index_sql,
+    verify_schema,
+)
+
+DUR_JSON_PATH = Path(__file__).parent.parent / "data" / "raw" / "dur_list.json"
+BENCH_SCHEMA = "trgm_bench"
+
+
+def connect(url: str | None):
+    """psycopg2 연결을 반환합니다."""
+    try:
+        import psycopg2
+    except ImportError:
+        print("psycopg2가 필요합니다: pip install psycopg2-binary")
+        sys.exit(1)
+    if not url:
+        print("DATABASE_URL(.env) 또는 --url을 설정해주세요.")
+        sys.exit(1)
+    return psycopg2.connect(url)
+
+
+def plan_shape(plan: dict) -> str:
+    """실행 계획 트리의 노드 종류를 첫 번째 자식 방향으로 이어 붙입니다. (예: Limit > Seq Scan)"""
+    node = plan.get("Plan", plan)
+    shape = [node["Node Type"]]
+    while node.get("Plans"):
+        node = node["Plans"][0]
+        shape.append(node["Node Type"] + (f" ({node['Index Name']})" if "Index Name" in node else ""))
+    return " > ".join(shape)
+
+
+def sample_terms(names: list[str], count: int, rng: random.Random) -> list[str]:
+    """성분명 일부 구간(3~6글자)을 검색어로 뽑습니다. (trigram 인덱스가 쓰이는 길이)"""
+    names = [name for name in names if len(name) >= 3]
+    terms = []
+    for name in rng.sample(names, min(count, len(names))):
+        size = rng.randint(3, min(6, len(name)))
+        start = rng.randint(0, len(name) - size)
+        terms.append(name[start : start + size])
+    return terms
+
+
+def measure(conn, terms: list[str]) -> tuple[list[float], Counter]:
+    """검색어별 EXPLAIN ANALYZE 실행 시간(ms)과 실행 계획 형태 빈도를 반환합니다."""
+    times, shapes = [], Counter()
+    sql = ilike_sql("dur", "INGR_KOR_NAME")
+    for term in terms:
+        plan = explain(conn, sql, (f"%{term}%",), analyze=True)
+        times.append(plan["Execution Time"])
+        shapes[plan_shape(plan)] += 1
+    return times, shapes
+
+
+def print_measurement(label: str, times: list[float], shapes: Counter) -> None:
+    p95 = sorted(times)[min(len(times) - 1, int(len(times) * 0.95))]
+    print(f"[{label}] median {statistics.median(times):.3f} ms / p95 {p95:.3f} ms")
+    for shape, count in shapes.most_common():
+        print(f"  {count:>4}x {shape}")
+
+
+def bench(conn, path: str, copies: int, queries: int, seed: int) -> None:
+    print(f"Loading DUR data from: {path}")
+    with open(path, "r", encoding="utf-8") as f:
+        rows = json.load(f)
+    from psycopg2.extras import execute_values
+
+    values = [
+        (copy * len(rows) + i, row.get("INGR_KOR_NAME") or "", row.get("MIXTURE_INGR_KOR_NAME") or "")
+        for copy in range(copies)
+        for i, row in enumerate(rows)
+    ]
+    terms = sample_terms(sorted({value[1] for value in values}), queries, random.Random(seed))
+
+    with conn.cursor() as cur:
+        cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cur.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        cur.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+        cur.execute(f"SET search_path TO {BENCH_SCHEMA}, public")
+        cur.execute(
+            'CREATE TABLE dur (id BIGINT PRIMARY KEY, "INGR_KOR_NAME" TEXT, "MIXTURE_INGR_KOR_NAME" TEXT)'
+        )
+        # 기존 스키마와 같은 B-tree 인덱스 (선행 와일드카드 ILIKE에는 쓰이지 않음)
+        cur.execute('CREATE INDEX idx_dur_ingr_kor_name ON dur ("INGR_KOR_NAME")')
+        execute_values(cur, "INSERT INTO dur VALUES %s", values, page_size=5000)
+        cur.execute("ANALYZE dur")
+    conn.commit()
+    print(f"Loaded {len(values)} rows into {BENCH_SCHEMA}.dur, {len(terms)} query terms")
+
+    try:
+        before = measure(conn, terms)
+        start = time.perf_counter()
+        with conn.cursor() as cur:
+            cur.execute(trgm_index_sql("idx_dur_ingr_kor_name_trgm", "dur", "INGR_KOR_NAME"))
+            cur.execute("ANALYZE dur")
+        conn.commit()
+        print(f"GIN trigram index build: {(time.perf_counter() - start) * 1000:.0f} ms")
+        after = measure(conn, terms)
+
+        print_measurement("B-tree only", *before)
+        print_measurement("pg_trgm GIN", *after)
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["print", "apply", "verify", "bench"])
+    parser.add_argument("--url", default=DATABASE_URL, help="Postgres 연결 문자열 (기본: DATABASE_URL)")
+    parser.add_argument("--path", default=str(DUR_JSON_PATH), help="bench: dur_list.json 경로")
+    parser.add_argument("--copies", type=int, default=10, help="bench: DUR 행 복제 횟수 (테이블 크기)")
+    parser.add_argument("--queries", type=int, default=50, help="bench: 검색어 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.command == "print":
+        print(migrations_sql())
+        return
+
+    conn = connect(args.url)
+    try:
+        if args.command == "apply":
+            applied = apply_migrations(conn)
+            print(f"Applied {len(applied)} migrations: {', '.join(applied) or '(none)'}")
+        elif args.command == "verify":
+            checks = verify_schema(conn)
+            for name, ok, detail in checks:
+                print(f"  {'OK  ' if ok else 'FAIL'} {name}: {detail}")
+            if not all(ok for _, ok, _ in checks):
+                sys.exit(1)
+        else:
+            bench(conn, args.path, args.copies, args.queries, args.seed)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
-"""dur_list.json 데이터를 Supabase 'dur' 테이블로 업로드합니다."""
+"""dur_list.json 데이터를 데이터 백엔드(DATA_BACKEND, 기본 Supabase)의 'dur' 테이블로 업로드합니다."""
 
+import argparse
 import json
 import os
 import sys
@@ -9,7 +10,20 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
-from supabase import create_client
+
+from src.chain.retriever import invalidate_retrieval_cache
+from src.config import DATA_BACKEND
+from src.data.incremental_sync import (
+    compute_delta,
+    format_delta,
+    load_sync_state,
+    record_fingerprint,
+    save_sync_state,
+)
+from src.repository.factory import get_repository
+from src.repository.migrations import migrations_sql
+from src.utils.supabase_client import get_supabase_client
+from src.vectorstore.ingest import refresh_dur_summaries
 
 # .env 파일 로드
 load_dotenv()
@@ -19,38 +33,31 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 DUR_JSON_PATH = Path(__file__).parent.parent / "data" / "raw" / "dur_list.json"
 TABLE_NAME = "dur"
 BATCH_SIZE = 500  # 한 번에 업로드할 레코드 수
-
-# 테이블 생성 SQL
-CREATE_TABLE_SQL = """
-CREATE TABLE IF NOT EXISTS dur (
-    id BIGINT PRIMARY KEY,
-    "TYPE_NAME" TEXT,
-    "MIX_TYPE" TEXT,
-    "INGR_CODE" TEXT,
-    "INGR_ENG_NAME" TEXT,
-    "INGR_KOR_NAME" TEXT,
-    "MIX" TEXT,
-    "ORI" TEXT,
-    "CLASS" TEXT,
-    "MIXTURE_MIX_TYPE" TEXT,
-    "MIXTURE_INGR_CODE" TEXT,
-    "MIXTURE_INGR_ENG_NAME" TEXT,
-    "MIXTURE_INGR_KOR_NAME" TEXT,
-    "MIXTURE_MIX" TEXT,
-    "MIXTURE_ORI" TEXT,
-    "MIXTURE_CLASS" TEXT,
-    "NOTIFICATION_DATE" TIMESTAMPTZ,
-    "PROHBT_CONTENT" TEXT,
-    "REMARK" TEXT,
-    "DEL_YN" BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMPTZ DEFAULT NOW()
-);
-
--- 검색 성능을 위한 인덱스
-CREATE INDEX IF NOT EXISTS idx_dur_ingr_kor_name ON dur ("INGR_KOR_NAME");
-CREATE INDEX IF NOT EXISTS idx_dur_mixture_ingr_kor_name ON dur ("MIXTURE_INGR_KOR_NAME");
-CREATE INDEX IF NOT EXISTS idx_dur_del_yn ON dur ("DEL_YN");
-"""
+# 증분 동기화 상태 파일 (레코드 id → 지문)
+SYNC_STATE_PATH = Path(__file__).parent.parent / "data" / "raw" / "dur_sync_state.json"
+
+# 지문 계산에 사용하는 컬럼 (dur 테이블 데이터 컬럼)
+DUR_COLUMNS = [
+    "TYPE_NAME",
+    "MIX_TYPE",
+    "INGR_CODE",
+    "INGR_ENG_NAME",
+    "INGR_KOR_NAME",
+    "MIX",
+    "ORI",
+    "CLASS",
+    "MIXTURE_MIX_TYPE",
+    "MIXTURE_INGR_CODE",
+    "MIXTURE_INGR_ENG_NAME",
+    "MIXTURE_INGR_KOR_NAME",
+    "MIXTURE_MIX",
+    "MIXTURE_ORI",
+    "MIXTURE_CLASS",
+    "NOTIFICATION_DATE",
+    "PROHBT_CONTENT",
+    "REMARK",
+    "DEL_YN",
+]
 
 
 def create_table_if_not_exists(client) -> None:
@@ -70,9 +77,10 @@ def create_table_if_not_exists(client) -> None:
             print("\n" + "=" * 50)
             print("ERROR: 'dur' table does not exist!")
             print("=" * 50)
-            print("\nPlease run this SQL in Supabase SQL Editor:")
+            print("\nRun `python scripts/migrate_supabase.py apply` (DATABASE_URL),")
+            print("or run this SQL in Supabase SQL Editor:")
             print("-" * 50)
-            print(CREATE_TABLE_SQL)
+            print(migrations_sql())
             print("-" * 50)
             print("\nAfter creating the table, run this script again.")
             sys.exit(1)
@@ -89,43 +97,83 @@ def load_dur_data() -> list[dict]:
     return data
 
 
-def upload_to_supabase(data: list[dict]) -> None:
-    """데이터를 Supabase dur 테이블에 업로드합니다."""
-    if not SUPABASE_URL or not SUPABASE_KEY:
+def _check_credentials() -> None:
+    if DATA_BACKEND == "supabase" and (not SUPABASE_URL or not SUPABASE_KEY):
         raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in .env")
 
-    client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-    # 배치 단위로 업로드
-    total = len(data)
-    uploaded = 0
-
-    for i in range(0, total, BATCH_SIZE):
-        batch = data[i : i + BATCH_SIZE]
-        try:
-            # upsert로 중복 시 업데이트
-            result = client.table(TABLE_NAME).upsert(batch).execute()
-            uploaded += len(batch)
-            print(f"Uploaded {uploaded}/{total} records...")
-        except Exception as e:
-            print(f"Error uploading batch {i//BATCH_SIZE + 1}: {e}")
-            raise
 
-    print(f"Successfully uploaded {uploaded} records to '{TABLE_NAME}' table")
+def upload_to_supabase(data: list[dict]) -> None:
+    """데이터를 데이터 백엔드 dur 테이블에 업로드합니다."""
+    _check_credentials()
+
+    # 배치 단위로 upsert (중복 시 업데이트)
+    uploaded = get_repository().upsert_rows(TABLE_NAME, data, BATCH_SIZE)
+
+    print(f"Successfully uploaded {uploaded} records to '{TABLE_NAME}' table ({DATA_BACKEND})")
+
+    # 다음 증분 동기화의 비교 기준 저장
+    save_sync_state(
+        str(SYNC_STATE_PATH),
+        {_record_key(record): record_fingerprint(record, DUR_COLUMNS) for record in data},
+    )
+
+    # dur 갱신 후 검색 캐시 무효화, 약품별 DUR 요약(drugs.dur_summary / dur_context) 재생성
+    invalidate_retrieval_cache(TABLE_NAME)
+    refresh_dur_summaries(data)
+
+
+def _record_key(record: dict) -> str:
+    return str(record["id"])
+
+
+def sync_to_supabase(data: list[dict]) -> dict:
+    """이전 동기화 상태와 비교해 신규/변경 레코드만 upsert하고, 사라진 레코드는 DEL_YN으로 소프트 삭제합니다."""
+    _check_credentials()
+
+    previous = load_sync_state(str(SYNC_STATE_PATH))
+    if not previous:
+        print(f"No sync state at {SYNC_STATE_PATH}: every record is treated as new")
+    delta = compute_delta(data, _record_key, DUR_COLUMNS, previous)
+    print(f"Delta: {format_delta(delta)}")
+
+    repository = get_repository()
+
+    upserts = delta["new"] + delta["changed"]
+    if upserts:
+        repository.upsert_rows(TABLE_NAME, upserts, BATCH_SIZE)
+
+    deleted = delta["deleted"]
+    if deleted:
+        print(f"Soft-deleted {repository.soft_delete(TABLE_NAME, deleted)} records")
+
+    # 업로드가 모두 끝난 뒤에만 상태 갱신 (중간 실패 시 다음 실행에서 다시 반영)
+    save_sync_state(str(SYNC_STATE_PATH), delta["fingerprints"])
+
+    if upserts or deleted:
+        invalidate_retrieval_cache(TABLE_NAME)
+        # data는 삭제분이 빠진 현재 DUR 전체이므로 그대로 요약을 다시 계산
+        refresh_dur_summaries(data)
+    return delta
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Upload dur_list.json to the Supabase 'dur' table")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="upsert only new/changed records and soft-delete removed ones (compares against dur_sync_state.json)",
+    )
+    args = parser.parse_args()
+
     print("=" * 50)
-    print("DUR Data Upload to Supabase")
+    print(f"DUR Data Upload ({DATA_BACKEND})")
     print("=" * 50)
 
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in .env")
-
-    client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    _check_credentials()
 
-    # 테이블 존재 여부 확인
-    create_table_if_not_exists(client)
+    # 테이블 존재 여부 확인 (SQLite/메모리 백엔드는 리포지토리가 스키마를 생성)
+    if DATA_BACKEND == "supabase":
+        create_table_if_not_exists(get_supabase_client())
 
     # 데이터 로드
     data = load_dur_data()
@@ -135,7 +183,10 @@ def main():
         return
 
     # 업로드
-    upload_to_supabase(data)
+    if args.incremental:
+        sync_to_supabase(data)
+    else:
+        upload_to_supabase(data)
 
     print("=" * 50)
     print("Upload complete!")
@@ -0,0 +1,123 @@
+"""효능(efcy_qesitm) BM25 랭킹 색인.
+
+적재 파이프라인에서 rank-bm25로 idf/문서 길이를 계산한 뒤,
+용어별 (문서 번호, 가중치) posting 배열로 변환해 파일로 저장합니다.
+검색 시에는 numpy 배열 덧셈만으로 전체 문서 점수를 계산합니다.
+"""
+
+import pickle
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+from src.chain.local_index import normalize_text
+from src.config import NGRAM_SIZE
+
+
+def tokenize(text, n: int = NGRAM_SIZE) -> list[str]:
+    """공백 단위 어절을 문자 n-gram으로 분해합니다. (n보다 짧은 어절은 그대로 사용)"""
+    tokens = []
+    for word in normalize_text(text).split():
+        if len(word) < n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i : i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+class BM25Index:
+    """용어별 posting(문서 번호, BM25 가중치)을 CSR 형태로 보관하는 색인."""
+
+    def __init__(self, item_seqs: list[str], vocab: dict[str, int],
+                 indptr: np.ndarray, doc_ids: np.ndarray, weights: np.ndarray):
+        self.item_seqs = item_seqs
+        self.vocab = vocab
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return len(self.item_seqs)
+
+    @classmethod
+    def build(cls, rows: list[dict], column: str = "efcy_qesitm") -> "BM25Index":
+        """drugs 행 목록으로 BM25 색인을 생성합니다."""
+        docs = [(str(row["item_seq"]), tokenize(row.get(column))) for row in rows]
+        docs = [(seq, tokens) for seq, tokens in docs if tokens]
+        if not docs:
+            return cls([], {}, np.zeros(1, dtype=np.int64),
+                       np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))
+
+        bm25 = BM25Okapi([tokens for _, tokens in docs])
+        k1, b, avgdl = bm25.k1, bm25.b, bm25.avgdl
+
+        postings = {}
+        for doc_idx, freqs in enumerate(bm25.doc_freqs):
+            norm = k1 * (1 - b + b * bm25.doc_len[doc_idx] / avgdl)
+            for term, tf in freqs.items():
+                weight = bm25.idf[term] * tf * (k1 + 1) / (tf + norm)
+                postings.setdefault(term, []).append((doc_idx, weight))
+
+        vocab = {}
+        indptr = [0]
+        doc_ids = []
+        weights = []
+        for term, entries in postings.items():
+            vocab[term] = len(vocab)
+            doc_ids.extend(doc_idx for doc_idx, _ in entries)
+            weights.extend(weight for _, weight in entries)
+            indptr.append(len(doc_ids))
+
+        return cls(
+            [seq for seq, _ in docs],
+            vocab,
+            np.asarray(indptr, dtype=np.int64),
+            np.asarray(doc_ids, dtype=np.int32),
+            np.asarray(weights, dtype=np.float32),
+        )
+
+    def scores(self, query: str) -> np.ndarray:
+        """query에 대한 전체 문서의 BM25 점수 배열을 반환합니다."""
+        scores = np.zeros(len(self.item_seqs), dtype=np.float32)
+        for token in tokenize(query):
+            term_id = self.vocab.get(token)
+            if term_id is None:
+                continue
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            # 한 posting 안의 문서 번호는 중복되지 않으므로 fancy indexing 덧셈으로 충분
+            scores[self.doc_ids[start:end]] += self.weights[start:end]
+        return scores
+
+    def top_k(self, query: str, k: int) -> list[tuple[str, float]]:
+        """점수가 0보다 큰 상위 k개 문서의 (item_seq, 점수)를 반환합니다."""
+        scores = self.scores(query)
+        matched = np.flatnonzero(scores > 0)
+        if matched.size == 0:
+            return []
+        if matched.size > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        # 점수 내림차순, 동점이면 문서 순서(item_seq 순)로 정렬
+        order = matched[np.lexsort((matched, -scores[matched]))]
+        return [(self.item_seqs[i], float(scores[i])) for i in order]
+
+    def save(self, path: str) -> None:
+        """색인을 파일로 저장합니다."""
+        with open(path, "wb") as f:
+            pickle.dump(
+                {
+                    "item_seqs": self.item_seqs,
+                    "vocab": self.vocab,
+                    "indptr": self.indptr,
+                    "doc_ids": self.doc_ids,
+                    "weights": self.weights,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """save()로 저장한 색인을 불러옵니다."""
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        return cls(**data)
@@ -0,0 +1,109 @@
+"""검색 결과 캐시 (LRU + TTL + 음성 캐싱).
+
+키는 (테이블, 검색 종류, 정규화된 키워드) 튜플입니다.
+결과가 없는 키워드도 짧은 TTL로 캐싱해 같은 빈 검색이 반복되지 않게 합니다.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+def normalize_cache_keyword(keyword: str) -> str:
+    """캐시 키용 키워드 정규화: 앞뒤 공백 제거, 연속 공백 축약, 소문자."""
+    return re.sub(r"\s+", " ", keyword or "").strip().lower()
+
+
+class RetrievalCache:
+    """스레드 안전한 LRU + TTL 캐시. 빈 결과는 negative_ttl로 저장합니다."""
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # invalidate()마다 증가합니다. 계산 중에 무효화되면 그 결과를 저장하지 않는 데 씁니다.
+        self._generation = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """(캐시 적중 여부, 값)을 반환합니다. 만료된 항목은 제거합니다."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            if not value:
+                self.negative_hits += 1
+            return True, value
+
+    @property
+    def generation(self) -> int:
+        """현재 무효화 세대 번호를 반환합니다. 계산 시작 전에 읽어 set()에 넘깁니다."""
+        with self._lock:
+            return self._generation
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> bool:
+        """값을 저장합니다. 빈 결과는 negative_ttl, 그 외는 ttl 동안 유지됩니다.
+
+        generation을 주면 그 사이 invalidate()가 호출된 경우 저장하지 않고 False를 반환합니다.
+        """
+        ttl = self.ttl if value else self.negative_ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+            return True
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """캐시에 있으면 반환하고, 없으면 compute() 결과를 저장 후 반환합니다.
+
+        계산 도중 invalidate()가 호출되면 결과는 반환만 하고 캐시에는 저장하지 않습니다.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+        generation = self.generation
+        value = compute()
+        self.set(key, value, generation)
+        return value
+
+    def invalidate(self, table: str | None = None) -> int:
+        """table로 시작하는 키(없으면 전체)를 삭제하고 삭제 건수를 반환합니다."""
+        with self._lock:
+            self._generation += 1
+            if table is None:
+                count = len(self._data)
+                self._data.clear()
+                return count
+            keys = [key for key in self._data if isinstance(key, tuple) and key[0] == table]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def stats(self) -> dict:
+        """캐시 크기와 적중/미스 카운터를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,131 @@
+"""토큰 예산 기반 답변 프롬프트 컨텍스트 패커.
+
+검색된 약품 필드를 우선순위(검색 컬럼 → 효능/주의사항 → 나머지) 순으로
+토큰 예산 안에서 채우고, 예산을 넘어 제외된 필드와 토큰 수를 기록합니다.
+"""
+
+import functools
+
+from src.chain.retriever import CATEGORY_COLUMN_MAP
+from src.config import LLM_MODEL, TOKEN_COUNT_CACHE_SIZE
+from src.data.preprocessor import DRUG_CONTEXT_LABELS, render_drug_context
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken이 없으면 문자 수 기반 근사치 사용
+    tiktoken = None
+
+# 모든 약품에 먼저 배정할 식별 필드
+IDENTITY_FIELDS = ("item_name", "main_item_ingr")
+# 검색 컬럼 다음으로 배정할 필드
+PRIORITY_FIELDS = ("efcy_qesitm", "atpn_warn_qesitm", "atpn_qesitm")
+
+EMPTY_CONTEXT = "(검색 결과 없음)"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """LLM_MODEL의 tiktoken 인코딩을 반환합니다. (사용할 수 없으면 None)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(LLM_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # 인코딩 파일을 내려받을 수 없는 환경(오프라인 등)
+        return None
+
+
+@functools.lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)
+def count_tokens(text: str) -> int:
+    """text의 토큰 수를 계산합니다. 같은 필드 텍스트는 캐시된 값을 사용합니다."""
+    encoding = _get_encoding()
+    if encoding is None:
+        # 한국어는 대략 1자 ≈ 1토큰 이하이므로 문자 수를 보수적 상한으로 사용
+        return len(text)
+    return len(encoding.encode(text))
+
+
+def _field_tiers(category: str) -> list[list[str]]:
+    """category에 따른 필드 배정 우선순위 목록을 반환합니다."""
+    first = list(IDENTITY_FIELDS)
+    matched = CATEGORY_COLUMN_MAP.get(category)
+    if matched and matched not in first:
+        first.append(matched)
+    second = [key for key in PRIORITY_FIELDS if key not in first]
+    rest = [key for key in DRUG_CONTEXT_LABELS if key not in first and key not in second]
+    return [first, second, rest]
+
+
+def pack_context(rows: list[dict], category: str, budget: int) -> tuple[str, dict]:
+    """검색 결과를 토큰 예산 안에서 우선순위대로 채운 컨텍스트와 통계를 반환합니다."""
+    stats = {"budget": budget, "used_tokens": 0, "dropped_fields": 0, "dropped_tokens": 0}
+    if not rows:
+        return EMPTY_CONTEXT, stats
+
+    headers = [f"── 검색 결과 {i} ──" for i in range(1, len(rows) + 1)]
+    fields = [row.get("context_fields") or render_drug_context(row)[0] for row in rows]
+    chosen = [set() for _ in rows]
+    used = sum(count_tokens(header) for header in headers)
+
+    # 우선순위 단계별로 모든 약품을 순회하며 채움 (한 약품이 예산을 독점하지 않도록)
+    for tier in _field_tiers(category):
+        for i, row_fields in enumerate(fields):
+            for key in tier:
+                block = row_fields.get(key)
+                if not block:
+                    continue
+                cost = count_tokens(block)
+                if used + cost <= budget:
+                    chosen[i].add(key)
+                    used += cost
+                else:
+                    stats["dropped_fields"] += 1
+                    stats["dropped_tokens"] += cost
+
+    parts = []
+    for header, row_fields, keys in zip(headers, fields, chosen):
+        # jsonb는 키 순서를 보존하지 않으므로 라벨 정의 순서대로 출력
+        lines = [row_fields[key] for key in DRUG_CONTEXT_LABELS if key in keys]
+        parts.append("\n".join([header, *lines]))
+
+    stats["used_tokens"] = used
+    return "\n\n".join(parts), stats
+
+
+def _omitted_note(count: int) -> str:
+    return f"(토큰 예산 초과로 병용금지 정보 {count}개 항목을 생략했습니다 — 생략된 항목은 확인하지 못한 것으로 안내하세요)"
+
+
+def pack_blocks(blocks: list[str], budget: int, pinned: list[str] | None = None) -> tuple[str, dict]:
+    """빈 줄로 구분되는 블록(성분별 병용금지 헤더 + 항목 등)을 통째로 예산 안에서 채웁니다.
+
+    블록을 줄 단위로 자르면 뒤 성분의 항목이 앞 성분 헤더 아래에 남을 수 있으므로,
+    블록은 나누지 않고 순서대로 담다가 처음으로 넘치는 블록에서 멈춥니다.
+    pinned 블록(상호 병용금지 경고 등)은 예산과 관계없이 맨 앞에 항상 담습니다.
+    생략한 블록이 있으면 그 수를 알리는 안내 문장을 덧붙입니다. (안내 문장 토큰은 예산에서 미리 확보)
+    """
+    pinned = [block.strip() for block in pinned or [] if block and block.strip()]
+    blocks = [block.strip() for block in blocks if block and block.strip()]
+    pinned_cost = sum(count_tokens(block) for block in pinned)
+    costs = [count_tokens(block) for block in blocks]
+    stats = {"budget": budget, "used_tokens": 0, "dropped_blocks": 0, "dropped_tokens": 0}
+    if pinned_cost + sum(costs) <= budget:
+        stats["used_tokens"] = pinned_cost + sum(costs)
+        return "\n\n".join([*pinned, *blocks]), stats
+
+    available = budget - count_tokens(_omitted_note(len(blocks)))
+    kept = []
+    used = pinned_cost
+    for block, cost in zip(blocks, costs):
+        if used + cost > available:
+            break
+        kept.append(block)
+        used += cost
+    dropped = len(blocks) - len(kept)
+    note = _omitted_note(dropped)
+    stats["used_tokens"] = used + count_tokens(note)
+    stats["dropped_blocks"] = dropped
+    stats["dropped_tokens"] = sum(costs[len(kept):])
+    return "\n\n".join([*pinned, *kept, note]), stats
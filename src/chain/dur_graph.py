@@ -0,0 +1,128 @@
+"""DUR 병용금지 인메모리 그래프.
+
+dur 테이블(DEL_YN = FALSE)을 한 번만 읽어 정규화된 성분명을 노드로,
+병용금지 관계를 간선으로 하는 대칭 인접 맵을 만듭니다.
+성분별 DUR 조회와 성분 간 상호 병용금지 체크를 네트워크 왕복 없이 처리합니다.
+"""
+
+from src.data.preprocessor import normalize_ingredient_key, normalize_ingredient_name
+
+# search_dur_by_ingredient가 성분당 반환하는 최대 행 수
+DUR_ROWS_PER_INGREDIENT = 20
+
+
+def get_dur_field(row: dict, field: str) -> str:
+    """DUR 데이터에서 필드 값을 대소문자 구분 없이 가져옵니다."""
+    return row.get(field) or row.get(field.lower(), "")
+
+
+def to_mutual_warning(row: dict) -> dict:
+    """DUR 행을 상호 병용금지 경고 dict로 변환합니다."""
+    return {
+        "drug1": get_dur_field(row, "INGR_KOR_NAME"),
+        "drug2": get_dur_field(row, "MIXTURE_INGR_KOR_NAME"),
+        "reason": get_dur_field(row, "PROHBT_CONTENT"),
+    }
+
+
+def is_deleted_row(row: dict) -> bool:
+    """DEL_YN 값(bool, "Y"/"N", "true" 등)이 삭제 표시인지 확인합니다."""
+    value = row.get("DEL_YN", row.get("del_yn", False))
+    return value is True or str(value).lower() in ("true", "t", "y", "1")
+
+
+class DurGraph:
+    """정규화 성분명 → 병용금지 성분명 대칭 인접 맵. 간선마다 금지 사유(원본 행)를 보관합니다."""
+
+    def __init__(self, rows: list[dict]):
+        # 성분(INGR_KOR_NAME) 기준 원본 행 목록 (search_dur_by_ingredient 결과와 동일한 dict)
+        self.rows_by_ingredient: dict[str, list[dict]] = {}
+        # 성분코드(INGR_CODE) 기준 원본 행 목록 (크로스워크 정확 일치 조회용)
+        self.rows_by_code: dict[str, list[dict]] = {}
+        # edges[a][b] = a-b 사이 병용금지 행 목록 (양방향 모두 같은 목록 공유)
+        self.edges: dict[str, dict[str, list[dict]]] = {}
+
+        for row in rows:
+            if is_deleted_row(row):
+                continue
+            src = normalize_ingredient_key(get_dur_field(row, "INGR_KOR_NAME"))
+            dst = normalize_ingredient_key(get_dur_field(row, "MIXTURE_INGR_KOR_NAME"))
+            if not src:
+                continue
+            self.rows_by_ingredient.setdefault(src, []).append(row)
+            code = get_dur_field(row, "INGR_CODE")
+            if code:
+                self.rows_by_code.setdefault(code, []).append(row)
+            if not dst:
+                continue
+            edge = self.edges.setdefault(src, {}).get(dst)
+            if edge is None:
+                edge = []
+                self.edges[src][dst] = edge
+                self.edges.setdefault(dst, {})[src] = edge
+            edge.append(row)
+
+        self._keys = list(self.rows_by_ingredient)
+        self._node_keys = list(self.edges)
+        self._resolve_cache: dict[tuple[str, bool], list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._node_keys)
+
+    def _resolve(self, name: str, nodes: bool) -> list[str]:
+        """name을 부분 문자열로 포함하는 성분 키 목록을 반환합니다. (ILIKE '%name%'와 동일)
+
+        원본 이름으로 찾지 못하면 염/수화물 접미사를 제거한 이름으로 다시 찾습니다.
+        """
+        cache_key = (name, nodes)
+        cached = self._resolve_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        keys = self._node_keys if nodes else self._keys
+        query = normalize_ingredient_key(name)
+        matched = [key for key in keys if query in key] if query else []
+        if not matched:
+            normalized = normalize_ingredient_key(normalize_ingredient_name(name))
+            if normalized and normalized != query:
+                matched = [key for key in keys if normalized in key]
+
+        self._resolve_cache[cache_key] = matched
+        return matched
+
+    def resolve_nodes(self, ingredient_name: str) -> list[str]:
+        """성분명에 해당하는 병용금지 그래프 노드 키 목록을 반환합니다."""
+        return self._resolve(ingredient_name, nodes=True)
+
+    def lookup(self, ingredient_name: str, limit: int = DUR_ROWS_PER_INGREDIENT) -> list[dict]:
+        """성분명의 DUR 병용금지 행을 반환합니다."""
+        results = []
+        for key in self._resolve(ingredient_name, nodes=False):
+            results.extend(self.rows_by_ingredient[key])
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+    def lookup_codes(self, codes: list[str], limit: int | None = None) -> list[dict]:
+        """성분코드 목록의 DUR 병용금지 행을 반환합니다."""
+        results = [row for code in dict.fromkeys(codes) for row in self.rows_by_code.get(code, ())]
+        if len(codes) > 1:
+            # 여러 코드의 행은 Supabase 조회(order id)와 같은 순서로 정렬
+            results.sort(key=lambda row: row.get("id") or 0)
+        return results[:limit]
+
+    def mutual(self, ingredients: list[str]) -> list[dict]:
+        """성분 목록 안에서 서로 병용금지인 쌍의 경고 목록을 반환합니다."""
+        resolved = [self.resolve_nodes(ingr) for ingr in ingredients]
+        warnings = []
+        seen = set()
+        for i, keys1 in enumerate(resolved):
+            for keys2 in resolved[i + 1 :]:
+                for key1 in keys1:
+                    neighbors = self.edges[key1]
+                    for key2 in keys2:
+                        for row in neighbors.get(key2, ()):
+                            if id(row) not in seen:
+                                seen.add(id(row))
+                                warnings.append(to_mutual_warning(row))
+        return warnings
@@ -0,0 +1,85 @@
+"""DUR 병용금지 충돌 행렬 (NumPy 불리언 인접 행렬).
+
+각 성분 키에 0..N-1 밀집 인덱스를 부여하고 병용금지 관계를 N×N 불리언 행렬로 저장합니다.
+처방 성분 목록의 모든 충돌은 np.ix_ 부분 행렬 한 번과 상삼각 argwhere로 찾습니다.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from src.chain.dur_graph import DurGraph, get_dur_field, is_deleted_row, to_mutual_warning
+
+
+class DurConflictMatrix:
+    """성분 키 → 밀집 인덱스, 병용금지 여부 불리언 행렬, 인덱스 쌍별 원본 행을 보관합니다."""
+
+    def __init__(self, pairs: Iterable[tuple[str, str, dict]]):
+        self.index: dict[str, int] = {}
+        # (i, j) (i <= j) → 병용금지 원본 행 목록
+        self.pair_rows: dict[tuple[int, int], list[dict]] = {}
+        for key1, key2, row in pairs:
+            i = self.index.setdefault(key1, len(self.index))
+            j = self.index.setdefault(key2, len(self.index))
+            self.pair_rows.setdefault((min(i, j), max(i, j)), []).append(row)
+
+        n = len(self.index)
+        self.matrix = np.zeros((n, n), dtype=bool)
+        if self.pair_rows:
+            rows, cols = np.array(list(self.pair_rows), dtype=np.intp).T
+            self.matrix[rows, cols] = True
+            self.matrix[cols, rows] = True
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @classmethod
+    def from_graph(cls, graph: DurGraph) -> "DurConflictMatrix":
+        """DurGraph의 정규화 성분명 노드/간선으로 행렬을 만듭니다."""
+        return cls(
+            (key1, key2, row)
+            for key1, neighbors in graph.edges.items()
+            for key2, rows in neighbors.items()
+            if key1 <= key2
+            for row in rows
+        )
+
+    @classmethod
+    def from_codes(cls, rows: list[dict]) -> "DurConflictMatrix":
+        """DUR 행의 INGR_CODE ↔ MIXTURE_INGR_CODE로 행렬을 만듭니다. (크로스워크 코드 조회용)"""
+        return cls(
+            (get_dur_field(row, "INGR_CODE"), get_dur_field(row, "MIXTURE_INGR_CODE"), row)
+            for row in rows
+            if not is_deleted_row(row)
+            and get_dur_field(row, "INGR_CODE")
+            and get_dur_field(row, "MIXTURE_INGR_CODE")
+        )
+
+    def conflicts(self, groups: list[list[str]]) -> list[dict]:
+        """성분별 키 목록(groups) 중 서로 다른 성분에 속한 키 쌍의 병용금지 경고를 반환합니다."""
+        flat = []
+        owner = []
+        for position, keys in enumerate(groups):
+            for key in keys:
+                idx = self.index.get(key)
+                if idx is not None:
+                    flat.append(idx)
+                    owner.append(position)
+        if len(flat) < 2:
+            return []
+
+        flat = np.array(flat, dtype=np.intp)
+        owner = np.array(owner, dtype=np.intp)
+        # 처방 성분 부분 행렬에서 같은 성분끼리의 칸을 제외하고 상삼각만 사용
+        hits = self.matrix[np.ix_(flat, flat)] & (owner[:, None] != owner[None, :])
+        pairs = np.argwhere(np.triu(hits, 1))
+
+        warnings = []
+        seen = set()
+        for a, b in pairs:
+            i, j = flat[a], flat[b]
+            for row in self.pair_rows[(min(i, j), max(i, j))]:
+                if id(row) not in seen:
+                    seen.add(id(row))
+                    warnings.append(to_mutual_warning(row))
+        return warnings
@@ -0,0 +1,97 @@
+"""상호 병용금지 쌍 조회 SQL (Supabase RPC + 로컬 SQLite 대체 구현).
+
+성분 목록 안의 모든 순서쌍(i ≠ j)에 대해
+INGR_KOR_NAME ILIKE '%성분i%' AND MIXTURE_INGR_KOR_NAME ILIKE '%성분j%' 인 행을
+한 번의 쿼리로 찾습니다. 두 구현은 같은 결과(행 id 기준 중복 제거, id 순)를 반환합니다.
+"""
+
+import json
+import sqlite3
+
+from src.chain.dur_graph import get_dur_field, is_deleted_row
+
+MUTUAL_CONTRAINDICATIONS_RPC = "find_mutual_contraindications"
+
+# Supabase SQL Editor에서 1회 실행
+# 성분명 안의 \, %, _ 는 이스케이프해 와일드카드가 아닌 문자 그대로 일치시킵니다 (SQLite instr와 동일).
+MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION find_mutual_contraindications(ingredients TEXT[])
+RETURNS TABLE (id BIGINT, drug1 TEXT, drug2 TEXT, reason TEXT)
+LANGUAGE sql STABLE
+AS $$
+    WITH terms AS (
+        SELECT t.i, replace(replace(replace(t.name, '\', '\\'), '%', '\%'), '_', '\_') AS pattern
+        FROM unnest(ingredients) WITH ORDINALITY AS t(name, i)
+    )
+    SELECT DISTINCT d.id, d."INGR_KOR_NAME", d."MIXTURE_INGR_KOR_NAME", d."PROHBT_CONTENT"
+    FROM terms AS a
+    JOIN terms AS b ON a.i <> b.i
+    JOIN dur AS d
+      ON d."INGR_KOR_NAME" ILIKE '%' || a.pattern || '%' ESCAPE '\'
+     AND d."MIXTURE_INGR_KOR_NAME" ILIKE '%' || b.pattern || '%' ESCAPE '\'
+    WHERE d."DEL_YN" = FALSE
+    ORDER BY d.id;
+$$;
+"""
+
+# SQLite 대체 구현 (json_each로 unnest, instr(lower())로 ILIKE 부분 일치)
+SQLITE_DUR_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS dur (
+    id INTEGER PRIMARY KEY,
+    INGR_KOR_NAME TEXT,
+    MIXTURE_INGR_KOR_NAME TEXT,
+    PROHBT_CONTENT TEXT,
+    DEL_YN INTEGER DEFAULT 0
+);
+"""
+
+SQLITE_MUTUAL_CONTRAINDICATIONS_SQL = """
+SELECT DISTINCT d.id, d.INGR_KOR_NAME, d.MIXTURE_INGR_KOR_NAME, d.PROHBT_CONTENT
+FROM json_each(:ingredients) AS a
+JOIN json_each(:ingredients) AS b ON a.key <> b.key
+JOIN dur AS d
+  ON instr(lower(d.INGR_KOR_NAME), lower(a.value)) > 0
+ AND instr(lower(d.MIXTURE_INGR_KOR_NAME), lower(b.value)) > 0
+WHERE d.DEL_YN = 0
+ORDER BY d.id
+"""
+
+
+def to_rpc_warning(row: dict) -> dict:
+    """RPC 결과 행을 상호 병용금지 경고 dict로 변환합니다."""
+    return {"drug1": row.get("drug1") or "", "drug2": row.get("drug2") or "", "reason": row.get("reason") or ""}
+
+
+def load_dur_sqlite(rows: list[dict], path: str = ":memory:") -> sqlite3.Connection:
+    """DUR 행을 SQLite dur 테이블에 적재한 연결을 반환합니다."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SQLITE_DUR_TABLE_SQL)
+    conn.executemany(
+        "INSERT OR REPLACE INTO dur VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                row.get("id", i),
+                get_dur_field(row, "INGR_KOR_NAME"),
+                get_dur_field(row, "MIXTURE_INGR_KOR_NAME"),
+                get_dur_field(row, "PROHBT_CONTENT"),
+                int(is_deleted_row(row)),
+            )
+            for i, row in enumerate(rows, start=1)
+        ),
+    )
+    conn.commit()
+    return conn
+
+
+def find_mutual_contraindications_sqlite(conn: sqlite3.Connection, ingredients: list[str]) -> list[dict]:
+    """SQLite에서 성분 목록 안의 상호 병용금지 경고 목록을 반환합니다."""
+    if len(ingredients) < 2:
+        return []
+    cursor = conn.execute(
+        SQLITE_MUTUAL_CONTRAINDICATIONS_SQL,
+        {"ingredients": json.dumps(ingredients, ensure_ascii=False)},
+    )
+    return [
+        to_rpc_warning({"drug1": drug1, "drug2": drug2, "reason": reason})
+        for _, drug1, drug2, reason in cursor
+    ]
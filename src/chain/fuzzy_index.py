@@ -0,0 +1,179 @@
+"""제품명 오타 교정 색인 (한글 자모 분해 + SymSpell 삭제 사전 + 초성 검색).
+
+"타이래놀", "개보린"처럼 철자가 틀린 제품명을 자모 단위 편집 거리로 교정합니다.
+삭제 사전(deletes)을 미리 만들어 두므로 조회 시에는 사전 조회와
+소수 후보에 대한 편집 거리 계산만 수행합니다.
+"""
+
+import re
+
+from src.config import FUZZY_MAX_EDIT_DISTANCE, FUZZY_PREFIX_LENGTH
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+             "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 제품명 뒤에 붙는 제형 접미사 (긴 것부터 처리)
+DOSAGE_FORM_SUFFIXES = [
+    "필름코팅정", "연질캡슐", "경질캡슐", "츄어블정", "서방정", "발포정", "현탁액", "내복액",
+    "캡슐", "시럽", "과립", "연고", "크림", "로션", "패취", "패치", "스프레이",
+    "정", "액", "겔", "산",
+]
+
+# 괄호 안 내용 및 숫자(함량) 이후 부분 제거용
+BRACKET_PATTERN = re.compile(r"[\(\[].*?[\)\]]")
+STRENGTH_PATTERN = re.compile(r"\d.*$")
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성·중성·종성 자모로 분해합니다. (한글 외 문자는 그대로 유지)
+
+    예: "타이" → "ㅌㅏㅇㅣ"
+    """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            chars.append(CHOSEONG[offset // 588])
+            chars.append(JUNGSEONG[(offset % 588) // 28])
+            chars.append(JONGSEONG[offset % 28])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def extract_choseong(text: str) -> str:
+    """한글 음절의 초성만 추출합니다. 예: "타이레놀" → "ㅌㅇㄹㄴ" """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        elif ch in CHOSEONG:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성만으로 이루어진 검색어인지 확인합니다. 예: "ㅌㅇㄹㄴ" """
+    return bool(text) and all(ch in CHOSEONG for ch in text)
+
+
+def base_product_name(item_name: str) -> str:
+    """제품명에서 괄호, 함량, 제형 접미사를 제거한 대표 이름을 반환합니다.
+
+    예: "타이레놀정500밀리그람(아세트아미노펜)" → "타이레놀"
+    """
+    name = BRACKET_PATTERN.sub("", item_name or "")
+    name = STRENGTH_PATTERN.sub("", name)
+    name = re.sub(r"\s+", "", name).lower()
+    for suffix in DOSAGE_FORM_SUFFIXES:
+        if name.endswith(suffix) and len(name) - len(suffix) >= 2:
+            return name[: -len(suffix)]
+    return name
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """word에서 최대 max_distance개 문자를 삭제한 변형 집합을 반환합니다."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """인접 전치를 포함한 편집 거리(OSA)를 계산합니다. max_distance 초과 시 max_distance + 1"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev_prev = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        curr = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            if (prev_prev is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                curr[j] = min(curr[j], prev_prev[j - 2] + 1)
+        if min(curr) > max_distance:
+            return max_distance + 1
+        prev_prev, prev = prev, curr
+    return prev[-1]
+
+
+class ProductNameIndex:
+    """대표 제품명 → item_seq 색인과 자모 삭제 사전, 초성 색인을 보관합니다."""
+
+    def __init__(self, rows: list[dict], max_distance: int = FUZZY_MAX_EDIT_DISTANCE,
+                 prefix_length: int = FUZZY_PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+
+        # 같은 대표 이름(함량/제형만 다른 제품)은 하나의 용어로 묶음
+        self.term_seqs: dict[str, list[str]] = {}
+        for row in rows:
+            term = base_product_name(row.get("item_name"))
+            if term:
+                self.term_seqs.setdefault(term, []).append(str(row.get("item_seq")))
+
+        self.terms = list(self.term_seqs)
+        self._jamo = [decompose_jamo(term) for term in self.terms]
+        self._deletes: dict[str, list[int]] = {}
+        self._choseong: dict[str, list[int]] = {}
+        for term_id, (term, jamo) in enumerate(zip(self.terms, self._jamo)):
+            for variant in _deletes(jamo[:prefix_length], max_distance):
+                self._deletes.setdefault(variant, []).append(term_id)
+            self._choseong.setdefault(extract_choseong(term), []).append(term_id)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _max_distance_for(self, jamo: str) -> int:
+        # 짧은 검색어에서 거리 2를 허용하면 엉뚱한 제품이 교정되므로 1로 제한
+        return min(self.max_distance, 1 if len(jamo) < 6 else 2)
+
+    def correct(self, keyword: str) -> list[str]:
+        """오타가 있는 제품명을 가장 가까운 대표 제품명 목록으로 교정합니다."""
+        query = re.sub(r"\s+", "", keyword or "").lower()
+        if is_choseong_query(query):
+            return [self.terms[i] for i in self._choseong.get(query, [])]
+        # "타이래놀정500"처럼 제형/함량이 붙은 검색어도 대표 이름으로 비교
+        query = base_product_name(query) or query
+        if not query:
+            return []
+
+        jamo = decompose_jamo(query)
+        max_distance = self._max_distance_for(jamo)
+        candidates = set()
+        for variant in _deletes(jamo[: self.prefix_length], max_distance):
+            candidates.update(self._deletes.get(variant, ()))
+
+        best = max_distance + 1
+        matched = []
+        for term_id in candidates:
+            distance = edit_distance(jamo, self._jamo[term_id], max_distance)
+            if distance < best:
+                best, matched = distance, [term_id]
+            elif distance == best:
+                matched.append(term_id)
+        if best > max_distance:
+            return []
+        return [self.terms[i] for i in sorted(matched, key=lambda i: self.terms[i])]
+
+    def lookup(self, keyword: str, limit: int) -> list[str]:
+        """교정된 제품명에 해당하는 item_seq를 최대 limit건 반환합니다."""
+        item_seqs = []
+        for term in self.correct(keyword):
+            for seq in self.term_seqs[term]:
+                if seq not in item_seqs:
+                    item_seqs.append(seq)
+                if len(item_seqs) >= limit:
+                    return item_seqs
+        return item_seqs
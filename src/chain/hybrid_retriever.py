@@ -0,0 +1,88 @@
+"""어휘 검색(drugs ILIKE/BM25) + 벡터 검색(match_documents) 하이브리드 리트리버.
+
+두 검색을 동시에 실행하고 item_seq 기준 Reciprocal Rank Fusion으로 병합합니다.
+전체 지연 시간은 두 검색 중 느린 쪽에 맞춰집니다.
+벡터 검색(임베딩/pgvector)이 실패하면 로그를 남기고 어휘 검색 순위만 사용합니다.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.chain.retriever import CATEGORY_COLUMN_MAP, fetch_rows_by_seq, search_drugs
+from src.config import HYBRID_RRF_K, HYBRID_VECTOR_K, SEARCH_LIMIT
+from src.vectorstore.supabase_store import PatchedSupabaseVectorStore, get_vector_store
+
+logger = logging.getLogger(__name__)
+
+_vector_store: PatchedSupabaseVectorStore | None = None
+_vector_store_lock = threading.Lock()
+
+# 어휘 검색 / 벡터 검색을 동시에 실행하기 위한 스레드 풀
+_hybrid_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hybrid-search")
+
+
+def _get_vector_store() -> PatchedSupabaseVectorStore:
+    """벡터 저장소를 최초 1회만 생성합니다."""
+    global _vector_store
+    if _vector_store is None:
+        with _vector_store_lock:
+            if _vector_store is None:
+                _vector_store = get_vector_store()
+    return _vector_store
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = HYBRID_RRF_K) -> list[str]:
+    """여러 순위 목록을 RRF 점수(Σ 1 / (k + rank))로 병합한 순위를 반환합니다."""
+    scores = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, 1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    # 동점이면 먼저 등장한 순서 유지 (sorted는 stable)
+    return sorted(scores, key=lambda key: -scores[key])
+
+
+def vector_search(query: str, k: int = HYBRID_VECTOR_K) -> list[str]:
+    """벡터 유사도 검색 결과의 item_seq 목록을 유사도 순으로 반환합니다."""
+    store = _get_vector_store()
+    embedding = store.embeddings.embed_query(query)
+    matches = store.similarity_search_by_vector_with_relevance_scores(embedding, k=k)
+
+    item_seqs = []
+    for doc, _similarity in matches:
+        seq = str(doc.metadata.get("item_seq") or "")
+        # 분할된 청크는 같은 item_seq를 가질 수 있으므로 중복 제거
+        if seq and seq not in item_seqs:
+            item_seqs.append(seq)
+    return item_seqs
+
+
+def hybrid_search(category: str, keyword: str, question: str | None = None) -> list[dict]:
+    """어휘 검색과 벡터 검색을 동시에 실행하고 RRF로 병합한 drugs 행을 반환합니다.
+
+    벡터 검색은 원 질문(question)을 사용하므로, 문자 그대로 일치하지 않는
+    일상어 질문도 관련 약품을 찾을 수 있습니다.
+    """
+    if category not in CATEGORY_COLUMN_MAP:
+        return []
+
+    lexical_future = _hybrid_executor.submit(search_drugs, category, keyword)
+    vector_future = _hybrid_executor.submit(vector_search, question or keyword)
+    lexical_rows = lexical_future.result()
+    try:
+        vector_seqs = vector_future.result()
+    except Exception:
+        # 벡터 검색 장애는 전체 검색 실패로 이어지지 않도록 어휘 검색 결과로 대체
+        logger.warning("벡터 검색 실패 — 어휘 검색 순위만 사용합니다.", exc_info=True)
+        vector_seqs = None
+
+    rows_by_seq = {str(row.get("item_seq")): row for row in lexical_rows}
+    rankings = [list(rows_by_seq)] if vector_seqs is None else [list(rows_by_seq), vector_seqs]
+    fused = reciprocal_rank_fusion(rankings)[:SEARCH_LIMIT]
+
+    # 벡터 검색에서만 나온 약품은 drugs 테이블에서 전체 행을 가져옴
+    missing = [seq for seq in fused if seq not in rows_by_seq]
+    for row in fetch_rows_by_seq(missing):
+        rows_by_seq[str(row.get("item_seq"))] = row
+
+    return [rows_by_seq[seq] for seq in fused if seq in rows_by_seq]
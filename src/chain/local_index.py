@@ -0,0 +1,96 @@
+"""drugs 테이블 인메모리 스냅샷 + 문자 n-gram 역색인.
+
+drugs 테이블(~5천 건)을 한 번만 읽어 메모리에 올려두고,
+검색 컬럼별 문자 n-gram 역색인으로 ILIKE '%keyword%'와 같은 결과를
+네트워크 왕복 없이 반환합니다.
+"""
+
+from array import array
+from collections import defaultdict
+
+from src.config import NGRAM_SIZE
+
+# n-gram 역색인을 만들 검색 컬럼
+SEARCH_COLUMNS = ("item_name", "main_item_ingr", "efcy_qesitm")
+
+
+def normalize_text(text) -> str:
+    """ILIKE와 같은 대소문자 무시 비교를 위해 소문자로 변환합니다."""
+    return str(text or "").lower()
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> set[str]:
+    """문자열의 문자 n-gram 집합을 반환합니다. (길이가 n 미만이면 빈 집합)"""
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class DrugSnapshot:
+    """drugs 행 목록을 보관하고 컬럼별 n-gram 역색인으로 부분 문자열 검색을 수행합니다."""
+
+    def __init__(self, rows: list[dict], columns: tuple[str, ...] = SEARCH_COLUMNS,
+                 n: int = NGRAM_SIZE):
+        self.rows = rows
+        self.n = n
+        self.by_seq = {str(row.get("item_seq")): row for row in rows}
+        self._texts = {
+            column: [normalize_text(row.get(column)) for row in rows]
+            for column in columns
+        }
+        self._postings = {
+            column: self._build_postings(texts) for column, texts in self._texts.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get_rows(self, item_seqs: list[str]) -> list[dict]:
+        """item_seq 목록 순서대로 행을 반환합니다. (스냅샷에 없는 item_seq는 건너뜀)"""
+        return [self.by_seq[seq] for seq in item_seqs if seq in self.by_seq]
+
+    def _build_postings(self, texts: list[str]) -> dict[str, array]:
+        """n-gram → 행 번호 배열(오름차순) 역색인을 만듭니다."""
+        postings = defaultdict(list)
+        for idx, text in enumerate(texts):
+            for gram in char_ngrams(text, self.n):
+                postings[gram].append(idx)
+        # list 대신 unsigned int 배열로 보관해 메모리를 줄임
+        return {gram: array("I", ids) for gram, ids in postings.items()}
+
+    def _candidates(self, column: str, keyword: str) -> list[int]:
+        """keyword의 모든 n-gram을 포함하는 행 번호 후보를 반환합니다."""
+        grams = char_ngrams(keyword, self.n)
+        if not grams:
+            # n보다 짧은 키워드는 역색인으로 좁힐 수 없으므로 전체 행이 후보
+            return list(range(len(self.rows)))
+
+        postings = self._postings[column]
+        lists = []
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is None:
+                return []
+            lists.append(ids)
+
+        # 가장 짧은 posting부터 교집합
+        lists.sort(key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            result.intersection_update(ids)
+            if not result:
+                break
+        return sorted(result)
+
+    def search(self, column: str, keyword: str, limit: int) -> list[dict]:
+        """column에 keyword가 포함된 행을 최대 limit건 반환합니다. (ILIKE '%keyword%'와 동일)"""
+        if column not in self._texts:
+            return []
+        kw = normalize_text(keyword)
+        texts = self._texts[column]
+        results = []
+        for idx in self._candidates(column, kw):
+            # n-gram 교집합은 후보일 뿐이므로 실제 부분 문자열 여부를 확인
+            if kw in texts[idx]:
+                results.append(self.rows[idx])
+                if len(results) >= limit:
+                    break
+        return results
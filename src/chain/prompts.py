@@ -5,7 +5,6 @@ CLASSIFIER_SYSTEM = """\
 당신은 한국 의약품 질문 분류기입니다.
 사용자의 질문에서 내복약인지 외용약인지도 판단해야 합니다.
 핵심 단어를 정할 때는 의학적 용어를 사용합니다.
-("까지다" -> "열상") ("베이다" -> "자상") ("긁히다" -> "찰과상") ("부딪히다" -> "타박상") 등
 사용자의 질문을 분석하여, 검색해야 할 컬럼과 검색 키워드를 JSON으로 반환하세요.
 
 [매칭 제한 규칙]
@@ -1,20 +1,55 @@
 import json
-from typing import Generator
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Generator
 
 from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 
+from src.chain.context_packer import pack_blocks, pack_context
+from src.chain.hybrid_retriever import hybrid_search
 from src.chain.prompts import ANSWER_PROMPT, CLASSIFIER_PROMPT
 from src.chain.retriever import (
     check_mutual_contraindication,
     extract_ingredients,
     format_dur_results,
     format_mutual_warnings,
-    format_search_results,
+    materialized_dur,
     search_drugs,
     search_dur_for_ingredients,
 )
-from src.config import CLASSIFIER_MODEL, LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY
+from src.chain.single_flight import SingleFlight
+from src.chain.term_expansion import expand_keyword
+from src.config import (
+    CLASSIFIER_MODEL,
+    CONTEXT_TOKEN_BUDGET,
+    DUR_CONTEXT_TOKEN_BUDGET,
+    DUR_STAGE_MAX_ABANDONED,
+    DUR_STAGE_TIMEOUT,
+    DUR_STAGE_WORKERS,
+    LLM_MODEL,
+    LLM_TEMPERATURE,
+    MUTUAL_STAGE_TIMEOUT,
+    OPENAI_API_KEY,
+    RETRIEVAL_MODE,
+    SINGLE_FLIGHT_ENABLED,
+)
+
+# DUR 단계(성분별 DUR 검색, 상호 병용금지 체크) 전용 스레드 풀
+# (검색어/하이브리드 검색 풀과 분리해 단계 안에서 다시 제출해도 서로 막히지 않음)
+_stage_executor = ThreadPoolExecutor(max_workers=DUR_STAGE_WORKERS, thread_name_prefix="rag-stage")
+
+# 시간 초과로 결과를 버렸지만 아직 실행 중인 단계 수 (끝날 때까지 _stage_executor 워커를 차지함)
+_abandoned_stages = 0
+_abandoned_lock = threading.Lock()
+
+DUR_TIMEOUT_CONTEXT = "(병용금지 정보 조회 시간 초과 — 병용금지 여부를 확인하지 못했습니다)"
+MUTUAL_TIMEOUT_CONTEXT = "(상호 병용금지 체크 시간 초과 — 약품 간 병용금지 여부를 확인하지 못했습니다)"
+
+# 같은 질문의 동시 분류 요청을 LLM 호출 한 번으로 합침
+_classify_flight = SingleFlight()
 
 
 def _get_classifier() -> ChatOpenAI:
@@ -36,7 +71,22 @@ def _get_generator() -> ChatOpenAI:
 
 
 def _classify(question: str) -> dict:
-    """사용자 질문을 분류하여 category와 keyword를 반환합니다."""
+    """사용자 질문을 분류하여 category와 keyword를 반환합니다.
+
+    같은 질문이 동시에 들어오면 분류기 호출을 한 번만 실행하고 결과를 공유합니다.
+    """
+    if not SINGLE_FLIGHT_ENABLED:
+        return _classify_question(question)
+    return dict(_classify_flight.do(question, lambda: _classify_question(question)))
+
+
+def get_classify_flight_stats() -> dict:
+    """질문 분류 요청 합치기의 호출/실행/합쳐진 건수를 반환합니다."""
+    return _classify_flight.stats()
+
+
+def _classify_question(question: str) -> dict:
+    """질문 분류 본체 (요청 합치기 미적용)."""
     llm = _get_classifier()
     result = llm.invoke(CLASSIFIER_PROMPT.format_messages(question=question))
     try:
@@ -44,33 +94,100 @@ def _classify(question: str) -> dict:
     except json.JSONDecodeError:
         # JSON 파싱 실패 시 기본값: 제품명 검색
         parsed = {"category": "product_name", "keyword": question}
+    category = parsed.get("category", "product_name")
+    keyword = parsed.get("keyword", question)
+    # 효능 검색은 일상 표현에 해당하는 의학 용어를 덧붙임 (예: "까진 상처" → "까진 상처, 열상")
+    if category == "efficacy":
+        keyword = expand_keyword(keyword)
     return {
         "question": question,
-        "category": parsed.get("category", "product_name"),
-        "keyword": parsed.get("keyword", question),
+        "category": category,
+        "keyword": keyword,
     }
 
 
+def _submit_stage(timeout: float, fn, *args) -> tuple[Future | None, float]:
+    """DUR 단계를 제출하고 (Future, 이 단계의 deadline)을 반환합니다.
+
+    버려진 단계가 DUR_STAGE_MAX_ABANDONED개 이상 실행 중이면 백엔드가 느린 상태이므로
+    워커를 더 쌓지 않도록 제출하지 않습니다. (Future는 None, 결과는 바로 시간 초과로 처리)
+    """
+    deadline = time.monotonic() + timeout
+    with _abandoned_lock:
+        if _abandoned_stages >= DUR_STAGE_MAX_ABANDONED:
+            return None, deadline
+    return _stage_executor.submit(fn, *args), deadline
+
+
+def _release_abandoned(future: Future) -> None:
+    global _abandoned_stages
+    with _abandoned_lock:
+        _abandoned_stages -= 1
+
+
+def _stage_result(stage: tuple[Future | None, float], default: Any) -> tuple[Any, bool]:
+    """단계의 deadline(time.monotonic 기준)까지 결과를 기다립니다. 시간 초과 시 (default, True).
+
+    시간 초과는 단계 결과를 쓰지 않는다는 뜻이지 단계가 멈췄다는 뜻이 아닙니다.
+    아직 시작하지 않은 단계는 취소되지만, 실행 중인 단계는 진행 중인 요청이 끝날 때까지
+    (최대 SUPABASE_HTTP_TIMEOUT) 워커를 차지하므로 버려진 단계로 세어 새 제출을 제한합니다.
+    """
+    global _abandoned_stages
+    future, deadline = stage
+    if future is None:
+        return default, True
+    try:
+        return future.result(timeout=max(deadline - time.monotonic(), 0)), False
+    except FuturesTimeoutError:
+        if not future.cancel():
+            with _abandoned_lock:
+                _abandoned_stages += 1
+            future.add_done_callback(_release_abandoned)
+        return default, True
+
+
+def get_stage_stats() -> dict:
+    """시간 초과로 결과를 버렸지만 아직 실행 중인 DUR 단계 수를 반환합니다."""
+    with _abandoned_lock:
+        return {"abandoned": _abandoned_stages, "max_abandoned": DUR_STAGE_MAX_ABANDONED}
+
+
 def _search(inputs: dict) -> dict:
     """분류 결과를 바탕으로 Supabase drugs 테이블을 검색하고 DUR 정보를 수집합니다."""
-    # 1. drugs 테이블 검색 (기존)
-    rows = search_drugs(inputs["category"], inputs["keyword"])
-    context = format_search_results(rows)
+    # 1. drugs 테이블 검색 (hybrid 모드면 벡터 검색과 RRF 병합)
+    if RETRIEVAL_MODE == "hybrid":
+        rows = hybrid_search(inputs["category"], inputs["keyword"], inputs["question"])
+    else:
+        rows = search_drugs(inputs["category"], inputs["keyword"])
 
     # 2. 검색된 약품에서 성분명 추출
     ingredients = extract_ingredients(rows)
 
-    # 3. 각 성분에 대한 DUR 병용금지 정보 검색
-    dur_data = search_dur_for_ingredients(ingredients)
-    dur_context = format_dur_results(dur_data)
+    # 3~4. 성분별 DUR 검색과 상호 병용금지 체크는 성분 목록에만 의존하므로 동시에 실행
+    # (적재 시 저장된 약품별 DUR 요약이 있으면 성분별 DUR 검색은 생략)
+    # 단계마다 제출 시점부터 따로 대기 시간을 계산해, 한 단계가 느려도 다른 단계의 예산을 쓰지 않음
+    materialized = materialized_dur(rows)
+    dur_stage = None
+    if materialized is None:
+        dur_stage = _submit_stage(DUR_STAGE_TIMEOUT, search_dur_for_ingredients, ingredients)
+    mutual_stage = _submit_stage(MUTUAL_STAGE_TIMEOUT, check_mutual_contraindication, ingredients)
 
-    # 4. 검색된 약품들 간 상호 병용금지 체크
-    mutual_warnings = check_mutual_contraindication(ingredients)
-    mutual_context = format_mutual_warnings(mutual_warnings)
+    # DUR 조회를 기다리는 동안 토큰 예산 안에서 검색 컬럼 → 효능/주의사항 → 나머지 필드 순으로 채움
+    context, context_stats = pack_context(rows, inputs["category"], CONTEXT_TOKEN_BUDGET)
+
+    if dur_stage is None:
+        dur_data, dur_context = materialized
+    else:
+        dur_data, dur_timed_out = _stage_result(dur_stage, {})
+        dur_context = DUR_TIMEOUT_CONTEXT if dur_timed_out else format_dur_results(dur_data)
+
+    mutual_warnings, mutual_timed_out = _stage_result(mutual_stage, [])
+    mutual_context = MUTUAL_TIMEOUT_CONTEXT if mutual_timed_out else format_mutual_warnings(mutual_warnings)
 
     return {
         **inputs,
         "context": context,
+        "context_stats": context_stats,
         "source_drugs": rows,
         "ingredients": ingredients,
         "dur_data": dur_data,
@@ -127,10 +244,11 @@ def prepare_context(question: str) -> dict:
     classified = _classify(question)
     searched = _search(classified)
 
-    # DUR 컨텍스트 조합 (일반 병용금지 + 상호 병용금지)
-    combined_dur_context = searched["dur_context"]
-    if searched["mutual_context"]:
-        combined_dur_context += "\n\n" + searched["mutual_context"]
+    # DUR 컨텍스트 조합: 검색된 약품끼리의 상호 병용금지 경고를 먼저 담아 예산 초과 시에도 빠지지 않게 하고,
+    # 성분별 병용금지는 성분 블록(헤더 + 항목) 단위로 채움
+    combined_dur_context, dur_stats = pack_blocks(
+        searched["dur_context"].split("\n\n"), DUR_CONTEXT_TOKEN_BUDGET, pinned=[searched["mutual_context"]]
+    )
 
     prompt_messages = ANSWER_PROMPT.format_messages(
         question=searched["question"],
@@ -141,6 +259,8 @@ def prepare_context(question: str) -> dict:
     )
     return {
         **searched,
+        # 요청별 컨텍스트 토큰 사용량 / 예산 초과로 제외된 양
+        "context_stats": {"drugs": searched["context_stats"], "dur": dur_stats},
         "prompt_messages": prompt_messages,
     }
 
@@ -0,0 +1,67 @@
+"""검색 후보 로컬 재정렬기.
+
+후보 풀 전체에 대해 numpy 문자열 연산으로 특징을 한 번에 계산하고,
+가중합 점수로 결정적(deterministic) 순위를 매깁니다.
+- 키워드 위치: 앞쪽에 나올수록 가산
+- 매칭 밀도: 텍스트 길이 대비 키워드 등장 비율
+- 제품명 일치: 제품명이 키워드와 같거나 키워드로 시작하면 가산
+- 취소 제품: cancel_date가 있으면 감점
+- 사전 점수: BM25처럼 앞 단계 점수가 있으면 최댓값 대비 비율로 가산
+"""
+
+import numpy as np
+
+from src.chain.local_index import normalize_text
+
+WEIGHT_POSITION = 1.0
+WEIGHT_DENSITY = 2.0
+WEIGHT_EXACT_NAME = 3.0
+WEIGHT_NAME_PREFIX = 1.0
+PENALTY_CANCELLED = 5.0
+WEIGHT_PRIOR = 3.0
+
+# 재정렬에 필요한 컬럼 (슬림 후보 조회 시 검색 컬럼과 함께 가져옴)
+RERANK_COLUMNS = ("item_seq", "item_name", "cancel_date")
+
+
+def score_candidates(candidates: list[dict], column: str, keyword: str,
+                     prior: list[float] | None = None) -> np.ndarray:
+    """후보별 재정렬 점수 배열을 계산합니다. (prior: 후보별 앞 단계 점수)"""
+    kw = normalize_text(keyword).strip()
+    texts = np.array([normalize_text(row.get(column)) for row in candidates], dtype=str)
+    names = np.array([normalize_text(row.get("item_name")) for row in candidates], dtype=str)
+    cancelled = np.array([bool(row.get("cancel_date")) for row in candidates])
+
+    lengths = np.maximum(np.char.str_len(texts), 1).astype(np.float64)
+    positions = np.char.find(texts, kw).astype(np.float64)
+    counts = np.char.count(texts, kw).astype(np.float64)
+
+    position_score = np.where(positions >= 0, 1.0 - positions / lengths, 0.0)
+    density = np.minimum(counts * max(len(kw), 1) / lengths, 1.0)
+    exact_name = names == kw
+    name_prefix = np.char.startswith(names, kw) & ~exact_name
+
+    scores = (
+        WEIGHT_POSITION * position_score
+        + WEIGHT_DENSITY * density
+        + WEIGHT_EXACT_NAME * exact_name
+        + WEIGHT_NAME_PREFIX * name_prefix
+        - PENALTY_CANCELLED * cancelled
+    )
+    if prior is not None:
+        prior_scores = np.asarray(prior, dtype=np.float64)
+        top = prior_scores.max() if len(prior_scores) else 0.0
+        if top > 0:
+            scores = scores + WEIGHT_PRIOR * prior_scores / top
+    return scores
+
+
+def rerank_candidates(candidates: list[dict], column: str, keyword: str,
+                      prior: list[float] | None = None) -> list[dict]:
+    """후보를 재정렬 점수 내림차순으로 정렬합니다. (동점이면 item_seq 오름차순)"""
+    if len(candidates) <= 1:
+        return list(candidates)
+    scores = score_candidates(candidates, column, keyword, prior)
+    seqs = np.array([str(row.get("item_seq")) for row in candidates], dtype=str)
+    order = np.lexsort((seqs, -scores))
+    return [candidates[i] for i in order]
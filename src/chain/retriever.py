@@ -1,5 +1,57 @@
-from src.config import SEARCH_LIMIT, SUPABASE_KEY, SUPABASE_URL
-from supabase import create_client
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.chain.bm25_index import BM25Index
+from src.chain.cache import RetrievalCache, normalize_cache_keyword
+from src.chain.dur_graph import (
+    DUR_ROWS_PER_INGREDIENT,
+    DurGraph,
+    get_dur_field,
+    to_mutual_warning,
+)
+from src.chain.dur_matrix import DurConflictMatrix
+from src.chain.fuzzy_index import ProductNameIndex
+from src.chain.local_index import DrugSnapshot, normalize_text
+from src.chain.reranker import RERANK_COLUMNS, rerank_candidates
+from src.chain.single_flight import SingleFlight
+from src.config import (
+    BM25_INDEX_FILENAME,
+    BM25_SEARCH_ENABLED,
+    DUR_BATCH_ROW_LIMIT,
+    DUR_ENGINE,
+    FUZZY_SEARCH_ENABLED,
+    HYDRATION_CACHE_SIZE,
+    INGREDIENT_CROSSWALK_FILENAME,
+    INGREDIENT_INDEX_FILENAME,
+    LOCAL_INDEX_TTL,
+    LOCAL_INDEX_VERSION_CHECK_INTERVAL,
+    LOCAL_SEARCH_ENABLED,
+    MAX_SEARCH_TERMS,
+    RAW_DATA_DIR,
+    RETRIEVAL_CACHE_ENABLED,
+    RETRIEVAL_CACHE_NEGATIVE_TTL,
+    RETRIEVAL_CACHE_SIZE,
+    RETRIEVAL_CACHE_TTL,
+    SEARCH_CANDIDATE_POOL,
+    SEARCH_LIMIT,
+    SEARCH_TERM_QUOTA,
+    SINGLE_FLIGHT_ENABLED,
+)
+from src.data.crosswalk import CROSSWALK_VERSION
+from src.data.preprocessor import (
+    DRUG_CONTEXT_LABELS,
+    build_ingredient_index,
+    normalize_ingredient_key,
+    normalize_ingredient_name,
+    parse_main_item_ingr,
+    render_drug_context,
+)
+from src.repository.factory import get_repository
 
 # 분류 카테고리 → Supabase drugs 테이블 컬럼 매핑
 CATEGORY_COLUMN_MAP = {
@@ -9,55 +61,425 @@ CATEGORY_COLUMN_MAP = {
 }
 
 # 행 데이터를 텍스트로 변환할 때 사용할 필드 라벨
-FIELD_LABELS = {
-    "item_name": "제품명",
-    "entp_name": "업체명",
-    "item_seq": "품목기준코드",
-    "main_item_ingr": "주성분",
-    "chart": "성상",
-    "spclty_pblc": "전문/일반",
-    "item_permit_date": "허가일자",
-    "efcy_qesitm": "효능",
-    "use_method_qesitm": "사용법",
-    "atpn_warn_qesitm": "주의사항 경고",
-    "atpn_qesitm": "주의사항",
-    "intrc_qesitm": "상호작용",
-    "se_qesitm": "부작용",
-    "deposit_method_qesitm": "보관법",
-    "storage_method": "저장방법",
-    "valid_term": "유효기간",
-}
+FIELD_LABELS = DRUG_CONTEXT_LABELS
+
+
+# dur 테이블 전체를 메모리에 올려 조회하는 DUR 엔진
+IN_MEMORY_DUR_ENGINES = ("graph", "matrix")
+
+# 분류기가 여러 증상을 "요통, 두통"처럼 구분해 반환할 때 사용하는 구분자
+KEYWORD_SEPARATOR_PATTERN = re.compile(r"[,，、]")
+
+# (테이블, 검색 종류, 정규화 키워드) → 검색 결과
+_retrieval_cache = RetrievalCache(
+    RETRIEVAL_CACHE_SIZE, RETRIEVAL_CACHE_TTL, RETRIEVAL_CACHE_NEGATIVE_TTL
+)
+
+# 캐시 미스 시 같은 키의 동시 조회를 하나로 합침 (인기 약품 질문이 몰릴 때 중복 조회 방지)
+_single_flight = SingleFlight()
+
+_snapshot: DrugSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+_bm25_index: BM25Index | None = None
+_bm25_loaded = False
+_bm25_lock = threading.Lock()
+
+_name_index: ProductNameIndex | None = None
+_name_index_lock = threading.Lock()
+
+# 2단계 검색: 후보 순위는 슬림 컬럼으로 정하고, 최종 행만 item_seq로 전체 조회(캐시)
+_hydration_cache: OrderedDict[str, dict] = OrderedDict()
+_hydration_lock = threading.Lock()
+_hydration_generation = 0  # reset_hydration_cache()마다 증가, 조회 중 무효화된 결과는 저장하지 않음
+
+_ingredient_index: dict | None = None
+_ingredient_index_loaded = False
+_ingredient_index_lock = threading.Lock()
+
+_dur_graph: DurGraph | None = None
+_dur_graph_lock = threading.Lock()
+
+# 성분명 노드 기준 / INGR_CODE 기준 충돌 행렬 (DUR_ENGINE="matrix")
+_dur_matrix: DurConflictMatrix | None = None
+_dur_code_matrix: DurConflictMatrix | None = None
+_dur_matrix_lock = threading.Lock()
+
+_crosswalk: dict | None = None
+_crosswalk_loaded = False
+_crosswalk_lock = threading.Lock()
+
+# 테이블 → (마지막으로 본 데이터 버전, 로컬 색인/캐시를 폐기한 시각)
+_data_versions: dict[str, tuple[str | None, float]] = {}
+_data_version_checked_at = 0.0
+_data_version_lock = threading.Lock()
+
+# 다중 키워드 검색용 스레드 풀 (키워드별 검색을 동시에 실행)
+_term_executor = ThreadPoolExecutor(max_workers=MAX_SEARCH_TERMS, thread_name_prefix="drug-search")
+
+
+def _fetch_all_rows(table: str, columns: str = "*", order: str = "item_seq") -> list[dict]:
+    """테이블 전체 행을 데이터 백엔드에서 모두 가져옵니다."""
+    return get_repository().fetch_all(table, columns, order)
+
+
+def _coalesced(key: tuple, compute):
+    """같은 key로 실행 중인 compute가 있으면 그 결과를 함께 받습니다."""
+    if not SINGLE_FLIGHT_ENABLED:
+        return compute()
+    return _single_flight.do(key, compute)
+
+
+def _cached(key: tuple, compute):
+    """검색 결과 캐시를 거쳐 compute()를 실행합니다. (호출자가 수정해도 안전하도록 복사본 반환)"""
+    refresh_local_indexes_if_stale()
+    if not RETRIEVAL_CACHE_ENABLED:
+        return list(_coalesced(key, compute))
+    return list(_retrieval_cache.get_or_compute(key, lambda: _coalesced(key, compute)))
 
 
-def _get_client():
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+def get_retrieval_cache_stats() -> dict:
+    """검색 결과 캐시의 크기와 적중/미스 카운터를 반환합니다."""
+    return _retrieval_cache.stats()
+
+
+def get_single_flight_stats() -> dict:
+    """검색/DUR 조회 요청 합치기의 호출/실행/합쳐진 건수를 반환합니다."""
+    return _single_flight.stats()
+
+
+def invalidate_retrieval_cache(table: str | None = None) -> None:
+    """적재 후 호출하는 무효화 훅: table(없으면 전체)의 캐시와 로컬 색인을 폐기합니다."""
+    _retrieval_cache.invalidate(table)
+    if table in (None, "drugs"):
+        reset_drug_snapshot()
+        reset_bm25_index()
+        reset_product_name_index()
+        reset_ingredient_index()
+        reset_hydration_cache()
+    if table in (None, "dur"):
+        reset_dur_graph()
+    reset_ingredient_crosswalk()
+
+
+def refresh_local_indexes_if_stale() -> None:
+    """다른 프로세스의 적재로 테이블 데이터 버전이 바뀌었으면 해당 테이블의 캐시와 로컬 색인을 폐기합니다.
+
+    확인은 LOCAL_INDEX_VERSION_CHECK_INTERVAL초에 한 번만 하고, 버전을 읽을 수 없는 백엔드
+    (data_versions 테이블 미적용 등)에서는 LOCAL_INDEX_TTL초가 지나면 폐기합니다.
+    """
+    global _data_version_checked_at
+    now = time.monotonic()
+    if now - _data_version_checked_at < LOCAL_INDEX_VERSION_CHECK_INTERVAL:
+        return
+    with _data_version_lock:
+        if now - _data_version_checked_at < LOCAL_INDEX_VERSION_CHECK_INTERVAL:
+            return
+        _data_version_checked_at = now
+        stale = []
+        repository = get_repository()
+        for table in ("drugs", "dur"):
+            try:
+                version = repository.data_version(table)
+            except Exception:
+                version = None
+            if table not in _data_versions:
+                _data_versions[table] = (version, now)
+                continue
+            seen, reset_at = _data_versions[table]
+            if version != seen or (version is None and now - reset_at >= LOCAL_INDEX_TTL):
+                _data_versions[table] = (version, now)
+                stale.append(table)
+    for table in stale:
+        invalidate_retrieval_cache(table)
+
+
+def get_drug_snapshot() -> DrugSnapshot:
+    """drugs 테이블 스냅샷을 최초 1회만 로드하여 반환합니다."""
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = DrugSnapshot(_fetch_all_rows("drugs"))
+    return _snapshot
+
+
+def reset_drug_snapshot() -> None:
+    """drugs 스냅샷을 폐기합니다. 다음 검색 시 다시 로드됩니다."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+
+
+def get_bm25_index() -> BM25Index | None:
+    """적재 파이프라인이 저장한 효능 BM25 색인을 최초 1회만 로드합니다. (파일이 없으면 None)"""
+    global _bm25_index, _bm25_loaded
+    if not _bm25_loaded:
+        with _bm25_lock:
+            if not _bm25_loaded:
+                path = os.path.join(RAW_DATA_DIR, BM25_INDEX_FILENAME)
+                _bm25_index = BM25Index.load(path) if os.path.exists(path) else None
+                _bm25_loaded = True
+    return _bm25_index
+
+
+def reset_bm25_index() -> None:
+    """BM25 색인을 폐기합니다. 다음 검색 시 파일에서 다시 로드됩니다."""
+    global _bm25_index, _bm25_loaded
+    with _bm25_lock:
+        _bm25_index = None
+        _bm25_loaded = False
+
+
+def get_product_name_index() -> ProductNameIndex:
+    """제품명 오타 교정 색인을 최초 1회만 생성합니다."""
+    global _name_index
+    if _name_index is None:
+        with _name_index_lock:
+            if _name_index is None:
+                if LOCAL_SEARCH_ENABLED:
+                    rows = get_drug_snapshot().rows
+                else:
+                    rows = _fetch_all_rows("drugs", "item_seq,item_name")
+                _name_index = ProductNameIndex(rows)
+    return _name_index
+
+
+def reset_product_name_index() -> None:
+    """제품명 오타 교정 색인을 폐기합니다. 다음 교정 시 다시 생성됩니다."""
+    global _name_index
+    with _name_index_lock:
+        _name_index = None
+
+
+def get_ingredient_index() -> dict | None:
+    """성분명/성분코드 → item_seq 역색인을 최초 1회만 로드합니다.
+
+    적재 파이프라인이 저장한 파일을 우선 사용하고, 없으면 로컬 스냅샷으로 생성합니다.
+    둘 다 없으면 None을 반환합니다.
+    """
+    global _ingredient_index, _ingredient_index_loaded
+    if not _ingredient_index_loaded:
+        with _ingredient_index_lock:
+            if not _ingredient_index_loaded:
+                path = os.path.join(RAW_DATA_DIR, INGREDIENT_INDEX_FILENAME)
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        _ingredient_index = json.load(f)
+                elif LOCAL_SEARCH_ENABLED:
+                    _ingredient_index = build_ingredient_index(get_drug_snapshot().rows)
+                _ingredient_index_loaded = True
+    return _ingredient_index
+
+
+def reset_ingredient_index() -> None:
+    """성분 역색인을 폐기합니다. 다음 검색 시 다시 로드됩니다."""
+    global _ingredient_index, _ingredient_index_loaded
+    with _ingredient_index_lock:
+        _ingredient_index = None
+        _ingredient_index_loaded = False
+
+
+def _lookup_ingredient(keyword: str) -> list[str]:
+    """성분명 또는 성분코드와 정확히 일치하는 약품의 item_seq 목록을 반환합니다."""
+    index = get_ingredient_index()
+    if index is None:
+        return []
+    key = normalize_ingredient_key(keyword)
+    return index["by_name"].get(key) or index["by_code"].get(key.upper(), [])
+
+
+def reset_hydration_cache() -> None:
+    """item_seq → drugs 행 캐시를 비웁니다."""
+    global _hydration_generation
+    with _hydration_lock:
+        _hydration_cache.clear()
+        _hydration_generation += 1
+
+
+def fetch_rows_by_seq(item_seqs: list[str]) -> list[dict]:
+    """item_seq 목록에 해당하는 drugs 전체 행을 주어진 순서대로 가져옵니다.
+
+    Supabase 조회 시 캐시에 없는 item_seq만 한 번의 IN 쿼리로 가져옵니다.
+    """
+    if not item_seqs:
+        return []
+    if LOCAL_SEARCH_ENABLED:
+        return get_drug_snapshot().get_rows(item_seqs)
+
+    by_seq = {}
+    with _hydration_lock:
+        generation = _hydration_generation
+        for seq in item_seqs:
+            row = _hydration_cache.get(seq)
+            if row is not None:
+                _hydration_cache.move_to_end(seq)
+                by_seq[seq] = row
+
+    missing = [seq for seq in item_seqs if seq not in by_seq]
+    if missing:
+        fetched = get_repository().fetch_drugs_by_seq(missing)
+        with _hydration_lock:
+            for row in fetched:
+                seq = str(row.get("item_seq"))
+                by_seq[seq] = row
+                if generation != _hydration_generation:
+                    continue
+                _hydration_cache[seq] = row
+                _hydration_cache.move_to_end(seq)
+            while len(_hydration_cache) > HYDRATION_CACHE_SIZE:
+                _hydration_cache.popitem(last=False)
+
+    return [by_seq[seq] for seq in item_seqs if seq in by_seq]
+
+
+def _fetch_candidates(column: str, keyword: str, limit: int) -> list[dict]:
+    """부분 일치 검색 후보를 재정렬용 컬럼 + 검색 컬럼만 포함한 슬림 행으로 가져옵니다."""
+    columns = list(dict.fromkeys((*RERANK_COLUMNS, column)))
+    return get_repository().search_drugs(column, keyword, columns, limit)
+
+
+def split_keywords(keyword: str) -> list[str]:
+    """콤마 등으로 구분된 다중 키워드를 중복 없이 분리합니다.
+
+    예: "요통, 두통" → ["요통", "두통"]
+    """
+    terms = []
+    for part in KEYWORD_SEPARATOR_PATTERN.split(keyword or ""):
+        term = part.strip()
+        if term and term not in terms:
+            terms.append(term)
+    return terms[:MAX_SEARCH_TERMS]
+
+
+def _search_term(column: str, keyword: str, limit: int) -> list[dict]:
+    """단일 키워드로 column을 검색합니다.
+
+    제품명 검색 결과가 없으면 오타 교정 색인으로 교정된 제품명을 찾아 반환합니다.
+    """
+    rows = _search_exact(column, keyword, limit)
+    if not rows and column == "item_name" and FUZZY_SEARCH_ENABLED:
+        rows = fetch_rows_by_seq(get_product_name_index().lookup(keyword, limit))
+    return rows
+
+
+def _search_exact(column: str, keyword: str, limit: int) -> list[dict]:
+    """단일 키워드로 column을 검색합니다. (성분/BM25 색인, 로컬 스냅샷 또는 Supabase ILIKE)"""
+    if column == "main_item_ingr":
+        # 성분 역색인에서 정확히 일치하면 집합 조회로 끝냄 (부분 일치는 아래 검색으로)
+        item_seqs = _lookup_ingredient(keyword)
+        if item_seqs:
+            return fetch_rows_by_seq(item_seqs[:limit])
+
+    # 후보 풀을 한 번에 가져와 로컬에서 재정렬한 뒤 상위 limit건만 사용
+    pool = max(limit, SEARCH_CANDIDATE_POOL)
+    if column == "efcy_qesitm" and BM25_SEARCH_ENABLED:
+        index = get_bm25_index()
+        ranked = index.top_k(keyword, pool) if index is not None else []
+        # BM25 상위 후보도 같은 재정렬(취소 제품 감점 등)을 거치고, BM25 점수는 사전 점수로 반영
+        # (색인에 없는 용어라 결과가 없으면 아래 부분 일치 검색으로)
+        if ranked:
+            bm25_scores = dict(ranked)
+            candidates = fetch_rows_by_seq([seq for seq, _ in ranked])
+            prior = [bm25_scores[str(row["item_seq"])] for row in candidates]
+            candidates = rerank_candidates(candidates, column, keyword, prior)
+            return fetch_rows_by_seq([str(row["item_seq"]) for row in candidates[:limit]])
+
+    if LOCAL_SEARCH_ENABLED:
+        candidates = get_drug_snapshot().search(column, keyword, pool)
+        return rerank_candidates(candidates, column, keyword)[:limit]
+
+    # 1) 슬림 후보 조회 + 재정렬 → 2) 최종 후보만 전체 행 조회
+    candidates = rerank_candidates(_fetch_candidates(column, keyword, pool), column, keyword)
+    return fetch_rows_by_seq([str(row["item_seq"]) for row in candidates[:limit]])
+
+
+def _merge_by_coverage(column: str, terms: list[str], results: list[list[dict]],
+                       limit: int) -> list[dict]:
+    """키워드별 검색 결과를 병합합니다.
+
+    - 더 많은 키워드를 포함한 약품(coverage)을 우선합니다.
+    - 각 키워드가 최소 SEARCH_TERM_QUOTA건의 결과를 갖도록 먼저 자리를 배정합니다.
+    """
+    lowered_terms = [normalize_text(term) for term in terms]
+    candidates = {}
+    rank = {}
+    for term_rows in results:
+        for pos, row in enumerate(term_rows):
+            key = row.get("item_seq")
+            if key not in candidates:
+                candidates[key] = row
+                rank[key] = pos
+
+    texts = {key: normalize_text(row.get(column)) for key, row in candidates.items()}
+    coverage = {key: sum(t in texts[key] for t in lowered_terms) for key in candidates}
+    ordered = sorted(candidates, key=lambda key: (-coverage[key], rank[key]))
+
+    selected = []
+    # 1) 키워드별 할당량 배정
+    for term in lowered_terms:
+        assigned = sum(term in texts[key] for key in selected)
+        for key in ordered:
+            if assigned >= SEARCH_TERM_QUOTA:
+                break
+            if key not in selected and term in texts[key]:
+                selected.append(key)
+                assigned += 1
+
+    # 2) 남은 자리는 coverage 순으로 채움
+    for key in ordered:
+        if len(selected) >= limit:
+            break
+        if key not in selected:
+            selected.append(key)
+
+    selected.sort(key=lambda key: (-coverage[key], rank[key]))
+    return [candidates[key] for key in selected[:limit]]
 
 
 def search_drugs(category: str, keyword: str) -> list[dict]:
-    """drugs 테이블에서 category에 해당하는 컬럼을 keyword로 ILIKE 검색합니다."""
+    """drugs 테이블에서 category에 해당하는 컬럼을 keyword로 ILIKE 검색합니다.
+
+    같은 (category, keyword) 결과는 검색 결과 캐시에서 반환합니다.
+    """
+    key = ("drugs", category, normalize_cache_keyword(keyword))
+    return _cached(key, lambda: _search_drugs(category, keyword))
+
+
+def _search_drugs(category: str, keyword: str) -> list[dict]:
+    """drugs 테이블 검색 본체 (캐시 미적용).
+
+    LOCAL_SEARCH_ENABLED이면 Supabase 대신 인메모리 스냅샷의 n-gram 역색인으로 검색합니다.
+    efficacy는 BM25 색인 파일이 있으면 BM25 점수 상위 후보를 재정렬해 반환합니다. (BM25 결과가 없으면 부분 일치 검색)
+    product_name 검색 결과가 없으면 자모 기반 오타 교정 결과로 대체합니다.
+    keyword가 "요통, 두통"처럼 여러 개이면 키워드별로 동시에 검색한 뒤 병합합니다.
+    """
     column = CATEGORY_COLUMN_MAP.get(category)
     if not column:
         return []
 
-    client = _get_client()
-    res = (
-        client.table("drugs")
-        .select("*")
-        .ilike(column, f"%{keyword}%")
-        .limit(SEARCH_LIMIT)
-        .execute()
+    terms = split_keywords(keyword)
+    if not terms:
+        return []
+    if len(terms) == 1:
+        return _search_term(column, terms[0], SEARCH_LIMIT)
+
+    limit = max(SEARCH_LIMIT, SEARCH_TERM_QUOTA * len(terms))
+    results = list(
+        _term_executor.map(lambda term: _search_term(column, term, SEARCH_LIMIT), terms)
     )
-    return res.data or []
+    return _merge_by_coverage(column, terms, results, limit)
 
 
 def format_drug_info(row: dict) -> str:
-    """drugs 테이블의 행 1건을 읽기 좋은 텍스트로 포맷합니다."""
-    lines = []
-    for key, label in FIELD_LABELS.items():
-        value = (row.get(key) or "").strip()
-        if value:
-            lines.append(f"[{label}] {value}")
-    return "\n".join(lines)
+    """drugs 테이블의 행 1건을 읽기 좋은 텍스트로 포맷합니다.
+
+    적재 시 미리 렌더링된 context_block이 있으면 그대로 사용합니다.
+    """
+    block = row.get("context_block")
+    if block:
+        return block
+    return render_drug_context(row)[1]
 
 
 def format_search_results(rows: list[dict]) -> str:
@@ -78,151 +500,329 @@ def format_search_results(rows: list[dict]) -> str:
 def extract_ingredients(drugs_data: list[dict]) -> list[str]:
     """검색된 약품 데이터에서 성분명 목록을 추출합니다.
 
+    적재 시 파싱된 main_ingredients 컬럼을 읽고, 없으면 main_item_ingr을 파싱합니다.
     drugs 테이블의 main_item_ingr 형식: "[M040548]창출|[M040486]육두구|..."
-    - 파이프(|)로 구분
-    - [코드] 접두사 포함
     """
-    import re
+    ingredients = []
+    for drug in drugs_data:
+        parsed = drug.get("main_ingredients")
+        if parsed is None:
+            parsed = parse_main_item_ingr(drug.get("main_item_ingr"))
+        for ingr in parsed:
+            if ingr["name"] not in ingredients:
+                ingredients.append(ingr["name"])
+    return ingredients
+
+
+def materialized_dur(drugs_data: list[dict]) -> tuple[dict[str, list[dict]], str] | None:
+    """적재 시 저장된 약품별 DUR 요약(dur_summary)으로 (DUR 결과, DUR 컨텍스트)를 만듭니다.
 
-    ingredients = set()
+    요약이 없는 약품이 하나라도 있으면 None을 반환합니다. (검색 시 DUR 조회로 처리)
+    """
+    if any(drug.get("dur_summary") is None for drug in drugs_data):
+        return None
+    if len(drugs_data) == 1 and drugs_data[0].get("dur_context"):
+        return dict(drugs_data[0]["dur_summary"]), drugs_data[0]["dur_context"]
+    dur_data = {}
     for drug in drugs_data:
-        main_ingr = drug.get("main_item_ingr", "")
-        if main_ingr:
-            # 파이프(|)로 구분된 성분들 처리
-            for ingr in main_ingr.split("|"):
-                cleaned = ingr.strip()
-                # [코드] 형식 제거 (예: "[M040548]창출" → "창출")
-                if cleaned.startswith("[") and "]" in cleaned:
-                    cleaned = cleaned.split("]", 1)[1].strip()
-                # 괄호 안 함량 정보 제거 (예: "아세트아미노펜(500mg)" → "아세트아미노펜")
-                if "(" in cleaned:
-                    cleaned = cleaned.split("(")[0].strip()
-                if cleaned:
-                    ingredients.add(cleaned)
-    return list(ingredients)
-
-
-def _normalize_ingredient_name(name: str) -> str:
-    """성분명에서 접미사를 제거하여 핵심 이름만 추출합니다.
-
-    예: "슈도에페드린염산염" → "슈도에페드린"
-        "겐타마이신황산염" → "겐타마이신"
+        for ingredient, rows in drug["dur_summary"].items():
+            dur_data.setdefault(ingredient, rows)
+    return dur_data, format_dur_results(dur_data)
+
+
+def get_dur_graph() -> DurGraph:
+    """dur 테이블 병용금지 그래프를 최초 1회만 로드합니다."""
+    global _dur_graph
+    if _dur_graph is None:
+        with _dur_graph_lock:
+            if _dur_graph is None:
+                _dur_graph = DurGraph(_fetch_all_rows("dur", order="id"))
+    return _dur_graph
+
+
+def reset_dur_graph() -> None:
+    """DUR 그래프와 충돌 행렬을 폐기합니다. 다음 조회 시 다시 로드됩니다."""
+    global _dur_graph, _dur_matrix, _dur_code_matrix
+    with _dur_graph_lock:
+        _dur_graph = None
+    with _dur_matrix_lock:
+        _dur_matrix = None
+        _dur_code_matrix = None
+
+
+def get_dur_matrix() -> DurConflictMatrix:
+    """DUR 그래프의 성분명 노드로 충돌 행렬을 최초 1회만 생성합니다."""
+    global _dur_matrix
+    if _dur_matrix is None:
+        graph = get_dur_graph()
+        with _dur_matrix_lock:
+            if _dur_matrix is None:
+                _dur_matrix = DurConflictMatrix.from_graph(graph)
+    return _dur_matrix
+
+
+def get_dur_code_matrix() -> DurConflictMatrix:
+    """DUR 그래프의 행으로 INGR_CODE 기준 충돌 행렬을 최초 1회만 생성합니다."""
+    global _dur_code_matrix
+    if _dur_code_matrix is None:
+        graph = get_dur_graph()
+        with _dur_matrix_lock:
+            if _dur_code_matrix is None:
+                rows = [row for rows in graph.rows_by_ingredient.values() for row in rows]
+                _dur_code_matrix = DurConflictMatrix.from_codes(rows)
+    return _dur_code_matrix
+
+
+def get_ingredient_crosswalk() -> dict | None:
+    """적재 파이프라인이 저장한 성분 → DUR INGR_CODE 크로스워크를 최초 1회만 로드합니다. (없으면 None)"""
+    global _crosswalk, _crosswalk_loaded
+    if not _crosswalk_loaded:
+        with _crosswalk_lock:
+            if not _crosswalk_loaded:
+                path = os.path.join(RAW_DATA_DIR, INGREDIENT_CROSSWALK_FILENAME)
+                if os.path.exists(path):
+                    with open(path, "r", encoding="utf-8") as f:
+                        _crosswalk = json.load(f)
+                    # 이전 형식의 크로스워크는 무시하고 성분명 검색으로 처리 (적재 파이프라인 재실행 시 갱신)
+                    if _crosswalk.get("version") != CROSSWALK_VERSION:
+                        _crosswalk = None
+                _crosswalk_loaded = True
+    return _crosswalk
+
+
+def reset_ingredient_crosswalk() -> None:
+    """크로스워크를 폐기합니다. 다음 DUR 조회 시 다시 로드됩니다."""
+    global _crosswalk, _crosswalk_loaded
+    with _crosswalk_lock:
+        _crosswalk = None
+        _crosswalk_loaded = False
+
+
+def _lookup_dur_codes(ingredient_name: str) -> list[str] | None:
+    """크로스워크에서 성분명의 DUR INGR_CODE 목록을 찾습니다.
+
+    크로스워크에 없는 성분이면 None (부분 일치 조회로 처리), DUR에 없는 성분이면 빈 목록입니다.
     """
-    # 일반적인 제약 접미사 목록 (긴 것부터 처리)
-    suffixes = [
-        "염산염수화물", "브롬화수소산염수화물", "오로트산염수화물",
-        "염산염", "황산염", "수화물", "말레산염", "푸마르산염",
-        "타르타르산염", "인산염", "질산염", "아세트산염",
-    ]
-    normalized = name
-    for suffix in suffixes:
-        if normalized.endswith(suffix):
-            normalized = normalized[: -len(suffix)]
-            break
-    return normalized
+    crosswalk = get_ingredient_crosswalk()
+    if crosswalk is None:
+        return None
+    return crosswalk["by_name"].get(normalize_ingredient_key(ingredient_name))
+
+
+def _fetch_dur_by_codes(codes: list[str], limit: int) -> list[dict]:
+    """INGR_CODE 정확 일치로 DUR 병용금지 행을 가져옵니다."""
+    if not codes:
+        return []
+    if DUR_ENGINE in IN_MEMORY_DUR_ENGINES:
+        return get_dur_graph().lookup_codes(codes, limit)
+    return get_repository().fetch_dur_by_codes(codes, limit)
 
 
 def search_dur_by_ingredient(ingredient_name: str) -> list[dict]:
     """성분명으로 dur 테이블에서 병용금지 약물을 검색합니다."""
-    client = _get_client()
+    key = ("dur", "ingredient", normalize_cache_keyword(ingredient_name))
+    return _cached(key, lambda: _search_dur_by_ingredient(ingredient_name))
 
-    # 원본 성분명으로 검색
-    res = (
-        client.table("dur")
-        .select("*")
-        .ilike("INGR_KOR_NAME", f"%{ingredient_name}%")
-        .eq("DEL_YN", False)
-        .limit(20)
-        .execute()
-    )
 
-    results = res.data or []
+def _search_dur_by_ingredient(ingredient_name: str) -> list[dict]:
+    """성분명 DUR 검색 본체 (캐시 미적용)."""
+    codes = _lookup_dur_codes(ingredient_name)
+    if codes is not None:
+        return _fetch_dur_by_codes(codes, DUR_ROWS_PER_INGREDIENT)
+    if DUR_ENGINE in IN_MEMORY_DUR_ENGINES:
+        return get_dur_graph().lookup(ingredient_name)
+
+    repository = get_repository()
+
+    # 원본 성분명으로 검색
+    results = repository.search_dur_by_name(ingredient_name, DUR_ROWS_PER_INGREDIENT)
 
     # 결과가 없으면 정규화된 이름으로 재검색
     if not results:
-        normalized = _normalize_ingredient_name(ingredient_name)
+        normalized = normalize_ingredient_name(ingredient_name)
         if normalized != ingredient_name:
-            res2 = (
-                client.table("dur")
-                .select("*")
-                .ilike("INGR_KOR_NAME", f"%{normalized}%")
-                .eq("DEL_YN", False)
-                .limit(20)
-                .execute()
-            )
-            results = res2.data or []
+            results = repository.search_dur_by_name(normalized, DUR_ROWS_PER_INGREDIENT)
 
     return results
 
 
 def search_dur_for_ingredients(ingredients: list[str]) -> dict[str, list[dict]]:
-    """여러 성분에 대해 각각 DUR 병용금지 정보를 검색합니다."""
+    """여러 성분에 대해 각각 DUR 병용금지 정보를 검색합니다.
+
+    데이터 백엔드 조회 시 캐시에 없는 성분을 크로스워크 INGR_CODE 정확 일치 요청 1번과
+    (크로스워크에 없는 성분은) 부분 일치 요청 1번으로 가져온 뒤 성분별로 나눕니다.
+    요청이 행 수 제한에 걸리면 몫을 채우지 못한 성분만 따로 조회해, 잘린 결과를 캐시하지 않습니다.
+    같은 성분 목록의 동시 조회는 한 번만 실행하고 결과를 공유합니다.
+    """
+    refresh_local_indexes_if_stale()
+    if DUR_ENGINE in IN_MEMORY_DUR_ENGINES:
+        lookups = {ingr: search_dur_by_ingredient(ingr) for ingr in ingredients}
+    else:
+        lookups = {}
+        missing = []
+        for ingr in ingredients:
+            key = ("dur", "ingredient", normalize_cache_keyword(ingr))
+            found, rows = _retrieval_cache.get(key) if RETRIEVAL_CACHE_ENABLED else (False, None)
+            if found:
+                lookups[ingr] = list(rows)
+            else:
+                missing.append(ingr)
+        if missing:
+            key = ("dur", "batch", tuple(sorted(missing)))
+            fetched = _coalesced(key, lambda: _fetch_missing_dur(missing))
+            for ingr, rows in fetched.items():
+                lookups[ingr] = list(rows)
+
+    return {ingr: lookups[ingr] for ingr in ingredients if lookups.get(ingr)}
+
+
+def _fetch_missing_dur(ingredients: list[str]) -> dict[str, list[dict]]:
+    """캐시에 없는 성분들의 DUR 행을 일괄 조회해 캐시에 저장하고 성분별로 반환합니다."""
+    generation = _retrieval_cache.generation
+    codes = {ingr: _lookup_dur_codes(ingr) for ingr in ingredients}
+    fetched = _search_dur_codes_batch({i: c for i, c in codes.items() if c is not None})
+    unmapped = [ingr for ingr in ingredients if codes[ingr] is None]
+    if unmapped:
+        fetched.update(_search_dur_batch(unmapped))
+    if RETRIEVAL_CACHE_ENABLED:
+        for ingr, rows in fetched.items():
+            _retrieval_cache.set(("dur", "ingredient", normalize_cache_keyword(ingr)), rows, generation)
+    return fetched
+
+
+def _refetch_truncated(result: dict[str, list[dict]]) -> dict[str, list[dict]]:
+    """일괄 조회가 DUR_BATCH_ROW_LIMIT에 걸린 경우, 몫을 채우지 못한 성분을 성분별로 다시 조회합니다.
+
+    한 번의 요청이 행 수 제한을 함께 쓰므로 행이 많은 성분이 다른 성분의 행을 밀어낼 수 있습니다.
+    (예: 이트라코나졸 1,200행이 제한을 다 채워 심바스타틴이 빈 결과로 남음)
+    DUR_ROWS_PER_INGREDIENT건을 모두 받은 성분은 단건 조회와 결과가 같으므로 그대로 둡니다.
+    """
+    short = [ingr for ingr, rows in result.items() if len(rows) < DUR_ROWS_PER_INGREDIENT]
+    for ingr, rows in zip(short, _term_executor.map(_search_dur_by_ingredient, short)):
+        result[ingr] = rows
+    return result
+
+
+def _search_dur_codes_batch(codes_by_ingredient: dict[str, list[str]]) -> dict[str, list[dict]]:
+    """크로스워크 INGR_CODE를 한 번의 in 필터 요청으로 가져와 성분별로 나눕니다."""
+    all_codes = list(dict.fromkeys(code for codes in codes_by_ingredient.values() for code in codes))
+    rows = _fetch_dur_by_codes(all_codes, DUR_BATCH_ROW_LIMIT)
     result = {}
-    for ingr in ingredients:
-        dur_data = search_dur_by_ingredient(ingr)
-        if dur_data:
-            result[ingr] = dur_data
+    for ingr, codes in codes_by_ingredient.items():
+        code_set = set(codes)
+        matched = [row for row in rows if get_dur_field(row, "INGR_CODE") in code_set]
+        result[ingr] = matched[:DUR_ROWS_PER_INGREDIENT]
+    if len(rows) >= DUR_BATCH_ROW_LIMIT:
+        return _refetch_truncated(result)
     return result
 
 
-def _get_dur_field(row: dict, field: str) -> str:
-    """DUR 데이터에서 필드 값을 대소문자 구분 없이 가져옵니다."""
-    return row.get(field) or row.get(field.lower(), "")
+def _search_dur_batch(ingredients: list[str]) -> dict[str, list[dict]]:
+    """여러 성분의 DUR 행을 한 번의 요청(Supabase는 or 필터)으로 가져와 성분별로 나눕니다.
+
+    성분별 결과는 search_dur_by_ingredient와 같습니다: 원본 이름으로 찾은 행이 없으면
+    접미사를 제거한 이름으로 찾은 행을 사용합니다.
+    """
+    names = {ingr: normalize_ingredient_name(ingr) for ingr in ingredients}
+    terms = list(dict.fromkeys([*names, *names.values()]))
+    rows = get_repository().search_dur_by_names(terms, DUR_BATCH_ROW_LIMIT)
+    row_names = [get_dur_field(row, "INGR_KOR_NAME").lower() for row in rows]
+
+    def matching(term: str) -> list[dict]:
+        term = term.lower()
+        matched = [row for row, name in zip(rows, row_names) if term in name]
+        return matched[:DUR_ROWS_PER_INGREDIENT]
+
+    result = {}
+    for ingr, normalized in names.items():
+        matched = matching(ingr)
+        if not matched and normalized != ingr:
+            matched = matching(normalized)
+        result[ingr] = matched
+    if len(rows) >= DUR_BATCH_ROW_LIMIT:
+        return _refetch_truncated(result)
+    return result
 
 
 def check_mutual_contraindication(ingredients: list[str]) -> list[dict]:
     """검색된 약품들의 성분 간 상호 병용금지를 체크합니다."""
     if len(ingredients) < 2:
         return []
+    key = ("dur", "mutual", tuple(sorted(normalize_cache_keyword(i) for i in ingredients)))
+    return _cached(key, lambda: _check_mutual_contraindication(ingredients))
+
+
+def _check_mutual_contraindication(ingredients: list[str]) -> list[dict]:
+    """상호 병용금지 체크 본체 (캐시 미적용)."""
+    codes = [_lookup_dur_codes(ingr) for ingr in ingredients]
+    if all(c is not None for c in codes):
+        return _check_mutual_by_codes(codes)
+    if DUR_ENGINE == "matrix":
+        graph = get_dur_graph()
+        return get_dur_matrix().conflicts([graph.resolve_nodes(ingr) for ingr in ingredients])
+    if DUR_ENGINE == "graph":
+        return get_dur_graph().mutual(ingredients)
+    repository = get_repository()
+    if DUR_ENGINE == "rpc":
+        return repository.find_mutual_contraindications(ingredients)
 
     mutual_warnings = []
-    client = _get_client()
 
     # 성분 쌍을 순회하며 병용금지 관계 확인
     for i, ingr1 in enumerate(ingredients):
         for ingr2 in ingredients[i + 1 :]:
             # ingr1 → ingr2 방향 체크
-            res = (
-                client.table("dur")
-                .select("*")
-                .ilike("INGR_KOR_NAME", f"%{ingr1}%")
-                .ilike("MIXTURE_INGR_KOR_NAME", f"%{ingr2}%")
-                .eq("DEL_YN", False)
-                .limit(5)
-                .execute()
-            )
-            if res.data:
-                for row in res.data:
-                    mutual_warnings.append(
-                        {
-                            "drug1": _get_dur_field(row, "INGR_KOR_NAME"),
-                            "drug2": _get_dur_field(row, "MIXTURE_INGR_KOR_NAME"),
-                            "reason": _get_dur_field(row, "PROHBT_CONTENT"),
-                        }
-                    )
+            for row in repository.search_dur_pair(ingr1, ingr2, 5):
+                mutual_warnings.append(to_mutual_warning(row))
             # ingr2 → ingr1 방향 체크 (역방향)
-            res2 = (
-                client.table("dur")
-                .select("*")
-                .ilike("INGR_KOR_NAME", f"%{ingr2}%")
-                .ilike("MIXTURE_INGR_KOR_NAME", f"%{ingr1}%")
-                .eq("DEL_YN", False)
-                .limit(5)
-                .execute()
-            )
-            if res2.data:
-                for row in res2.data:
-                    mutual_warnings.append(
-                        {
-                            "drug1": _get_dur_field(row, "INGR_KOR_NAME"),
-                            "drug2": _get_dur_field(row, "MIXTURE_INGR_KOR_NAME"),
-                            "reason": _get_dur_field(row, "PROHBT_CONTENT"),
-                        }
-                    )
+            for row in repository.search_dur_pair(ingr2, ingr1, 5):
+                mutual_warnings.append(to_mutual_warning(row))
 
     return mutual_warnings
 
 
+def _check_mutual_by_codes(codes_per_ingredient: list[list[str]]) -> list[dict]:
+    """크로스워크 INGR_CODE 쌍(INGR_CODE ↔ MIXTURE_INGR_CODE)으로 상호 병용금지를 찾습니다."""
+    # 성분코드 → 해당 코드를 가진 성분 위치 집합
+    owners: dict[str, set[int]] = {}
+    for i, codes in enumerate(codes_per_ingredient):
+        for code in codes:
+            owners.setdefault(code, set()).add(i)
+    if sum(1 for codes in codes_per_ingredient if codes) < 2:
+        return []
+
+    if DUR_ENGINE == "matrix":
+        return get_dur_code_matrix().conflicts(codes_per_ingredient)
+
+    all_codes = list(owners)
+    if DUR_ENGINE == "graph":
+        rows = get_dur_graph().lookup_codes(all_codes)
+    else:
+        rows = _fetch_all_code_pairs(all_codes)
+
+    warnings = []
+    for row in rows:
+        idx1 = owners.get(get_dur_field(row, "INGR_CODE"))
+        idx2 = owners.get(get_dur_field(row, "MIXTURE_INGR_CODE"))
+        # 서로 다른 성분 위치에 속한 코드 쌍만 경고 (같은 성분 안의 코드끼리는 제외)
+        if idx1 and idx2 and len(idx1 | idx2) > 1:
+            warnings.append(to_mutual_warning(row))
+    return warnings
+
+
+def _fetch_all_code_pairs(codes: list[str]) -> list[dict]:
+    """코드 쌍 DUR 행을 DUR_BATCH_ROW_LIMIT건씩 id 순으로 끝까지 가져옵니다. (제한에 걸려 경고가 빠지지 않도록)"""
+    repository = get_repository()
+    rows = []
+    after_id = -1
+    while True:
+        page = repository.fetch_dur_code_pairs(codes, DUR_BATCH_ROW_LIMIT, after_id)
+        rows.extend(page)
+        if len(page) < DUR_BATCH_ROW_LIMIT:
+            return rows
+        after_id = int(page[-1]["id"])
+
+
 def format_dur_results(dur_data: dict[str, list[dict]]) -> str:
     """DUR 검색 결과를 LLM 컨텍스트용 텍스트로 포맷합니다."""
     if not dur_data:
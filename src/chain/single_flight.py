@@ -0,0 +1,60 @@
+"""동시 요청 합치기 (single-flight).
+
+같은 키로 동시에 들어온 호출 중 첫 번째만 실제로 실행하고,
+나머지는 실행 중인 Future를 기다려 같은 결과(또는 예외)를 받습니다.
+실행이 끝나면 키를 지우므로 결과를 보관하지는 않습니다. (보관은 RetrievalCache 담당)
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+
+class SingleFlight:
+    """키별 실행 중 Future를 공유하는 스레드 안전한 요청 합치기."""
+
+    def __init__(self):
+        self._inflight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """key로 실행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn()을 실행해 결과를 공유합니다."""
+        with self._lock:
+            self.calls += 1
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self) -> dict:
+        """전체 호출 수, 실제 실행 수, 합쳐진 호출 수를 반환합니다."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "inflight": len(self._inflight),
+                "coalesce_rate": self.coalesced / self.calls if self.calls else 0.0,
+            }
@@ -0,0 +1,110 @@
+"""일상어 → 의학 용어 확장 사전 (Aho-Corasick 자동자).
+
+분류기 프롬프트에서 예시로 가르치던 "까지다 → 열상" 같은 변환을
+로컬 사전으로 관리하고, 검색 전에 키워드를 결정적으로 재작성합니다.
+"""
+
+from collections import deque
+
+from src.chain.retriever import split_keywords
+
+# 의학 용어 → 일상 표현(활용형 포함) 목록
+LAY_TERM_DICTIONARY = {
+    "열상": ["까지다", "까진", "까졌", "까져", "찢어지", "찢어진", "찢어졌"],
+    "자상": ["베이다", "베인", "베였", "베여", "찔리", "찔린", "찔렸"],
+    "찰과상": ["긁히다", "긁힌", "긁혔", "긁혀", "쓸린", "쓸렸", "쓸려"],
+    "타박상": ["부딪히다", "부딪힌", "부딪혔", "부딪혀", "멍들", "멍이 들"],
+    "화상": ["데이다", "데인", "데였", "데었"],
+    "두통": ["머리가 아프", "머리 아프", "머리아프", "골이 아프", "머리가 지끈"],
+    "요통": ["허리가 아프", "허리 아프", "허리아프", "허리가 결리"],
+    "복통": ["배가 아프", "배 아프", "배아프", "배가 쑤시"],
+    "치통": ["이가 아프", "이빨이 아프", "치아가 아프", "이가 시리"],  # "아이가 아프"는 어절 시작 검사로 제외
+    "인후통": ["목이 아프", "목 아프", "목아프", "목이 따끔", "목이 칼칼"],
+    "근육통": ["알이 배", "알이 뱄", "담에 걸", "담 걸", "담이 걸"],
+    "소화불량": ["체했", "체한", "체하", "속이 더부룩", "더부룩"],
+    "속쓰림": ["속이 쓰리", "속이 쓰려", "속쓰려"],
+    "설사": ["배탈"],
+    "코막힘": ["코가 막히", "코가 막혀", "코막혀"],
+    "가려움": ["가렵", "가려워", "간지럽", "간지러"],
+    "여드름": ["뾰루지"],
+}
+
+
+class AhoCorasick:
+    """여러 패턴을 한 번의 텍스트 순회로 찾는 Aho-Corasick 자동자."""
+
+    def __init__(self, patterns: dict[str, str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 상태별 (패턴 길이, 값) 출력 목록
+        self._output: list[list[tuple[int, str]]] = [[]]
+
+        for pattern, value in patterns.items():
+            state = 0
+            for ch in pattern:
+                if ch not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][ch] = len(self._goto) - 1
+                state = self._goto[state][ch]
+            self._output[state].append((len(pattern), value))
+
+        # BFS로 실패 링크 구성
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def find_all(self, text: str) -> list[tuple[int, int, str]]:
+        """text에서 모든 패턴 매칭 (시작, 끝, 값) 목록을 반환합니다."""
+        matches = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for length, value in self._output[state]:
+                matches.append((i - length + 1, i + 1, value))
+        return matches
+
+    def find_longest(self, text: str, word_start: bool = False) -> list[tuple[int, int, str]]:
+        """겹치지 않는 매칭을 왼쪽부터, 같은 위치면 가장 긴 것 우선으로 반환합니다.
+
+        word_start=True면 어절 첫 글자에서 시작하는 매칭만 사용합니다. (예: "아이가 아프"의 "이가 아프" 제외)
+        """
+        selected = []
+        last_end = 0
+        for start, end, value in sorted(self.find_all(text), key=lambda m: (m[0], -m[1])):
+            if word_start and start > 0 and not text[start - 1].isspace():
+                continue
+            if start >= last_end:
+                selected.append((start, end, value))
+                last_end = end
+        return selected
+
+
+_automaton = AhoCorasick(
+    {lay: medical for medical, lays in LAY_TERM_DICTIONARY.items() for lay in lays}
+)
+
+
+def expand_keyword(keyword: str) -> str:
+    """키워드 속 일상 표현에 해당하는 의학 용어를 원래 키워드 뒤에 덧붙입니다.
+
+    예: "까진 상처" → "까진 상처, 열상", "체한 것 같고 두통" → "체한 것 같고 두통, 소화불량"
+    원래 키워드는 그대로 두므로 사전에 없는 증상(두통, 기침 등)도 계속 검색됩니다.
+    """
+    terms = split_keywords(keyword)
+    expansions = []
+    for term in terms:
+        for _, _, value in _automaton.find_longest(term, word_start=True):
+            if value not in terms and value not in expansions:
+                expansions.append(value)
+    return ", ".join(terms + expansions) if terms else keyword
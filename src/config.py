@@ -9,9 +9,18 @@ SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 SUPABASE_TABLE_NAME = os.getenv("SUPABASE_TABLE_NAME", "documents")
 SUPABASE_QUERY_NAME = os.getenv("SUPABASE_QUERY_NAME", "match_documents")
+# Postgres 직접 연결 문자열 (스키마 마이그레이션 CLI 전용, Supabase 대시보드의 Connection string)
+DATABASE_URL = os.getenv("DATABASE_URL")
+
 LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
 MC_DATA_API = os.getenv("MC_DATA_API")
 
+# Supabase HTTP Connection Pool (프로세스 공용 클라이언트의 httpx 연결 풀)
+SUPABASE_POOL_MAX_CONNECTIONS = 20
+SUPABASE_POOL_MAX_KEEPALIVE = 10
+SUPABASE_POOL_KEEPALIVE_EXPIRY = 30.0  # 유휴 연결 유지 시간(초)
+SUPABASE_HTTP_TIMEOUT = 120.0  # postgrest 기본값과 동일
+
 # Drug API 1 Configuration (e약은요)
 DRUG_API_BASE_URL = "http://apis.data.go.kr/1471000/DrbEasyDrugInfoService/getDrbEasyDrugList"
 DRUG_API_NUM_OF_ROWS = 100
@@ -19,6 +28,13 @@ DRUG_API_NUM_OF_ROWS = 100
 # Drug API 2 Configuration (허가정보)
 DRUG_APPROVAL_API_BASE_URL = "http://apis.data.go.kr/1471000/DrugPrdtPrmsnInfoService07/getDrugPrdtPrmsnDtlInq06"
 
+# Data Paths
+RAW_DATA_DIR = os.getenv("RAW_DATA_DIR", "data/raw")
+
+# Data Backend Configuration ("supabase": 원격, "sqlite": 로컬 파일 복제본, "memory": 프로세스 내)
+DATA_BACKEND = os.getenv("DATA_BACKEND", "supabase").lower()
+SQLITE_DB_PATH = os.getenv("SQLITE_DB_PATH", os.path.join(RAW_DATA_DIR, "drugs_replica.sqlite3"))
+
 # Embedding Configuration
 EMBEDDING_MODEL = "text-embedding-3-small"
 
@@ -33,6 +49,60 @@ LLM_TEMPERATURE = 0.0
 
 # Search Configuration
 SEARCH_LIMIT = 3
+SEARCH_CANDIDATE_POOL = 30  # 재정렬 전에 한 번의 쿼리로 가져올 후보 수
+SEARCH_TERM_QUOTA = 1  # 다중 키워드 검색 시 키워드별 최소 결과 수
+MAX_SEARCH_TERMS = 5  # 다중 키워드 검색 시 동시에 검색할 최대 키워드 수
+HYDRATION_CACHE_SIZE = 2000  # item_seq → drugs 전체 행 캐시 크기
+
+# Retrieval Cache Configuration (drugs/DUR 검색 결과 캐시)
+RETRIEVAL_CACHE_ENABLED = os.getenv("RETRIEVAL_CACHE_ENABLED", "true").lower() == "true"
+RETRIEVAL_CACHE_SIZE = 1024
+RETRIEVAL_CACHE_TTL = 600  # 초
+RETRIEVAL_CACHE_NEGATIVE_TTL = 60  # 결과 없는 키워드 캐시 유지 시간(초)
+# 같은 검색/DUR 조회/질문 분류가 동시에 들어오면 한 번만 실행하고 결과를 공유
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+# 적재가 다른 프로세스에서 실행되므로, 서빙 프로세스는 테이블 데이터 버전을 주기적으로 확인해 캐시/로컬 색인을 갱신
+LOCAL_INDEX_VERSION_CHECK_INTERVAL = 60  # 데이터 버전 확인 간격(초)
+LOCAL_INDEX_TTL = 3600  # 데이터 버전을 읽을 수 없을 때 캐시/로컬 색인을 다시 만드는 주기(초)
+
+# Local Retrieval Configuration (drugs 테이블 인메모리 스냅샷)
+LOCAL_SEARCH_ENABLED = os.getenv("LOCAL_SEARCH_ENABLED", "false").lower() == "true"
+NGRAM_SIZE = 2
+
+# BM25 Configuration (효능 검색 랭킹, 적재 파이프라인에서 RAW_DATA_DIR에 생성)
+BM25_SEARCH_ENABLED = os.getenv("BM25_SEARCH_ENABLED", "true").lower() == "true"
+BM25_INDEX_FILENAME = "efficacy_bm25.pkl"
+
+# Ingredient Index Configuration (성분명/코드 → item_seq, 적재 파이프라인에서 RAW_DATA_DIR에 생성)
+INGREDIENT_INDEX_FILENAME = "ingredient_index.json"
+INGREDIENT_CROSSWALK_FILENAME = "ingredient_crosswalk.json"  # drugs 성분 → DUR INGR_CODE
+
+# Fuzzy Product Name Configuration (제품명 검색 결과가 없을 때 오타 교정)
+FUZZY_SEARCH_ENABLED = os.getenv("FUZZY_SEARCH_ENABLED", "true").lower() == "true"
+FUZZY_MAX_EDIT_DISTANCE = 2  # 자모 단위 최대 편집 거리
+FUZZY_PREFIX_LENGTH = 10  # 삭제 사전을 만들 자모 접두 길이 (SymSpell prefix length)
+
+# Hybrid Retrieval Configuration ("lexical": drugs 검색만, "hybrid": drugs + 벡터 검색 RRF 병합)
+RETRIEVAL_MODE = os.getenv("RETRIEVAL_MODE", "lexical")
+HYBRID_VECTOR_K = 10
+HYBRID_RRF_K = 60
+
+# DUR Configuration ("remote": 데이터 백엔드(DATA_BACKEND) 조회, "graph": dur 테이블을 메모리 그래프로 로드,
+# "rpc": 상호 병용금지를 find_mutual_contraindications 함수 한 번으로 조회,
+# "matrix": graph와 같되 상호 병용금지를 불리언 충돌 행렬 부분 추출로 계산)
+DUR_ENGINE = os.getenv("DUR_ENGINE", "remote")
+DUR_BATCH_ROW_LIMIT = 1000  # 여러 성분을 한 번에 조회할 때 가져올 최대 행 수
+DUR_STAGE_WORKERS = 8  # 성분별 DUR 검색 / 상호 병용금지 체크를 동시에 실행하는 스레드 수
+# 단계별 최대 대기 시간(초, 단계 제출 시점부터 따로 계산), 초과 시 결과를 버리고 조회 불가 안내로 대체
+DUR_STAGE_TIMEOUT = 10.0  # 성분별 DUR 검색
+MUTUAL_STAGE_TIMEOUT = 10.0  # 상호 병용금지 체크
+# 시간 초과로 결과를 버렸지만 아직 실행 중인 단계가 이만큼 쌓이면 새 단계는 제출하지 않고 바로 시간 초과 처리
+DUR_STAGE_MAX_ABANDONED = DUR_STAGE_WORKERS // 2
+
+# Context Packing Configuration (답변 프롬프트 토큰 예산)
+CONTEXT_TOKEN_BUDGET = 3000  # 약품 검색 결과 컨텍스트
+DUR_CONTEXT_TOKEN_BUDGET = 1500  # 병용금지(DUR) 컨텍스트
+TOKEN_COUNT_CACHE_SIZE = 8192  # 필드 텍스트별 토큰 수 캐시 크기
 
 # LangSmith Tracing
 os.environ["LANGCHAIN_TRACING_V2"] = "true"
@@ -0,0 +1,146 @@
+"""drugs 주성분(M코드/성분명) → DUR 성분코드(INGR_CODE) 크로스워크.
+
+적재 시 1회 생성해 JSON으로 저장하고, 런타임 DUR 조회는 성분명 부분 일치(ILIKE) 대신
+이 표로 찾은 INGR_CODE 정확 일치 조회로 처리합니다.
+매칭 순서: 1) 공백 제거/소문자 성분명 정확 일치 → 2) 염/수화물 접미사를 제거한 이름 일치
+"""
+
+from src.chain.dur_graph import is_deleted_row
+from src.data.preprocessor import (
+    BARE_ANION_NAMES,
+    CATION_SUFFIXES,
+    SALT_SUFFIXES,
+    normalize_ingredient_key,
+    parse_main_item_ingr,
+)
+
+# 2: 양이온 접미사를 음이온만 남는 무기염에서는 제거하지 않음 (염화칼륨/염화나트륨 충돌 수정)
+CROSSWALK_VERSION = 2
+
+MATCH_EXACT = "exact"
+MATCH_NORMALIZED = "normalized"
+MATCH_NONE = "none"
+
+
+def _strip_suffix(key: str) -> str | None:
+    """key 끝의 염/수화물/양이온 접미사 하나를 제거한 이름을 반환합니다. (제거할 것이 없으면 None)"""
+    for suffix in SALT_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            return key[: -len(suffix)]
+    for suffix in CATION_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            parent = key[: -len(suffix)]
+            # 염화칼륨 → "염화"처럼 음이온만 남으면 서로 다른 염이 같은 키로 합쳐지므로 유지
+            if parent not in BARE_ANION_NAMES:
+                return parent
+    return None
+
+
+def canonical_ingredient_name(name: str) -> str:
+    """성분명에서 염/수화물 접미사를 모두 제거한 크로스워크 비교 키를 반환합니다.
+
+    예: "슈도에페드린염산염수화물" → "슈도에페드린", "디클로페낙나트륨" → "디클로페낙",
+        "염화칼륨" → "염화칼륨" (무기염은 양이온을 떼지 않음)
+    """
+    key = normalize_ingredient_key(name)
+    while (stripped := _strip_suffix(key)) is not None:
+        key = stripped
+    return key
+
+
+def _dur_code_maps(dur_rows: list[dict]) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    """DUR 성분명(주성분/병용성분 모두) → INGR_CODE 목록 맵 (정확/정규화 키)을 만듭니다."""
+    exact = {}
+    canonical = {}
+    for row in dur_rows:
+        for code_field, name_field in (
+            ("INGR_CODE", "INGR_KOR_NAME"),
+            ("MIXTURE_INGR_CODE", "MIXTURE_INGR_KOR_NAME"),
+        ):
+            code = (row.get(code_field) or "").strip()
+            name = row.get(name_field) or ""
+            if not code or not name:
+                continue
+            for key, mapping in ((normalize_ingredient_key(name), exact), (canonical_ingredient_name(name), canonical)):
+                codes = mapping.setdefault(key, [])
+                if code not in codes:
+                    codes.append(code)
+    return exact, canonical
+
+
+def build_ingredient_crosswalk(drug_rows: list[dict], dur_rows: list[dict]) -> dict:
+    """drugs 주성분과 DUR INGR_CODE의 크로스워크를 생성합니다.
+
+    반환 형식:
+        {"version": 2,
+         "by_name": {성분명 키: [INGR_CODE, ...]},   # 매칭 실패 성분은 빈 목록
+         "by_code": {M코드: [INGR_CODE, ...]},
+         "match": {성분명 키: "exact" | "normalized" | "none"}}
+    """
+    exact, canonical = _dur_code_maps(dur_rows)
+    by_name = {}
+    by_code = {}
+    match = {}
+    for row in drug_rows:
+        ingredients = row.get("main_ingredients")
+        if ingredients is None:
+            ingredients = parse_main_item_ingr(row.get("main_item_ingr"))
+        for ingr in ingredients:
+            key = normalize_ingredient_key(ingr["name"])
+            if key not in by_name:
+                if key in exact:
+                    by_name[key], match[key] = exact[key], MATCH_EXACT
+                elif canonical_ingredient_name(key) in canonical:
+                    by_name[key], match[key] = canonical[canonical_ingredient_name(key)], MATCH_NORMALIZED
+                else:
+                    by_name[key], match[key] = [], MATCH_NONE
+            if ingr["code"]:
+                codes = by_code.setdefault(ingr["code"].upper(), [])
+                for code in by_name[key]:
+                    if code not in codes:
+                        codes.append(code)
+    return {"version": CROSSWALK_VERSION, "by_name": by_name, "by_code": by_code, "match": match}
+
+
+def crosswalk_stats(crosswalk: dict) -> dict[str, int]:
+    """매칭 종류별 성분 수를 반환합니다."""
+    stats = {MATCH_EXACT: 0, MATCH_NORMALIZED: 0, MATCH_NONE: 0}
+    for kind in crosswalk["match"].values():
+        stats[kind] += 1
+    return stats
+
+
+def build_dur_summaries(drug_rows: list[dict], dur_rows: list[dict], crosswalk: dict, limit: int) -> dict[str, dict]:
+    """크로스워크로 drugs와 dur을 조인해 item_seq → {성분명: [병용금지 행]} 요약을 만듭니다.
+
+    병용금지 행은 컨텍스트 포맷에 필요한 컬럼만 남기고, 성분당 limit개까지 id 순으로 담습니다.
+    병용금지 정보가 없는 성분은 요약에서 제외합니다.
+    """
+    rows_by_code = {}
+    for row in sorted(dur_rows, key=lambda r: r.get("id") or 0):
+        code = (row.get("INGR_CODE") or "").strip()
+        # 삭제된 행(DEL_YN) 제외
+        if not code or is_deleted_row(row):
+            continue
+        rows_by_code.setdefault(code, []).append(
+            {
+                "INGR_CODE": code,
+                "MIXTURE_INGR_CODE": row.get("MIXTURE_INGR_CODE") or "",
+                "MIXTURE_INGR_KOR_NAME": row.get("MIXTURE_INGR_KOR_NAME") or "",
+                "PROHBT_CONTENT": row.get("PROHBT_CONTENT") or "",
+            }
+        )
+
+    summaries = {}
+    for row in drug_rows:
+        ingredients = row.get("main_ingredients")
+        if ingredients is None:
+            ingredients = parse_main_item_ingr(row.get("main_item_ingr"))
+        summary = {}
+        for ingr in ingredients:
+            codes = crosswalk["by_name"].get(normalize_ingredient_key(ingr["name"]), [])
+            matched = [dur for code in codes for dur in rows_by_code.get(code, ())][:limit]
+            if matched and ingr["name"] not in summary:
+                summary[ingr["name"]] = matched
+        summaries[str(row.get("item_seq", ""))] = summary
+    return summaries
@@ -0,0 +1,101 @@
+"""증분 동기화: 레코드 지문(해시) 비교로 신규/변경/삭제 레코드만 골라냅니다.
+
+이전 동기화 때 저장한 {키: 지문} 상태 파일과 이번 원본을 비교해
+신규·변경 레코드만 upsert하고, 원본에서 사라진 키는 DEL_YN으로 소프트 삭제합니다.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable
+
+SYNC_STATE_VERSION = 1
+
+
+def record_fingerprint(record: dict, columns: list[str]) -> str:
+    """columns 값으로 레코드 지문(SHA-1)을 계산합니다."""
+    values = [record.get(col) for col in columns]
+    payload = json.dumps(values, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def load_sync_state(path: str) -> dict[str, str]:
+    """저장된 {키: 지문} 상태를 읽습니다. 파일이 없으면 빈 상태(전체 신규)입니다."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != SYNC_STATE_VERSION:
+        return {}
+    return state["fingerprints"]
+
+
+def save_sync_state(path: str, fingerprints: dict[str, str]) -> None:
+    """{키: 지문} 상태를 저장합니다. (업로드가 끝난 뒤 호출)"""
+    state_dir = os.path.dirname(path)
+    if state_dir:
+        os.makedirs(state_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": SYNC_STATE_VERSION, "fingerprints": fingerprints}, f, ensure_ascii=False)
+
+
+def compute_delta(
+    records: list[dict],
+    key_fn: Callable[[dict], str],
+    columns: list[str],
+    previous: dict[str, str],
+) -> dict:
+    """이전 상태와 비교한 변경분을 반환합니다.
+
+    반환 형식: {"new": [레코드], "changed": [레코드], "deleted": [키],
+               "unchanged": 건수, "fingerprints": 이번 동기화 후 상태}
+    """
+    # 같은 키가 여러 번 나오면 마지막 레코드 기준 (upsert 결과와 동일)
+    latest = {key_fn(record): record for record in records}
+    fingerprints = {}
+    new, changed = [], []
+    unchanged = 0
+    for key, record in latest.items():
+        fingerprint = record_fingerprint(record, columns)
+        fingerprints[key] = fingerprint
+        old = previous.get(key)
+        if old is None:
+            new.append(record)
+        elif old != fingerprint:
+            changed.append(record)
+        else:
+            unchanged += 1
+    deleted = [key for key in previous if key not in fingerprints]
+    return {
+        "new": new,
+        "changed": changed,
+        "deleted": deleted,
+        "unchanged": unchanged,
+        "fingerprints": fingerprints,
+    }
+
+
+def find_conflicting_keys(
+    records: list[dict],
+    key_fn: Callable[[dict], str],
+    columns: list[str],
+) -> dict[str, int]:
+    """같은 키에 내용(지문)이 다른 레코드가 여러 개인 키와 그 레코드 수를 반환합니다.
+
+    내용까지 같은 중복은 하나로 합쳐도 결과가 같으므로 제외합니다.
+    """
+    seen: dict[str, set[str]] = {}
+    counts: dict[str, int] = {}
+    for record in records:
+        key = key_fn(record)
+        seen.setdefault(key, set()).add(record_fingerprint(record, columns))
+        counts[key] = counts.get(key, 0) + 1
+    return {key: counts[key] for key, fingerprints in seen.items() if len(fingerprints) > 1}
+
+
+def format_delta(delta: dict) -> str:
+    """변경분 요약 문자열을 반환합니다."""
+    return (
+        f"신규 {len(delta['new'])}건 / 변경 {len(delta['changed'])}건 / "
+        f"삭제 {len(delta['deleted'])}건 / 변경 없음 {delta['unchanged']}건"
+    )
@@ -1,3 +1,4 @@
+import html
 import re
 from typing import Optional
 
@@ -29,6 +30,114 @@ APPROVAL_FIELD_LABELS = {
     "RARE_DRUG_YN": "희귀의약품 여부",
 }
 
+# drugs 테이블 컬럼 → LLM 컨텍스트 라벨 (출력 순서)
+DRUG_CONTEXT_LABELS = {
+    "item_name": "제품명",
+    "entp_name": "업체명",
+    "item_seq": "품목기준코드",
+    "main_item_ingr": "주성분",
+    "chart": "성상",
+    "spclty_pblc": "전문/일반",
+    "item_permit_date": "허가일자",
+    "efcy_qesitm": "효능",
+    "use_method_qesitm": "사용법",
+    "atpn_warn_qesitm": "주의사항 경고",
+    "atpn_qesitm": "주의사항",
+    "intrc_qesitm": "상호작용",
+    "se_qesitm": "부작용",
+    "deposit_method_qesitm": "보관법",
+    "storage_method": "저장방법",
+    "valid_term": "유효기간",
+}
+
+
+def parse_main_item_ingr(value: Optional[str]) -> list[dict]:
+    """main_item_ingr 문자열을 성분 코드/이름 목록으로 파싱합니다.
+
+    예: "[M040548]창출|[M223204]아세트아미노펜(500mg)"
+        → [{"code": "M040548", "name": "창출"}, {"code": "M223204", "name": "아세트아미노펜"}]
+    """
+    ingredients = []
+    for part in (value or "").split("|"):
+        cleaned = part.strip()
+        code = ""
+        # [코드] 접두사 분리
+        if cleaned.startswith("[") and "]" in cleaned:
+            code, cleaned = cleaned[1:].split("]", 1)
+            code, cleaned = code.strip(), cleaned.strip()
+        # 괄호 안 함량 정보 제거 (예: "아세트아미노펜(500mg)" → "아세트아미노펜")
+        if "(" in cleaned:
+            cleaned = cleaned.split("(")[0].strip()
+        if cleaned:
+            ingredients.append({"code": code, "name": cleaned})
+    return ingredients
+
+
+def normalize_ingredient_key(name: str) -> str:
+    """성분 색인 키: 공백 제거 + 소문자."""
+    return re.sub(r"\s+", "", name or "").lower()
+
+
+# 성분명 염/수화물 접미사 (긴 것부터 처리)
+SALT_SUFFIXES = sorted(
+    [
+        "염산염수화물", "브롬화수소산염수화물", "오로트산염수화물",
+        "염산염", "황산염", "질산염", "인산염", "아세트산염", "말레산염", "푸마르산염",
+        "타르타르산염", "메실산염", "베실산염", "시트르산염", "브롬화수소산염", "오로트산염",
+        "수화물", "일수화물", "이수화물", "삼수화물", "무수물",
+    ],
+    key=len,
+    reverse=True,
+)
+
+# 양이온 접미사: "디클로페낙나트륨"처럼 모화합물 뒤에 붙은 경우에만 제거
+CATION_SUFFIXES = ["마그네슘", "나트륨", "칼륨", "칼슘"]
+
+# 양이온을 떼면 음이온만 남는 무기염 (염화칼륨 ≠ 염화나트륨이므로 양이온을 제거하지 않음)
+BARE_ANION_NAMES = {
+    "염화", "브롬화", "요오드화", "불화", "산화", "수산화",
+    "탄산", "탄산수소", "황산", "질산", "인산", "인산수소", "인산이수소",
+    "아세트산", "시트르산", "구연산", "글루콘산", "락트산", "젖산",
+}
+
+
+def normalize_ingredient_name(name: str) -> str:
+    """성분명에서 접미사를 제거하여 핵심 이름만 추출합니다.
+
+    예: "슈도에페드린염산염" → "슈도에페드린"
+        "겐타마이신황산염" → "겐타마이신"
+    """
+    normalized = name
+    for suffix in SALT_SUFFIXES:
+        if normalized.endswith(suffix):
+            normalized = normalized[: -len(suffix)]
+            break
+    return normalized
+
+
+def build_ingredient_index(drug_rows: list[dict]) -> dict[str, dict[str, list[str]]]:
+    """성분명/성분코드 → item_seq 역색인을 생성합니다.
+
+    반환 형식: {"by_name": {성분명: [item_seq, ...]}, "by_code": {성분코드: [item_seq, ...]}}
+    """
+    by_name = {}
+    by_code = {}
+    for row in drug_rows:
+        item_seq = str(row.get("item_seq", ""))
+        ingredients = row.get("main_ingredients")
+        if ingredients is None:
+            ingredients = parse_main_item_ingr(row.get("main_item_ingr"))
+        for ingr in ingredients:
+            name_key = normalize_ingredient_key(ingr["name"])
+            seqs = by_name.setdefault(name_key, [])
+            if item_seq not in seqs:
+                seqs.append(item_seq)
+            if ingr["code"]:
+                seqs = by_code.setdefault(ingr["code"].upper(), [])
+                if item_seq not in seqs:
+                    seqs.append(item_seq)
+    return {"by_name": by_name, "by_code": by_code}
+
 
 def clean_text(text: Optional[str]) -> str:
     """텍스트 필드를 정제합니다: HTML 태그 제거, 공백 정규화."""
@@ -40,6 +149,24 @@ def clean_text(text: Optional[str]) -> str:
     return text
 
 
+def clean_context_value(value) -> str:
+    """LLM 컨텍스트용 값 정제: HTML 태그, 마크다운 취소선(~~텍스트~~), HTML 엔티티 제거."""
+    text = clean_text(value)
+    text = re.sub(r"~~[^~]+~~", "", text)
+    text = html.unescape(text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def render_drug_context(row: dict) -> tuple[dict[str, str], str]:
+    """drugs 행 1건을 필드별 "[라벨] 값" 블록과 전체 컨텍스트 텍스트로 렌더링합니다."""
+    fields = {}
+    for key, label in DRUG_CONTEXT_LABELS.items():
+        value = clean_context_value(row.get(key))
+        if value:
+            fields[key] = f"[{label}] {value}"
+    return fields, "\n".join(fields.values())
+
+
 def merge_api1_api2(api1_items: list[dict], api2_items: list[dict]) -> list[dict]:
     """API 1(e약은요)과 API 2(허가정보)를 item_seq 기준으로 LEFT JOIN 병합합니다.
 
@@ -201,6 +328,8 @@ def prepare_drugs_for_db(merged_items: list[dict]) -> list[dict]:
             "item_eng_name": api2.get("ITEM_ENG_NAME") or "",
             "chart": clean_text(api2.get("CHART")),
             "main_item_ingr": clean_text(api2.get("MAIN_ITEM_INGR")),
+            # main_item_ingr을 적재 시 1회만 파싱 (jsonb: [{"code", "name"}, ...])
+            "main_ingredients": parse_main_item_ingr(clean_text(api2.get("MAIN_ITEM_INGR"))),
             "ingr_name": clean_text(api2.get("INGR_NAME")),
             "pack_unit": clean_text(api2.get("PACK_UNIT")),
             "storage_method": clean_text(api2.get("STORAGE_METHOD")),
@@ -215,6 +344,8 @@ def prepare_drugs_for_db(merged_items: list[dict]) -> list[dict]:
             "cancel_name": api2.get("CANCEL_NAME") or "",
         }
         if row["item_seq"]:
+            # LLM 컨텍스트를 적재 시 미리 렌더링 (검색 시 정제/포맷 작업 생략)
+            row["context_fields"], row["context_block"] = render_drug_context(row)
             rows.append(row)
     return rows
 
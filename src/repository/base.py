@@ -0,0 +1,107 @@
+"""drugs / dur 데이터 접근 인터페이스 (리포지토리).
+
+검색기와 적재 코드는 Supabase 쿼리 빌더 대신 이 인터페이스를 사용합니다.
+구현: Supabase(원격), SQLite(로컬 파일 복제본), 메모리(프로세스 내) — DATA_BACKEND로 선택합니다.
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+
+# 테이블별 기본 키 (upsert / 소프트 삭제 기준)
+TABLE_KEYS = {"drugs": "item_seq", "dur": "id"}
+
+UPSERT_BATCH_SIZE = 500
+
+
+class DrugRepository(ABC):
+    """drugs 검색, DUR 조회, 대량 upsert를 제공하는 데이터 접근 계층."""
+
+    name = "base"
+
+    # ── 조회 ──
+
+    @abstractmethod
+    def fetch_all(self, table: str, columns: str = "*", order: str = "item_seq") -> list[dict]:
+        """테이블 전체 행을 order 순으로 반환합니다. (columns: 콤마 구분 컬럼 목록 또는 "*")"""
+
+    @abstractmethod
+    def fetch_drugs_by_seq(self, item_seqs: list[str]) -> list[dict]:
+        """item_seq 목록의 drugs 전체 행을 반환합니다. (순서 무관)"""
+
+    @abstractmethod
+    def search_drugs(self, column: str, keyword: str, columns: list[str], limit: int) -> list[dict]:
+        """column에 keyword가 포함된(대소문자 무시) drugs 행을 columns만 담아 최대 limit개 반환합니다."""
+
+    @abstractmethod
+    def fetch_dur_by_codes(self, codes: list[str], limit: int) -> list[dict]:
+        """INGR_CODE가 codes에 속하는 유효(DEL_YN = FALSE) DUR 행을 id 순으로 반환합니다."""
+
+    @abstractmethod
+    def fetch_dur_code_pairs(self, codes: list[str], limit: int, after_id: int = -1) -> list[dict]:
+        """INGR_CODE와 MIXTURE_INGR_CODE가 모두 codes에 속하는 유효 DUR 행을 id 순으로 반환합니다.
+
+        after_id보다 id가 큰 행부터 반환하므로, 결과가 limit건이면 마지막 id로 다음 페이지를 이어서 조회합니다.
+        """
+
+    @abstractmethod
+    def search_dur_by_names(self, names: list[str], limit: int) -> list[dict]:
+        """INGR_KOR_NAME에 names 중 하나라도 포함된 유효 DUR 행을 반환합니다."""
+
+    @abstractmethod
+    def search_dur_pair(self, ingredient: str, mixture: str, limit: int) -> list[dict]:
+        """INGR_KOR_NAME에 ingredient, MIXTURE_INGR_KOR_NAME에 mixture가 포함된 유효 DUR 행을 반환합니다."""
+
+    @abstractmethod
+    def find_mutual_contraindications(self, ingredients: list[str]) -> list[dict]:
+        """성분 목록의 모든 순서쌍(i ≠ j) 병용금지 경고를 id 순, 중복 없이 반환합니다."""
+
+    def search_dur_by_name(self, name: str, limit: int) -> list[dict]:
+        """INGR_KOR_NAME에 name이 포함된 유효 DUR 행을 반환합니다."""
+        return self.search_dur_by_names([name], limit)
+
+    # ── 쓰기 ──
+
+    @abstractmethod
+    def _upsert_batch(self, table: str, key: str, rows: list[dict]) -> None:
+        """한 배치를 key 기준으로 upsert합니다."""
+
+    @abstractmethod
+    def _soft_delete(self, table: str, keys: list) -> int:
+        """기본 키가 keys인 행을 DEL_YN = TRUE로 표시하고 건수를 반환합니다."""
+
+    def upsert_rows(self, table: str, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """행 목록을 배치 단위로 upsert하고 건수를 반환합니다."""
+        key = TABLE_KEYS[table]
+        total_batches = (len(rows) + batch_size - 1) // batch_size
+        for i in range(0, len(rows), batch_size):
+            batch = rows[i : i + batch_size]
+            print(f"  {table} 배치 {i // batch_size + 1}/{total_batches} upsert 중 ({len(batch)}건, {self.name})...")
+            self._upsert_batch(table, key, batch)
+        print(f"  {table} 테이블 업로드 완료: {len(rows)}건 ({self.name})")
+        if rows:
+            self.bump_data_version(table)
+        return len(rows)
+
+    def soft_delete(self, table: str, keys: list) -> int:
+        """기본 키가 keys인 행을 DEL_YN = TRUE로 표시하고 건수를 반환합니다."""
+        count = self._soft_delete(table, keys)
+        if keys:
+            self.bump_data_version(table)
+        return count
+
+    # ── 데이터 버전 ──
+    # 쓰기마다 테이블 버전을 새 값으로 바꿔, 다른 프로세스(서빙 노드)가 로컬 색인 갱신 시점을 알 수 있게 합니다.
+
+    @abstractmethod
+    def data_version(self, table: str) -> str | None:
+        """table의 현재 데이터 버전을 반환합니다. (기록이 없거나 읽을 수 없으면 None)"""
+
+    @abstractmethod
+    def _set_data_version(self, table: str, version: str) -> None:
+        """table의 데이터 버전을 기록합니다."""
+
+    def bump_data_version(self, table: str) -> str:
+        """table의 데이터 버전을 새 값으로 바꾸고 반환합니다."""
+        version = uuid.uuid4().hex
+        self._set_data_version(table, version)
+        return version
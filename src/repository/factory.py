@@ -0,0 +1,40 @@
+"""DATA_BACKEND 설정에 따른 프로세스 공용 리포지토리."""
+
+import threading
+
+from src.config import DATA_BACKEND, SQLITE_DB_PATH
+from src.repository.base import DrugRepository
+from src.repository.memory_repository import MemoryRepository
+from src.repository.sqlite_repository import SQLiteRepository
+from src.repository.supabase_repository import SupabaseRepository
+
+_repository: DrugRepository | None = None
+_repository_lock = threading.Lock()
+
+
+def create_repository(backend: str = DATA_BACKEND) -> DrugRepository:
+    """backend("supabase" | "sqlite" | "memory") 리포지토리를 새로 만듭니다."""
+    if backend == "supabase":
+        return SupabaseRepository()
+    if backend == "sqlite":
+        return SQLiteRepository(SQLITE_DB_PATH)
+    if backend == "memory":
+        return MemoryRepository()
+    raise ValueError(f"알 수 없는 DATA_BACKEND입니다: {backend}")
+
+
+def get_repository() -> DrugRepository:
+    """DATA_BACKEND 리포지토리를 최초 1회만 생성하여 반환합니다."""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = create_repository()
+    return _repository
+
+
+def set_repository(repository: DrugRepository | None) -> None:
+    """공용 리포지토리를 교체합니다. (None이면 다음 호출 시 DATA_BACKEND로 다시 생성)"""
+    global _repository
+    with _repository_lock:
+        _repository = repository
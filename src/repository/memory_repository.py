@@ -0,0 +1,125 @@
+"""프로세스 내 메모리 리포지토리 (오프라인 벤치마크/개발용, 프로세스 종료 시 사라짐)."""
+
+import threading
+
+from src.chain.dur_graph import get_dur_field, is_deleted_row, to_mutual_warning
+from src.repository.base import TABLE_KEYS, DrugRepository
+
+
+def _contains(value, term: str) -> bool:
+    """ILIKE '%term%'와 같은 대소문자 무시 부분 일치."""
+    return term.lower() in str(value or "").lower()
+
+
+def _project(row: dict, columns) -> dict:
+    if columns == "*":
+        return dict(row)
+    if isinstance(columns, str):
+        columns = [col.strip() for col in columns.split(",")]
+    return {col: row.get(col) for col in columns}
+
+
+def _sort_key(order: str):
+    # None 값은 뒤로 (PostgREST order 기본값과 동일)
+    return lambda row: (row.get(order) is None, row.get(order))
+
+
+class MemoryRepository(DrugRepository):
+    """테이블별 {기본 키: 행} dict로 데이터를 보관합니다. 반환 행은 복사본입니다."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._tables: dict[str, dict[str, dict]] = {table: {} for table in TABLE_KEYS}
+        self._versions: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _rows(self, table: str) -> list[dict]:
+        with self._lock:
+            return list(self._tables[table].values())
+
+    def _active_dur(self) -> list[dict]:
+        return sorted((row for row in self._rows("dur") if not is_deleted_row(row)), key=_sort_key("id"))
+
+    def fetch_all(self, table: str, columns: str = "*", order: str = "item_seq") -> list[dict]:
+        return [_project(row, columns) for row in sorted(self._rows(table), key=_sort_key(order))]
+
+    def fetch_drugs_by_seq(self, item_seqs: list[str]) -> list[dict]:
+        with self._lock:
+            drugs = self._tables["drugs"]
+            return [dict(drugs[seq]) for seq in map(str, item_seqs) if seq in drugs]
+
+    def search_drugs(self, column: str, keyword: str, columns: list[str], limit: int) -> list[dict]:
+        matched = (row for row in self._rows("drugs") if _contains(row.get(column), keyword))
+        return [_project(row, columns) for _, row in zip(range(limit), matched)]
+
+    def fetch_dur_by_codes(self, codes: list[str], limit: int) -> list[dict]:
+        code_set = set(codes)
+        rows = [row for row in self._active_dur() if get_dur_field(row, "INGR_CODE") in code_set]
+        return [dict(row) for row in rows[:limit]]
+
+    def fetch_dur_code_pairs(self, codes: list[str], limit: int, after_id: int = -1) -> list[dict]:
+        code_set = set(codes)
+        rows = [
+            row
+            for row in self._active_dur()
+            if int(row["id"]) > after_id
+            and get_dur_field(row, "INGR_CODE") in code_set
+            and get_dur_field(row, "MIXTURE_INGR_CODE") in code_set
+        ]
+        return [dict(row) for row in rows[:limit]]
+
+    def search_dur_by_names(self, names: list[str], limit: int) -> list[dict]:
+        rows = [
+            row
+            for row in self._active_dur()
+            if any(_contains(get_dur_field(row, "INGR_KOR_NAME"), name) for name in names)
+        ]
+        return [dict(row) for row in rows[:limit]]
+
+    def search_dur_pair(self, ingredient: str, mixture: str, limit: int) -> list[dict]:
+        rows = [
+            row
+            for row in self._active_dur()
+            if _contains(get_dur_field(row, "INGR_KOR_NAME"), ingredient)
+            and _contains(get_dur_field(row, "MIXTURE_INGR_KOR_NAME"), mixture)
+        ]
+        return [dict(row) for row in rows[:limit]]
+
+    def find_mutual_contraindications(self, ingredients: list[str]) -> list[dict]:
+        warnings = []
+        for row in self._active_dur():
+            ingr_name = get_dur_field(row, "INGR_KOR_NAME")
+            mixture_name = get_dur_field(row, "MIXTURE_INGR_KOR_NAME")
+            if any(
+                _contains(ingr_name, a) and _contains(mixture_name, b)
+                for i, a in enumerate(ingredients)
+                for j, b in enumerate(ingredients)
+                if i != j
+            ):
+                warnings.append(to_mutual_warning(row))
+        return warnings
+
+    def _upsert_batch(self, table: str, key: str, rows: list[dict]) -> None:
+        with self._lock:
+            stored = self._tables[table]
+            for row in rows:
+                stored[str(row[key])] = dict(row)
+
+    def _soft_delete(self, table: str, keys: list) -> int:
+        count = 0
+        with self._lock:
+            stored = self._tables[table]
+            for key in map(str, keys):
+                if key in stored:
+                    stored[key] = {**stored[key], "DEL_YN": True}
+                    count += 1
+        return count
+
+    def data_version(self, table: str) -> str | None:
+        with self._lock:
+            return self._versions.get(table)
+
+    def _set_data_version(self, table: str, version: str) -> None:
+        with self._lock:
+            self._versions[table] = version
@@ -0,0 +1,210 @@
+"""Postgres(Supabase) 스키마 마이그레이션.
+
+번호 순서대로 적용하고 schema_migrations 테이블에 적용 기록을 남깁니다.
+모든 SQL은 IF NOT EXISTS / OR REPLACE로 작성해 이미 수동으로 적용한 DB에 다시 실행해도 안전합니다.
+적용: scripts/migrate_supabase.py apply (DATABASE_URL 필요) 또는 print 출력을 Supabase SQL Editor에서 실행
+
+함수 인자 conn은 DB-API 2.0 연결(psycopg2 등)입니다.
+"""
+
+import json
+
+from src.chain.dur_sql import MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL
+
+MIGRATIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    id TEXT PRIMARY KEY,
+    applied_at TIMESTAMPTZ DEFAULT NOW()
+);
+"""
+
+DUR_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS dur (
+    id BIGINT PRIMARY KEY,
+    "TYPE_NAME" TEXT,
+    "MIX_TYPE" TEXT,
+    "INGR_CODE" TEXT,
+    "INGR_ENG_NAME" TEXT,
+    "INGR_KOR_NAME" TEXT,
+    "MIX" TEXT,
+    "ORI" TEXT,
+    "CLASS" TEXT,
+    "MIXTURE_MIX_TYPE" TEXT,
+    "MIXTURE_INGR_CODE" TEXT,
+    "MIXTURE_INGR_ENG_NAME" TEXT,
+    "MIXTURE_INGR_KOR_NAME" TEXT,
+    "MIXTURE_MIX" TEXT,
+    "MIXTURE_ORI" TEXT,
+    "MIXTURE_CLASS" TEXT,
+    "NOTIFICATION_DATE" TIMESTAMPTZ,
+    "PROHBT_CONTENT" TEXT,
+    "REMARK" TEXT,
+    "DEL_YN" BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 검색 성능을 위한 인덱스
+CREATE INDEX IF NOT EXISTS idx_dur_ingr_kor_name ON dur ("INGR_KOR_NAME");
+CREATE INDEX IF NOT EXISTS idx_dur_mixture_ingr_kor_name ON dur ("MIXTURE_INGR_KOR_NAME");
+CREATE INDEX IF NOT EXISTS idx_dur_del_yn ON dur ("DEL_YN");
+"""
+
+# drugs 테이블 추가 컬럼 (prepare_drugs_for_db가 생성)
+DRUGS_EXTRA_COLUMNS_SQL = """
+ALTER TABLE drugs ADD COLUMN IF NOT EXISTS main_ingredients JSONB;
+ALTER TABLE drugs ADD COLUMN IF NOT EXISTS context_fields JSONB;
+ALTER TABLE drugs ADD COLUMN IF NOT EXISTS context_block TEXT;
+ALTER TABLE drugs ADD COLUMN IF NOT EXISTS dur_summary JSONB;
+ALTER TABLE drugs ADD COLUMN IF NOT EXISTS dur_context TEXT;
+"""
+
+# 검색기의 ILIKE '%키워드%' 대상 컬럼 trigram GIN 인덱스: (인덱스 이름, 테이블, 컬럼)
+# 선행 와일드카드 ILIKE는 B-tree 인덱스를 쓰지 못해 순차 스캔이 됩니다.
+# (3글자 미만 키워드는 trigram을 만들 수 없어 인덱스 효과가 없습니다)
+TRGM_INDEXES = [
+    ("idx_dur_ingr_kor_name_trgm", "dur", "INGR_KOR_NAME"),
+    ("idx_dur_mixture_ingr_kor_name_trgm", "dur", "MIXTURE_INGR_KOR_NAME"),
+    ("idx_drugs_item_name_trgm", "drugs", "item_name"),
+    ("idx_drugs_main_item_ingr_trgm", "drugs", "main_item_ingr"),
+    ("idx_drugs_efcy_qesitm_trgm", "drugs", "efcy_qesitm"),
+]
+
+
+def trgm_index_sql(name: str, table: str, column: str) -> str:
+    """trigram GIN 인덱스 생성 SQL을 반환합니다."""
+    return f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ("{column}" gin_trgm_ops);'
+
+
+TRGM_INDEXES_SQL = "\n".join(
+    ["CREATE EXTENSION IF NOT EXISTS pg_trgm;"] + [trgm_index_sql(*index) for index in TRGM_INDEXES]
+)
+
+# 크로스워크 INGR_CODE 정확 일치 조회용 B-tree 인덱스
+DUR_CODE_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_dur_ingr_code ON dur ("INGR_CODE");
+CREATE INDEX IF NOT EXISTS idx_dur_mixture_ingr_code ON dur ("MIXTURE_INGR_CODE");
+"""
+
+# 테이블별 데이터 버전 (리포지토리가 쓰기마다 갱신, 서빙 프로세스의 로컬 색인 갱신 판단용)
+DATA_VERSIONS_SQL = """
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+"""
+
+# (id, 설명, SQL) — 적용 순서대로, 이미 배포된 항목은 수정하지 말고 새 항목을 추가합니다.
+MIGRATIONS = [
+    ("001_dur_table", "dur 테이블 생성", DUR_TABLE_SQL),
+    ("002_drugs_extra_columns", "drugs 전처리/DUR 요약 컬럼 추가", DRUGS_EXTRA_COLUMNS_SQL),
+    ("003_mutual_contraindications_rpc", "상호 병용금지 RPC 함수 (DUR_ENGINE=rpc)", MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL),
+    ("004_trgm_indexes", "ILIKE 부분 일치 검색 컬럼 pg_trgm GIN 인덱스", TRGM_INDEXES_SQL),
+    ("005_dur_code_indexes", "DUR 성분코드 B-tree 인덱스", DUR_CODE_INDEXES_SQL),
+    ("006_data_versions", "테이블별 데이터 버전", DATA_VERSIONS_SQL),
+    ("007_mutual_contraindications_rpc_escape", "상호 병용금지 RPC: 성분명의 %, _ 문자 그대로 일치", MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL),
+]
+
+# verify에서 인덱스 사용 여부를 확인할 한국어 샘플 (trigram 추출 가능 여부 확인에도 사용)
+VERIFY_SAMPLE_TERM = "아세트아미노펜"
+
+
+def migrations_sql() -> str:
+    """전체 마이그레이션 SQL을 SQL Editor에 붙여넣을 수 있는 하나의 스크립트로 반환합니다."""
+    parts = [f"-- {mid}: {description}\n{sql.strip()}" for mid, description, sql in MIGRATIONS]
+    return "\n\n".join(parts) + "\n"
+
+
+def applied_migrations(conn) -> set[str]:
+    """적용 기록이 있는 마이그레이션 id 집합을 반환합니다."""
+    with conn.cursor() as cur:
+        cur.execute(MIGRATIONS_TABLE_SQL)
+        cur.execute("SELECT id FROM schema_migrations")
+        ids = {row[0] for row in cur.fetchall()}
+    conn.commit()
+    return ids
+
+
+def apply_migrations(conn) -> list[str]:
+    """적용되지 않은 마이그레이션을 순서대로 하나씩 커밋하며 적용하고, 적용한 id 목록을 반환합니다."""
+    applied = applied_migrations(conn)
+    newly_applied = []
+    for mid, _, sql in MIGRATIONS:
+        if mid in applied:
+            continue
+        try:
+            with conn.cursor() as cur:
+                cur.execute(sql)
+                cur.execute("INSERT INTO schema_migrations (id) VALUES (%s)", (mid,))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        newly_applied.append(mid)
+    return newly_applied
+
+
+def explain(conn, sql: str, params: tuple = (), analyze: bool = False) -> dict:
+    """쿼리 실행 계획(EXPLAIN FORMAT JSON)의 최상위 항목을 반환합니다."""
+    options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+    with conn.cursor() as cur:
+        cur.execute(f"EXPLAIN ({options}) {sql}", params)
+        plan = cur.fetchone()[0]
+    # 드라이버가 json 타입을 파싱하지 않는 경우
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def plan_index_names(plan: dict) -> list[str]:
+    """실행 계획 트리에서 사용한 인덱스 이름 목록을 반환합니다."""
+    names = []
+    node = plan.get("Plan", plan)
+    if "Index Name" in node:
+        names.append(node["Index Name"])
+    for child in node.get("Plans", []):
+        names.extend(plan_index_names(child))
+    return names
+
+
+def ilike_sql(table: str, column: str) -> str:
+    """검색기와 같은 형태의 ILIKE 부분 일치 조회 SQL을 반환합니다. (%s 자리에 '%키워드%')"""
+    return f'SELECT * FROM {table} WHERE "{column}" ILIKE %s LIMIT 20'
+
+
+def verify_schema(conn) -> list[tuple[str, bool, str]]:
+    """마이그레이션 적용 결과를 점검해 (항목, 통과 여부, 상세) 목록을 반환합니다.
+
+    trigram 인덱스는 존재 여부와 함께, 순차 스캔을 끈 상태에서 ILIKE 조회가
+    해당 인덱스를 사용하는지 확인합니다. (작은 테이블은 평소 순차 스캔이 정상이므로)
+    """
+    checks = []
+    applied = applied_migrations(conn)
+    for mid, _, _ in MIGRATIONS:
+        checks.append((f"migration {mid}", mid in applied, "applied" if mid in applied else "not applied"))
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'pg_trgm'")
+        row = cur.fetchone()
+        checks.append(("extension pg_trgm", row is not None, row[0] if row else "missing"))
+        if row is None:
+            conn.rollback()
+            return checks
+
+        # DB 로케일이 한글을 문자로 인식하지 않으면 trigram이 비어 인덱스가 쓸모없음
+        cur.execute("SELECT show_trgm(%s)", (VERIFY_SAMPLE_TERM,))
+        trigrams = cur.fetchone()[0]
+        checks.append((f"show_trgm('{VERIFY_SAMPLE_TERM}')", bool(trigrams), f"{len(trigrams)} trigrams"))
+
+        cur.execute("SELECT indexname FROM pg_indexes WHERE indexname = ANY(%s)", ([name for name, _, _ in TRGM_INDEXES],))
+        existing = {r[0] for r in cur.fetchall()}
+
+        cur.execute("SET LOCAL enable_seqscan = off")
+        for name, table, column in TRGM_INDEXES:
+            if name not in existing:
+                checks.append((f"index {name}", False, "missing"))
+                continue
+            used = plan_index_names(explain(conn, ilike_sql(table, column), (f"%{VERIFY_SAMPLE_TERM}%",)))
+            checks.append((f"index {name}", name in used, f"plan uses {used or 'no index'}"))
+    conn.rollback()
+    return checks
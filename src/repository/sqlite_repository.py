@@ -0,0 +1,378 @@
+"""로컬 SQLite 파일 복제본 리포지토리.
+
+행 전체는 data(JSON) 컬럼에 보관하고, 검색/조인에 쓰는 컬럼만 별도 컬럼 + B-tree 인덱스로 둡니다.
+검색 컬럼은 FTS5(trigram) 가상 테이블로 색인해 부분 일치 검색을 순위와 함께 처리합니다.
+(FTS5 trigram을 지원하지 않는 SQLite이거나 3글자 미만 검색어는 instr 부분 일치로 처리)
+연결은 스레드별로 하나씩 열어 동시 조회를 지원합니다. (WAL 모드)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+from src.chain.dur_graph import get_dur_field, is_deleted_row
+from src.chain.dur_sql import find_mutual_contraindications_sqlite
+from src.repository.base import TABLE_KEYS, UPSERT_BATCH_SIZE, DrugRepository
+
+# 테이블별 인덱싱 컬럼 (data JSON 외에 별도 컬럼으로 저장)
+TABLE_COLUMNS = {
+    "drugs": ("item_seq", "item_name", "main_item_ingr", "efcy_qesitm"),
+    "dur": (
+        "id",
+        "INGR_CODE",
+        "INGR_KOR_NAME",
+        "MIXTURE_INGR_CODE",
+        "MIXTURE_INGR_KOR_NAME",
+        "PROHBT_CONTENT",
+        "DEL_YN",
+    ),
+}
+
+SQLITE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS drugs (
+    item_seq TEXT PRIMARY KEY,
+    item_name TEXT,
+    main_item_ingr TEXT,
+    efcy_qesitm TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS dur (
+    id INTEGER PRIMARY KEY,
+    INGR_CODE TEXT,
+    INGR_KOR_NAME TEXT,
+    MIXTURE_INGR_CODE TEXT,
+    MIXTURE_INGR_KOR_NAME TEXT,
+    PROHBT_CONTENT TEXT,
+    DEL_YN INTEGER DEFAULT 0,
+    data TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_drugs_item_name ON drugs (item_name);
+CREATE INDEX IF NOT EXISTS idx_dur_ingr_code ON dur (INGR_CODE);
+CREATE INDEX IF NOT EXISTS idx_dur_mixture_ingr_code ON dur (MIXTURE_INGR_CODE);
+CREATE INDEX IF NOT EXISTS idx_dur_ingr_kor_name ON dur (INGR_KOR_NAME);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 검색 컬럼 FTS5 색인 (외부 콘텐츠 테이블, 트리거로 원본 테이블과 동기화)
+# INSERT OR REPLACE의 삭제에도 트리거가 실행되도록 연결마다 recursive_triggers를 켭니다.
+SQLITE_FTS_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS drugs_fts USING fts5(
+    item_name, main_item_ingr, efcy_qesitm,
+    content='drugs', content_rowid='rowid', tokenize='trigram'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS dur_fts USING fts5(
+    INGR_KOR_NAME, MIXTURE_INGR_KOR_NAME,
+    content='dur', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS drugs_fts_ai AFTER INSERT ON drugs BEGIN
+    INSERT INTO drugs_fts (rowid, item_name, main_item_ingr, efcy_qesitm)
+    VALUES (new.rowid, new.item_name, new.main_item_ingr, new.efcy_qesitm);
+END;
+
+CREATE TRIGGER IF NOT EXISTS drugs_fts_ad AFTER DELETE ON drugs BEGIN
+    INSERT INTO drugs_fts (drugs_fts, rowid, item_name, main_item_ingr, efcy_qesitm)
+    VALUES ('delete', old.rowid, old.item_name, old.main_item_ingr, old.efcy_qesitm);
+END;
+
+CREATE TRIGGER IF NOT EXISTS drugs_fts_au AFTER UPDATE OF item_name, main_item_ingr, efcy_qesitm ON drugs BEGIN
+    INSERT INTO drugs_fts (drugs_fts, rowid, item_name, main_item_ingr, efcy_qesitm)
+    VALUES ('delete', old.rowid, old.item_name, old.main_item_ingr, old.efcy_qesitm);
+    INSERT INTO drugs_fts (rowid, item_name, main_item_ingr, efcy_qesitm)
+    VALUES (new.rowid, new.item_name, new.main_item_ingr, new.efcy_qesitm);
+END;
+
+CREATE TRIGGER IF NOT EXISTS dur_fts_ai AFTER INSERT ON dur BEGIN
+    INSERT INTO dur_fts (rowid, INGR_KOR_NAME, MIXTURE_INGR_KOR_NAME)
+    VALUES (new.id, new.INGR_KOR_NAME, new.MIXTURE_INGR_KOR_NAME);
+END;
+
+CREATE TRIGGER IF NOT EXISTS dur_fts_ad AFTER DELETE ON dur BEGIN
+    INSERT INTO dur_fts (dur_fts, rowid, INGR_KOR_NAME, MIXTURE_INGR_KOR_NAME)
+    VALUES ('delete', old.id, old.INGR_KOR_NAME, old.MIXTURE_INGR_KOR_NAME);
+END;
+
+CREATE TRIGGER IF NOT EXISTS dur_fts_au AFTER UPDATE OF INGR_KOR_NAME, MIXTURE_INGR_KOR_NAME ON dur BEGIN
+    INSERT INTO dur_fts (dur_fts, rowid, INGR_KOR_NAME, MIXTURE_INGR_KOR_NAME)
+    VALUES ('delete', old.id, old.INGR_KOR_NAME, old.MIXTURE_INGR_KOR_NAME);
+    INSERT INTO dur_fts (rowid, INGR_KOR_NAME, MIXTURE_INGR_KOR_NAME)
+    VALUES (new.id, new.INGR_KOR_NAME, new.MIXTURE_INGR_KOR_NAME);
+END;
+"""
+
+# 복제본 스키마 버전 (스키마가 바뀌면 올리고 적재 파이프라인으로 다시 생성)
+REPLICA_VERSION = 1
+
+# trigram 토크나이저가 색인하는 최소 검색어 길이
+FTS_MIN_QUERY_CHARS = 3
+
+# IN (...) 한 번에 바인딩할 최대 값 수
+IN_CHUNK_SIZE = 500
+
+
+def _placeholders(values: list) -> str:
+    return ",".join("?" * len(values))
+
+
+def _project(row: dict, columns) -> dict:
+    if columns == "*":
+        return row
+    if isinstance(columns, str):
+        columns = [col.strip() for col in columns.split(",")]
+    return {col: row.get(col) for col in columns}
+
+
+def _fts_phrase(term: str) -> str:
+    """검색어를 FTS5 구문(phrase) 문자열로 감쌉니다."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _column_value(table: str, row: dict, column: str):
+    if table == "dur":
+        if column == "DEL_YN":
+            return int(is_deleted_row(row))
+        return get_dur_field(row, column)
+    return row.get(column)
+
+
+class SQLiteRepository(DrugRepository):
+    """SQLite 파일에서 drugs / dur를 조회하고 적재합니다. (path는 파일 경로여야 스레드 간 공유됩니다)"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        # 파일이 교체(복제본 재생성)되면 증가시켜 스레드별 연결을 다시 열게 함
+        self._generation = 0
+        self._inode = self._file_inode()
+        conn = self._connect()
+        conn.executescript(SQLITE_SCHEMA_SQL)
+        try:
+            conn.executescript(SQLITE_FTS_SCHEMA_SQL)
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            # FTS5 또는 trigram 토크나이저(SQLite 3.34+)가 없는 빌드
+            self.fts_enabled = False
+
+    def _file_inode(self) -> int | None:
+        try:
+            return os.stat(self.path).st_ino
+        except OSError:
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결을 반환합니다. (최초 1회, 파일이 교체된 뒤에는 다시 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation != self._generation:
+            conn.close()
+            conn = None
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
+
+    def close(self) -> None:
+        """현재 스레드의 연결을 닫습니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _query(self, sql: str, params: list | tuple = ()) -> list[dict]:
+        return [json.loads(data) for (data,) in self._connect().execute(sql, params)]
+
+    def _match_condition(self, table: str, column: str, terms: list[str]) -> tuple[str, list]:
+        """column이 terms 중 하나를 부분 문자열로 포함하는 조건과 바인딩 값을 반환합니다.
+
+        3글자 이상 검색어는 FTS5 색인 한 번으로, 나머지는 instr 부분 일치로 찾습니다.
+        """
+        indexed = [term for term in terms if len(term) >= FTS_MIN_QUERY_CHARS] if self.fts_enabled else []
+        conditions, params = [], []
+        if indexed:
+            phrases = " OR ".join(_fts_phrase(term) for term in indexed)
+            conditions.append(f"rowid IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)")
+            params.append(f"{column} : ({phrases})")
+        for term in terms:
+            if term not in indexed:
+                conditions.append(f"instr(lower({column}), lower(?)) > 0")
+                params.append(term)
+        return "(" + " OR ".join(conditions) + ")", params
+
+    def replica_info(self) -> dict[str, str]:
+        """복제본 메타데이터(버전, 생성 시각, 행 수 등)를 반환합니다."""
+        return dict(self._connect().execute("SELECT key, value FROM meta"))
+
+    def data_version(self, table: str) -> str | None:
+        # 적재 파이프라인이 파일을 교체했으면 이후 조회는 새 파일에서 하도록 연결 세대를 올림
+        inode = self._file_inode()
+        if inode != self._inode:
+            self._inode = inode
+            self._generation += 1
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (f"version:{table}",)).fetchone()
+        return row[0] if row else None
+
+    def _set_data_version(self, table: str, version: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (f"version:{table}", version))
+
+    def fetch_all(self, table: str, columns: str = "*", order: str = "item_seq") -> list[dict]:
+        if table not in TABLE_COLUMNS or order not in TABLE_COLUMNS[table]:
+            raise ValueError(f"지원하지 않는 조회입니다: {table} order by {order}")
+        rows = self._query(f"SELECT data FROM {table} ORDER BY {order}")
+        return [_project(row, columns) for row in rows]
+
+    def fetch_drugs_by_seq(self, item_seqs: list[str]) -> list[dict]:
+        rows = []
+        seqs = [str(seq) for seq in item_seqs]
+        for i in range(0, len(seqs), IN_CHUNK_SIZE):
+            chunk = seqs[i : i + IN_CHUNK_SIZE]
+            rows.extend(self._query(f"SELECT data FROM drugs WHERE item_seq IN ({_placeholders(chunk)})", chunk))
+        return rows
+
+    def search_drugs(self, column: str, keyword: str, columns: list[str], limit: int) -> list[dict]:
+        if column not in TABLE_COLUMNS["drugs"]:
+            raise ValueError(f"검색할 수 없는 컬럼입니다: {column}")
+        if self.fts_enabled and len(keyword) >= FTS_MIN_QUERY_CHARS:
+            # FTS5 bm25 순위 상위 limit건
+            rows = self._query(
+                "SELECT d.data FROM drugs AS d JOIN ("
+                " SELECT rowid, rank FROM drugs_fts WHERE drugs_fts MATCH ? ORDER BY rank LIMIT ?"
+                ") AS f ON d.rowid = f.rowid ORDER BY f.rank",
+                (f"{column} : {_fts_phrase(keyword)}", limit),
+            )
+        else:
+            rows = self._query(
+                f"SELECT data FROM drugs WHERE instr(lower({column}), lower(?)) > 0 LIMIT ?",
+                (keyword, limit),
+            )
+        return [_project(row, columns) for row in rows]
+
+    def fetch_dur_by_codes(self, codes: list[str], limit: int) -> list[dict]:
+        if not codes:
+            return []
+        return self._query(
+            f"SELECT data FROM dur WHERE INGR_CODE IN ({_placeholders(codes)}) AND DEL_YN = 0 ORDER BY id LIMIT ?",
+            (*codes, limit),
+        )
+
+    def fetch_dur_code_pairs(self, codes: list[str], limit: int, after_id: int = -1) -> list[dict]:
+        if not codes:
+            return []
+        marks = _placeholders(codes)
+        return self._query(
+            f"SELECT data FROM dur WHERE INGR_CODE IN ({marks}) AND MIXTURE_INGR_CODE IN ({marks})"
+            " AND DEL_YN = 0 AND id > ? ORDER BY id LIMIT ?",
+            (*codes, *codes, after_id, limit),
+        )
+
+    def search_dur_by_names(self, names: list[str], limit: int) -> list[dict]:
+        if not names:
+            return []
+        condition, params = self._match_condition("dur", "INGR_KOR_NAME", names)
+        return self._query(
+            f"SELECT data FROM dur WHERE DEL_YN = 0 AND {condition} ORDER BY id LIMIT ?",
+            (*params, limit),
+        )
+
+    def search_dur_pair(self, ingredient: str, mixture: str, limit: int) -> list[dict]:
+        ingredient_condition, ingredient_params = self._match_condition("dur", "INGR_KOR_NAME", [ingredient])
+        mixture_condition, mixture_params = self._match_condition("dur", "MIXTURE_INGR_KOR_NAME", [mixture])
+        return self._query(
+            f"SELECT data FROM dur WHERE DEL_YN = 0 AND {ingredient_condition} AND {mixture_condition}"
+            " ORDER BY id LIMIT ?",
+            (*ingredient_params, *mixture_params, limit),
+        )
+
+    def find_mutual_contraindications(self, ingredients: list[str]) -> list[dict]:
+        return find_mutual_contraindications_sqlite(self._connect(), ingredients)
+
+    def _upsert_batch(self, table: str, key: str, rows: list[dict]) -> None:
+        columns = TABLE_COLUMNS[table]
+        sql = (
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}, data)"
+            f" VALUES ({_placeholders(columns)}, ?)"
+        )
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                sql,
+                (
+                    (
+                        *(_column_value(table, row, col) for col in columns),
+                        json.dumps(row, ensure_ascii=False, default=str),
+                    )
+                    for row in rows
+                ),
+            )
+
+    def _soft_delete(self, table: str, keys: list) -> int:
+        key = TABLE_KEYS[table]
+        flag = ", DEL_YN = 1" if "DEL_YN" in TABLE_COLUMNS[table] else ""
+        count = 0
+        conn = self._connect()
+        with conn:
+            for i in range(0, len(keys), UPSERT_BATCH_SIZE):
+                chunk = keys[i : i + UPSERT_BATCH_SIZE]
+                cursor = conn.execute(
+                    f"UPDATE {table} SET data = json_set(data, '$.DEL_YN', json('true')){flag}"
+                    f" WHERE {key} IN ({_placeholders(chunk)})",
+                    chunk,
+                )
+                count += cursor.rowcount
+        return count
+
+
+def build_sqlite_replica(path: str, drug_rows: list[dict], dur_rows: list[dict]) -> dict[str, str]:
+    """drugs / dur 전체를 담은 SQLite 복제본 파일을 새로 만들고 메타데이터를 반환합니다.
+
+    임시 파일에 적재한 뒤 os.replace로 교체하므로, 생성이 중간에 실패해도 기존 파일은 그대로 남습니다.
+    배포용 단일 파일이 되도록 저널 모드를 DELETE로 바꿔 닫습니다.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(tmp_path + suffix):
+            os.remove(tmp_path + suffix)
+
+    repository = SQLiteRepository(tmp_path)
+    repository.upsert_rows("drugs", drug_rows)
+    repository.upsert_rows("dur", dur_rows)
+
+    meta = {
+        "replica_version": str(REPLICA_VERSION),
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "drugs_count": str(len(drug_rows)),
+        "dur_count": str(len(dur_rows)),
+        "fts": "trigram" if repository.fts_enabled else "none",
+    }
+    conn = repository._connect()
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items())
+        if repository.fts_enabled:
+            conn.execute("INSERT INTO drugs_fts (drugs_fts) VALUES ('optimize')")
+            conn.execute("INSERT INTO dur_fts (dur_fts) VALUES ('optimize')")
+    conn.execute("PRAGMA journal_mode=DELETE")
+    repository.close()
+
+    # 이전 파일의 WAL/SHM이 새 파일에 적용되지 않도록 함께 제거
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    os.replace(tmp_path, path)
+    return meta
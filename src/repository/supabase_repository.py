@@ -0,0 +1,177 @@
+"""Supabase(PostgREST) 리포지토리."""
+
+from src.chain.dur_sql import MUTUAL_CONTRAINDICATIONS_RPC, to_rpc_warning
+from src.repository.base import TABLE_KEYS, UPSERT_BATCH_SIZE, DrugRepository
+from src.utils.supabase_client import get_supabase_client
+
+# 전체 테이블 로드 시 한 번에 가져올 행 수 (PostgREST 기본 최대 1000)
+FETCH_PAGE_SIZE = 1000
+
+# 테이블별 데이터 버전 (쓰기 후 갱신, 서빙 프로세스가 로컬 색인 갱신 여부 판단에 사용)
+DATA_VERSIONS_TABLE = "data_versions"
+
+# PostgREST or 필터 값에서 따옴표로 감싸야 하는 예약 문자
+POSTGREST_RESERVED_CHARS = set(',.:()"\\')
+
+
+def _postgrest_pattern(term: str) -> str:
+    """ILIKE 부분 일치 패턴(*term*)을 PostgREST or 필터 값으로 변환합니다."""
+    pattern = f"*{term}*"
+    if any(ch in POSTGREST_RESERVED_CHARS for ch in pattern):
+        escaped = pattern.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return pattern
+
+
+class SupabaseRepository(DrugRepository):
+    """프로세스 공용 Supabase 클라이언트로 drugs / dur 테이블을 조회합니다."""
+
+    name = "supabase"
+
+    def _client(self):
+        return get_supabase_client()
+
+    def fetch_all(self, table: str, columns: str = "*", order: str = "item_seq") -> list[dict]:
+        client = self._client()
+        rows = []
+        start = 0
+        while True:
+            res = (
+                client.table(table)
+                .select(columns)
+                .order(order)
+                .range(start, start + FETCH_PAGE_SIZE - 1)
+                .execute()
+            )
+            page = res.data or []
+            rows.extend(page)
+            if len(page) < FETCH_PAGE_SIZE:
+                return rows
+            start += FETCH_PAGE_SIZE
+
+    def fetch_drugs_by_seq(self, item_seqs: list[str]) -> list[dict]:
+        if not item_seqs:
+            return []
+        res = self._client().table("drugs").select("*").in_("item_seq", item_seqs).execute()
+        return res.data or []
+
+    def search_drugs(self, column: str, keyword: str, columns: list[str], limit: int) -> list[dict]:
+        res = (
+            self._client()
+            .table("drugs")
+            .select(",".join(columns))
+            .ilike(column, f"%{keyword}%")
+            .limit(limit)
+            .execute()
+        )
+        return res.data or []
+
+    def fetch_dur_by_codes(self, codes: list[str], limit: int) -> list[dict]:
+        if not codes:
+            return []
+        res = (
+            self._client()
+            .table("dur")
+            .select("*")
+            .in_("INGR_CODE", codes)
+            .eq("DEL_YN", False)
+            .order("id")
+            .limit(limit)
+            .execute()
+        )
+        return res.data or []
+
+    def fetch_dur_code_pairs(self, codes: list[str], limit: int, after_id: int = -1) -> list[dict]:
+        if not codes:
+            return []
+        res = (
+            self._client()
+            .table("dur")
+            .select("*")
+            .in_("INGR_CODE", codes)
+            .in_("MIXTURE_INGR_CODE", codes)
+            .eq("DEL_YN", False)
+            .gt("id", after_id)
+            .order("id")
+            .limit(limit)
+            .execute()
+        )
+        return res.data or []
+
+    def search_dur_by_name(self, name: str, limit: int) -> list[dict]:
+        res = (
+            self._client()
+            .table("dur")
+            .select("*")
+            .ilike("INGR_KOR_NAME", f"%{name}%")
+            .eq("DEL_YN", False)
+            .limit(limit)
+            .execute()
+        )
+        return res.data or []
+
+    def search_dur_by_names(self, names: list[str], limit: int) -> list[dict]:
+        if not names:
+            return []
+        # 여러 성분명을 or 필터 한 번으로 조회
+        filter_expr = ",".join(f"INGR_KOR_NAME.ilike.{_postgrest_pattern(name)}" for name in names)
+        res = (
+            self._client()
+            .table("dur")
+            .select("*")
+            .or_(filter_expr)
+            .eq("DEL_YN", False)
+            .limit(limit)
+            .execute()
+        )
+        return res.data or []
+
+    def search_dur_pair(self, ingredient: str, mixture: str, limit: int) -> list[dict]:
+        res = (
+            self._client()
+            .table("dur")
+            .select("*")
+            .ilike("INGR_KOR_NAME", f"%{ingredient}%")
+            .ilike("MIXTURE_INGR_KOR_NAME", f"%{mixture}%")
+            .eq("DEL_YN", False)
+            .limit(limit)
+            .execute()
+        )
+        return res.data or []
+
+    def find_mutual_contraindications(self, ingredients: list[str]) -> list[dict]:
+        res = self._client().rpc(MUTUAL_CONTRAINDICATIONS_RPC, {"ingredients": ingredients}).execute()
+        return [to_rpc_warning(row) for row in res.data or []]
+
+    def _upsert_batch(self, table: str, key: str, rows: list[dict]) -> None:
+        self._client().table(table).upsert(rows, on_conflict=key).execute()
+
+    def _soft_delete(self, table: str, keys: list) -> int:
+        key = TABLE_KEYS[table]
+        for i in range(0, len(keys), UPSERT_BATCH_SIZE):
+            batch = keys[i : i + UPSERT_BATCH_SIZE]
+            self._client().table(table).update({"DEL_YN": True}).in_(key, batch).execute()
+        return len(keys)
+
+    def data_version(self, table: str) -> str | None:
+        try:
+            res = (
+                self._client()
+                .table(DATA_VERSIONS_TABLE)
+                .select("version")
+                .eq("table_name", table)
+                .limit(1)
+                .execute()
+            )
+        except Exception:
+            # data_versions 테이블이 없는 DB (마이그레이션 006 미적용)
+            return None
+        return res.data[0]["version"] if res.data else None
+
+    def _set_data_version(self, table: str, version: str) -> None:
+        try:
+            self._client().table(DATA_VERSIONS_TABLE).upsert(
+                {"table_name": table, "version": version}, on_conflict="table_name"
+            ).execute()
+        except Exception as e:
+            print(f"  {DATA_VERSIONS_TABLE} 갱신 실패 (마이그레이션 006 적용 필요): {e}")
@@ -0,0 +1,113 @@
+"""프로세스 공용 Supabase 클라이언트.
+
+create_client를 호출마다 실행하면 요청마다 새 httpx 세션과 TLS 연결이 만들어집니다.
+여기서는 클라이언트와 httpx 연결 풀(keep-alive)을 최초 1회만 만들어 모든 스레드가 공유하고,
+요청 수/오류 수와 연결 풀 상태를 조회할 수 있게 합니다.
+"""
+
+import threading
+
+import httpx
+from supabase import Client, create_client
+
+from src.config import (
+    SUPABASE_HTTP_TIMEOUT,
+    SUPABASE_KEY,
+    SUPABASE_POOL_KEEPALIVE_EXPIRY,
+    SUPABASE_POOL_MAX_CONNECTIONS,
+    SUPABASE_POOL_MAX_KEEPALIVE,
+    SUPABASE_URL,
+)
+
+try:
+    from supabase import ClientOptions
+except ImportError:  # 구버전 supabase: 클라이언트 재사용만 적용
+    ClientOptions = None
+
+_client: Client | None = None
+_http_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+_stats = {"clients_created": 0, "requests": 0, "errors": 0}
+_stats_lock = threading.Lock()
+
+
+def _count_request(request: httpx.Request) -> None:
+    with _stats_lock:
+        _stats["requests"] += 1
+
+
+def _count_response(response: httpx.Response) -> None:
+    if response.status_code >= 400:
+        with _stats_lock:
+            _stats["errors"] += 1
+
+
+def _create_http_client() -> httpx.Client:
+    """연결 풀 제한과 요청 카운터 훅이 설정된 httpx 클라이언트를 만듭니다."""
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=SUPABASE_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=SUPABASE_POOL_KEEPALIVE_EXPIRY,
+        ),
+        timeout=SUPABASE_HTTP_TIMEOUT,
+        event_hooks={"request": [_count_request], "response": [_count_response]},
+    )
+
+
+def get_supabase_client() -> Client:
+    """프로세스 공용 Supabase 클라이언트를 반환합니다. (최초 1회 생성, 스레드 안전)"""
+    global _client, _http_client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                http_client = None
+                options = None
+                if ClientOptions is not None:
+                    http_client = _create_http_client()
+                    try:
+                        options = ClientOptions(httpx_client=http_client)
+                    except TypeError:  # httpx_client 옵션이 없는 버전
+                        http_client.close()
+                        http_client = None
+                if options is not None:
+                    client = create_client(SUPABASE_URL, SUPABASE_KEY, options=options)
+                else:
+                    client = create_client(SUPABASE_URL, SUPABASE_KEY)
+                _http_client = http_client
+                _client = client
+                with _stats_lock:
+                    _stats["clients_created"] += 1
+    return _client
+
+
+def reset_supabase_client() -> None:
+    """공용 클라이언트와 연결 풀을 닫습니다. 다음 호출 시 다시 생성됩니다."""
+    global _client, _http_client
+    with _client_lock:
+        if _http_client is not None:
+            _http_client.close()
+        _client = None
+        _http_client = None
+
+
+def get_supabase_pool_stats() -> dict:
+    """클라이언트 생성 수, 요청/오류 수, 연결 풀 상태(전체/유휴 연결 수)를 반환합니다."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats.update(
+        {
+            "pooled": _http_client is not None,
+            "max_connections": SUPABASE_POOL_MAX_CONNECTIONS,
+            "max_keepalive_connections": SUPABASE_POOL_MAX_KEEPALIVE,
+            "connections": 0,
+            "idle_connections": 0,
+        }
+    )
+    # httpcore 연결 풀 내부 상태 (공개 API가 없으므로 가능한 경우에만)
+    pool = getattr(getattr(_http_client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []) or [])
+    stats["connections"] = len(connections)
+    stats["idle_connections"] = sum(1 for conn in connections if conn.is_idle())
+    return stats
@@ -1,25 +1,90 @@
-"""전체 데이터 적재 파이프라인: API 1 + API 2 수집 -> 병합 -> 전처리 -> Supabase 업로드"""
+"""전체 데이터 적재 파이프라인: API 1 + API 2 수집 -> 병합 -> 전처리 -> 데이터 백엔드(DATA_BACKEND) 업로드"""
 
+import json
+import os
+
+from src.chain.bm25_index import BM25Index
+from src.chain.dur_graph import DUR_ROWS_PER_INGREDIENT
+from src.chain.retriever import format_dur_results, invalidate_retrieval_cache
+from src.config import (
+    BM25_INDEX_FILENAME,
+    DATA_BACKEND,
+    INGREDIENT_CROSSWALK_FILENAME,
+    INGREDIENT_INDEX_FILENAME,
+    RAW_DATA_DIR,
+    SQLITE_DB_PATH,
+)
+from src.data.crosswalk import (
+    build_dur_summaries,
+    build_ingredient_crosswalk,
+    crosswalk_stats,
+)
 from src.data.loader import create_documents, split_documents
 from src.data.preprocessor import (
+    build_ingredient_index,
     merge_api1_api2,
     prepare_drugs_for_db,
     preprocess_all,
 )
-from src.vectorstore.supabase_store import (
-    ingest_documents,
-    upload_drugs_to_supabase,
-)
+from src.repository.factory import get_repository, set_repository
+from src.repository.sqlite_repository import build_sqlite_replica
+from src.vectorstore.supabase_store import ingest_documents
+
+
+def attach_dur_summaries(drug_rows: list[dict], dur_rows: list[dict]) -> dict:
+    """크로스워크를 만들어 drug_rows 각 행에 dur_summary / dur_context를 채우고 크로스워크를 반환합니다."""
+    crosswalk = build_ingredient_crosswalk(drug_rows, dur_rows)
+    summaries = build_dur_summaries(drug_rows, dur_rows, crosswalk, DUR_ROWS_PER_INGREDIENT)
+    for row in drug_rows:
+        row["dur_summary"] = summaries[str(row["item_seq"])]
+        row["dur_context"] = format_dur_results(row["dur_summary"])
+    print(f"  DUR 요약 생성: {sum(1 for s in summaries.values() if s)}/{len(drug_rows)}건 병용금지 정보 포함")
+    return crosswalk
+
+
+def save_ingredient_crosswalk(crosswalk: dict, raw_dir: str) -> None:
+    """성분 → DUR INGR_CODE 크로스워크를 raw_dir에 저장합니다."""
+    crosswalk_path = os.path.join(raw_dir, INGREDIENT_CROSSWALK_FILENAME)
+    with open(crosswalk_path, "w", encoding="utf-8") as f:
+        json.dump(crosswalk, f, ensure_ascii=False)
+    stats = crosswalk_stats(crosswalk)
+    print(
+        f"  DUR 크로스워크 저장: {crosswalk_path} "
+        f"(정확 {stats['exact']} / 정규화 {stats['normalized']} / 미매칭 {stats['none']})"
+    )
+
+
+def refresh_dur_summaries(dur_rows: list[dict], raw_dir: str = RAW_DATA_DIR) -> int:
+    """dur 업로드/동기화 후 drugs의 DUR 요약과 크로스워크를 다시 만듭니다.
+
+    데이터 백엔드의 drugs 전체 행으로 요약을 다시 계산해 바뀐 약품 행만 upsert하고, 건수를 반환합니다.
+    (dur_rows는 삭제분이 빠진 현재 DUR 전체)
+    """
+    repository = get_repository()
+    drug_rows = repository.fetch_all("drugs")
+    if not drug_rows:
+        print("  drugs 테이블이 비어 있어 DUR 요약 갱신을 건너뜁니다.")
+        return 0
+    previous = {str(row["item_seq"]): (row.get("dur_summary"), row.get("dur_context")) for row in drug_rows}
+    crosswalk = attach_dur_summaries(drug_rows, dur_rows)
+    changed = [
+        row for row in drug_rows
+        if (row["dur_summary"], row["dur_context"]) != previous[str(row["item_seq"])]
+    ]
+    if changed:
+        repository.upsert_rows("drugs", changed)
+    print(f"  DUR 요약 갱신: {len(changed)}/{len(drug_rows)}건 변경")
+    save_ingredient_crosswalk(crosswalk, raw_dir)
+    invalidate_retrieval_cache("drugs")
+    return len(changed)
 
 
-def run_ingestion_pipeline(raw_dir: str = "data/raw"):
+def run_ingestion_pipeline(raw_dir: str = RAW_DATA_DIR):
     """전체 데이터 적재 파이프라인을 실행합니다.
     
     기존 수집된 JSON 파일(drugs_raw.json, approval_filtered.json)을 사용합니다.
+    BM25/성분/크로스워크 색인도 raw_dir에 저장하므로, 검색기가 읽는 RAW_DATA_DIR을 기본값으로 씁니다.
     """
-    import json
-    import os
-
     # [1/5] 데이터 로드
     print("=" * 60)
     print("[1/5] 기존 수집 데이터 로드 중...")
@@ -53,24 +118,75 @@ def run_ingestion_pipeline(raw_dir: str = "data/raw"):
     processed = preprocess_all(merged_items)
     print(f"  전처리 완료: {len(processed)}건")
 
-    # [4/5] Supabase drugs 테이블에 업로드
+    # [4/5] 데이터 백엔드 drugs 테이블에 업로드
     print()
     print("=" * 60)
-    print("[4/5] Supabase drugs 테이블에 업로드 중...")
+    print(f"[4/5] {DATA_BACKEND} drugs 테이블에 업로드 중...")
     print("=" * 60)
     drug_rows = prepare_drugs_for_db(merged_items)
-    upload_drugs_to_supabase(drug_rows)
+
+    # dur_list.json이 있으면 약품별 DUR 요약/컨텍스트를 함께 적재 (검색 시 DUR 재조회 생략)
+    crosswalk = None
+    dur_rows = []
+    dur_path = os.path.join(raw_dir, "dur_list.json")
+    if os.path.exists(dur_path):
+        with open(dur_path, "r", encoding="utf-8") as f:
+            dur_rows = json.load(f)
+        crosswalk = attach_dur_summaries(drug_rows, dur_rows)
+    else:
+        print(f"  {dur_path} 파일이 없어 DUR 크로스워크/요약 생성을 건너뜁니다.")
+
+    if DATA_BACKEND == "sqlite":
+        # SQLite 백엔드는 아래에서 생성하는 복제본 파일이 곧 저장소
+        print(f"  DATA_BACKEND=sqlite: 복제본 파일({SQLITE_DB_PATH})로 적재합니다.")
+    else:
+        get_repository().upsert_rows("drugs", drug_rows)
+
+    # drugs + dur 로컬 SQLite 복제본(FTS5 trigram 색인) 생성 (서빙 노드 배포/재현 가능한 벤치마크용)
+    replica = build_sqlite_replica(SQLITE_DB_PATH, drug_rows, dur_rows)
+    print(
+        f"  SQLite 복제본 저장: {SQLITE_DB_PATH} (v{replica['replica_version']}, "
+        f"drugs {replica['drugs_count']} / dur {replica['dur_count']}, FTS {replica['fts']})"
+    )
+    if DATA_BACKEND == "sqlite":
+        # 기존 연결이 교체 전 파일을 가리키지 않도록 다음 조회 시 새로 열기
+        set_repository(None)
+
+    # 효능 BM25 색인 생성 (원본 데이터 옆에 저장, 검색 시 로컬 랭킹에 사용)
+    bm25_path = os.path.join(raw_dir, BM25_INDEX_FILENAME)
+    bm25_index = BM25Index.build(drug_rows)
+    bm25_index.save(bm25_path)
+    print(f"  효능 BM25 색인 저장: {bm25_path} ({len(bm25_index)}건)")
+
+    # 성분명/성분코드 → item_seq 역색인 저장 (성분 검색을 정확 일치 조회로 처리)
+    ingredient_path = os.path.join(raw_dir, INGREDIENT_INDEX_FILENAME)
+    ingredient_index = build_ingredient_index(drug_rows)
+    with open(ingredient_path, "w", encoding="utf-8") as f:
+        json.dump(ingredient_index, f, ensure_ascii=False)
+    print(f"  성분 색인 저장: {ingredient_path} ({len(ingredient_index['by_name'])}개 성분)")
+
+    # 성분 → DUR INGR_CODE 크로스워크 저장 (DUR 조회를 성분코드 정확 일치로 처리)
+    if crosswalk is not None:
+        save_ingredient_crosswalk(crosswalk, raw_dir)
+
+    # drugs 갱신 후 검색 캐시와 로컬 색인 무효화
+    invalidate_retrieval_cache("drugs")
 
     # [5/5] LangChain 문서 생성 + 벡터 임베딩 업로드
     print()
     print("=" * 60)
     print("[5/5] 문서 생성 및 벡터 임베딩 업로드 중...")
     print("=" * 60)
-    documents = create_documents(processed)
-    split_docs = split_documents(documents)
-    print(f"  문서 청크: {len(split_docs)}개")
-    
-    vector_store = ingest_documents(split_docs)
+    # 벡터 저장소(pgvector)는 Supabase에만 있으므로 다른 백엔드에서는 건너뜀
+    vector_store = None
+    if DATA_BACKEND != "supabase":
+        print(f"  DATA_BACKEND={DATA_BACKEND}: 벡터 임베딩 업로드를 건너뜁니다.")
+    else:
+        documents = create_documents(processed)
+        split_docs = split_documents(documents)
+        print(f"  문서 청크: {len(split_docs)}개")
+
+        vector_store = ingest_documents(split_docs)
 
     print()
     print("=" * 60)
@@ -3,14 +3,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_community.vectorstores import SupabaseVectorStore
 from langchain_core.documents import Document
-from supabase import Client, create_client
-
-from src.config import (
-    SUPABASE_KEY,
-    SUPABASE_QUERY_NAME,
-    SUPABASE_TABLE_NAME,
-    SUPABASE_URL,
-)
+from src.config import SUPABASE_QUERY_NAME, SUPABASE_TABLE_NAME
+from src.utils.supabase_client import get_supabase_client
 from src.vectorstore.embeddings import get_embeddings_model
 
 
@@ -62,11 +56,6 @@ class PatchedSupabaseVectorStore(SupabaseVectorStore):
         return match_result
 
 
-def get_supabase_client() -> Client:
-    """Supabase 클라이언트를 초기화합니다."""
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
-
-
 def get_vector_store() -> PatchedSupabaseVectorStore:
     """PatchedSupabaseVectorStore 인스턴스를 반환합니다."""
     client = get_supabase_client()
@@ -106,18 +95,3 @@ def ingest_documents(documents: list[Document], batch_size: int = 100):
     return vector_store
 
 
-def upload_drugs_to_supabase(drug_rows: list[dict], batch_size: int = 500):
-    """병합된 약품 데이터를 Supabase drugs 테이블에 upsert합니다."""
-    client = get_supabase_client()
-
-    total_batches = (len(drug_rows) + batch_size - 1) // batch_size
-
-    for i in range(0, len(drug_rows), batch_size):
-        batch = drug_rows[i : i + batch_size]
-        batch_num = i // batch_size + 1
-        print(f"  drugs 배치 {batch_num}/{total_batches} upsert 중 ({len(batch)}건)...")
-        client.table("drugs").upsert(batch, on_conflict="item_seq").execute()
-
-    print(f"  drugs 테이블 업로드 완료: {len(drug_rows)}건")
-
-
@@ -0,0 +1,46 @@
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+from src.chain.bm25_index import BM25Index, tokenize
+
+ROWS = [
+    {"item_seq": "1", "efcy_qesitm": "이 약은 두통, 치통, 생리통의 진통에 사용합니다."},
+    {"item_seq": "2", "efcy_qesitm": "이 약은 위산과다, 속쓰림, 위부불쾌감에 사용합니다."},
+    {"item_seq": "3", "efcy_qesitm": "이 약은 감기로 인한 발열 및 두통, 콧물에 사용합니다."},
+    {"item_seq": "4", "efcy_qesitm": None},
+    {"item_seq": "5", "efcy_qesitm": "이 약은 변비의 완화에 사용합니다."},
+    {"item_seq": "6", "efcy_qesitm": "이 약은 무좀, 습진의 치료에 사용합니다."},
+    {"item_seq": "7", "efcy_qesitm": "이 약은 비타민 보급에 사용합니다."},
+]
+TEXT_ROWS = [row for row in ROWS if row["efcy_qesitm"]]
+
+
+def test_scores_match_rank_bm25():
+    index = BM25Index.build(ROWS)
+    docs = [tokenize(row["efcy_qesitm"]) for row in TEXT_ROWS]
+    expected = BM25Okapi(docs).get_scores(tokenize("두통 발열"))
+    assert np.allclose(index.scores("두통 발열"), expected, atol=1e-5)
+
+
+def test_top_k_orders_by_score_and_skips_empty_docs():
+    index = BM25Index.build(ROWS)
+    assert len(index) == len(TEXT_ROWS)
+    hits = index.top_k("두통 발열", 10)
+    assert [seq for seq, _ in hits] == ["3", "1"]
+    assert hits[0][1] > hits[1][1] > 0
+    assert [seq for seq, _ in index.top_k("두통 발열", 1)] == ["3"]
+    assert index.top_k("관절염", 10) == []
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = BM25Index.build(ROWS)
+    path = tmp_path / "bm25.pkl"
+    index.save(str(path))
+    loaded = BM25Index.load(str(path))
+    assert loaded.top_k("속쓰림", 5) == index.top_k("속쓰림", 5)
+
+
+def test_empty_index():
+    index = BM25Index.build([])
+    assert len(index) == 0
+    assert index.top_k("두통", 5) == []
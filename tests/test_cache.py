@@ -0,0 +1,76 @@
+from src.chain import cache as cache_module
+from src.chain.cache import RetrievalCache, normalize_cache_keyword
+
+
+def test_normalize_cache_keyword():
+    assert normalize_cache_keyword("  Tylenol   ER ") == "tylenol er"
+    assert normalize_cache_keyword(None) == ""
+
+
+def test_lru_evicts_least_recently_used():
+    cache = RetrievalCache(max_size=2, ttl=60, negative_ttl=60)
+    cache.set("a", [1])
+    cache.set("b", [2])
+    cache.get("a")
+    cache.set("c", [3])
+    assert cache.get("a") == (True, [1])
+    assert cache.get("b") == (False, None)
+    assert cache.get("c") == (True, [3])
+
+
+def test_ttl_and_negative_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = RetrievalCache(max_size=10, ttl=60, negative_ttl=5)
+    cache.set("hit", [1])
+    cache.set("empty", [])
+
+    now[0] += 10
+    assert cache.get("empty") == (False, None)
+    assert cache.get("hit") == (True, [1])
+
+    now[0] += 60
+    assert cache.get("hit") == (False, None)
+
+
+def test_negative_hits_are_counted():
+    cache = RetrievalCache(max_size=10, ttl=60, negative_ttl=60)
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute("none", lambda: calls.append(1) or [])
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["negative_hits"] == 2
+
+
+def test_invalidate_by_table():
+    cache = RetrievalCache(max_size=10, ttl=60, negative_ttl=60)
+    cache.set(("drugs", "efcy", "두통"), [1])
+    cache.set(("dur", "ingredient", "심바스타틴"), [2])
+    assert cache.invalidate("drugs") == 1
+    assert cache.get(("drugs", "efcy", "두통")) == (False, None)
+    assert cache.get(("dur", "ingredient", "심바스타틴")) == (True, [2])
+
+
+def test_result_computed_across_invalidation_is_not_stored():
+    cache = RetrievalCache(max_size=10, ttl=60, negative_ttl=60)
+    key = ("drugs", "efcy", "두통")
+
+    def compute():
+        # 계산 도중 적재가 끝나 무효화 훅이 호출된 상황
+        cache.invalidate("drugs")
+        return ["stale"]
+
+    assert cache.get_or_compute(key, compute) == ["stale"]
+    assert cache.get(key) == (False, None)
+    assert cache.get_or_compute(key, lambda: ["fresh"]) == ["fresh"]
+    assert cache.get(key) == (True, ["fresh"])
+
+
+def test_set_with_outdated_generation_is_skipped():
+    cache = RetrievalCache(max_size=10, ttl=60, negative_ttl=60)
+    generation = cache.generation
+    cache.invalidate()
+    assert cache.set("k", [1], generation) is False
+    assert cache.get("k") == (False, None)
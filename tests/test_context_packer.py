@@ -0,0 +1,36 @@
+from src.chain.context_packer import count_tokens, pack_blocks
+
+BLOCK_A = "[A의 병용금지 약물]\n" + "\n".join(f"- 병용금지약물{i}: 근육병증 위험 증가" for i in range(10))
+BLOCK_B = "[B의 병용금지 약물]\n- 짧음: r"
+MUTUAL = "[검색된 약품 간 상호 병용금지 경고]\n- A + B: 병용 금지"
+
+
+def test_keeps_everything_within_budget():
+    text, stats = pack_blocks([BLOCK_A, BLOCK_B], 10_000, pinned=[MUTUAL])
+    assert text == "\n\n".join([MUTUAL, BLOCK_A, BLOCK_B])
+    assert stats["dropped_blocks"] == 0
+
+
+def test_stops_at_first_block_that_does_not_fit():
+    # B는 들어갈 자리가 있어도 A 다음으로 건너뛰어 담지 않음 (B 항목이 다른 성분 헤더 아래로 가지 않도록)
+    budget = count_tokens(BLOCK_A) // 2 + 100
+    text, stats = pack_blocks([BLOCK_A, BLOCK_B], budget)
+    assert "[A의 병용금지 약물]" not in text
+    assert "- 짧음: r" not in text
+    assert "병용금지약물" not in text
+    assert stats["dropped_blocks"] == 2
+    assert "2개 항목을 생략" in text
+
+
+def test_kept_blocks_are_whole_and_under_their_header():
+    text, stats = pack_blocks([BLOCK_B, BLOCK_A], count_tokens(BLOCK_B) + 100)
+    assert text.startswith(BLOCK_B)
+    assert "병용금지약물" not in text
+    assert stats["dropped_blocks"] == 1
+    assert stats["used_tokens"] <= stats["budget"]
+
+
+def test_pinned_mutual_warning_survives_tiny_budget():
+    text, _ = pack_blocks([BLOCK_A, BLOCK_B], 20, pinned=[MUTUAL])
+    assert text.startswith(MUTUAL)
+    assert "- 짧음: r" not in text
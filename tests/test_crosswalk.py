@@ -0,0 +1,45 @@
+from src.data.crosswalk import MATCH_NONE, MATCH_NORMALIZED, build_ingredient_crosswalk, canonical_ingredient_name
+from src.data.preprocessor import normalize_ingredient_name
+
+
+def test_strips_salt_and_hydrate_suffixes():
+    assert canonical_ingredient_name("슈도에페드린염산염수화물") == "슈도에페드린"
+    assert canonical_ingredient_name("암로디핀베실산염") == "암로디핀"
+    assert canonical_ingredient_name("디클로페낙나트륨") == "디클로페낙"
+    assert canonical_ingredient_name("알렌드론산나트륨삼수화물") == "알렌드론산"
+
+
+def test_keeps_cation_of_inorganic_salts():
+    for name in ["염화칼륨", "염화나트륨", "염화칼슘", "탄산칼슘", "탄산마그네슘", "산화마그네슘", "황산마그네슘", "인산칼슘"]:
+        assert canonical_ingredient_name(name) == name
+
+
+def test_inorganic_salts_do_not_collide():
+    names = ["염화칼륨", "염화나트륨", "염화칼슘", "탄산칼슘", "탄산마그네슘", "산화마그네슘", "황산마그네슘", "인산칼슘"]
+    assert len({canonical_ingredient_name(name) for name in names}) == len(names)
+    assert canonical_ingredient_name("탄산칼슘수화물") == canonical_ingredient_name("탄산칼슘")
+
+
+def test_crosswalk_maps_inorganic_salt_to_its_own_code():
+    dur_rows = [
+        {"id": 1, "INGR_CODE": "D001", "INGR_KOR_NAME": "염화칼륨"},
+        {"id": 2, "INGR_CODE": "D002", "INGR_KOR_NAME": "염화나트륨"},
+        {"id": 3, "INGR_CODE": "D003", "INGR_KOR_NAME": "디클로페낙"},
+    ]
+    drug_rows = [
+        {"main_ingredients": [{"code": "M1", "name": "염화나트륨"}]},
+        {"main_ingredients": [{"code": "M2", "name": "염화칼슘"}]},
+        {"main_ingredients": [{"code": "M3", "name": "디클로페낙나트륨"}]},
+    ]
+    crosswalk = build_ingredient_crosswalk(drug_rows, dur_rows)
+    assert crosswalk["by_name"]["염화나트륨"] == ["D002"]
+    assert crosswalk["by_name"]["염화칼슘"] == []
+    assert crosswalk["match"]["염화칼슘"] == MATCH_NONE
+    assert crosswalk["by_name"]["디클로페낙나트륨"] == ["D003"]
+    assert crosswalk["match"]["디클로페낙나트륨"] == MATCH_NORMALIZED
+
+
+def test_normalize_ingredient_name_uses_shared_suffixes():
+    assert normalize_ingredient_name("슈도에페드린염산염") == "슈도에페드린"
+    assert normalize_ingredient_name("겐타마이신황산염") == "겐타마이신"
+    assert normalize_ingredient_name("암로디핀베실산염") == "암로디핀"
@@ -0,0 +1,18 @@
+from src.chain.retriever import format_drug_info
+from src.data.preprocessor import render_drug_context
+
+
+def test_render_drug_context_cleans_values_and_skips_empty_fields():
+    fields, text = render_drug_context({
+        "item_name": "타이레놀정",
+        "entp_name": "",
+        "main_item_ingr": "<p>아세트아미노펜 ~~삭제된 표기~~ &amp; 카페인</p>",
+    })
+    assert fields == {"item_name": "[제품명] 타이레놀정", "main_item_ingr": "[주성분] 아세트아미노펜 & 카페인"}
+    assert text == "[제품명] 타이레놀정\n[주성분] 아세트아미노펜 & 카페인"
+
+
+def test_format_drug_info_prefers_prerendered_block():
+    row = {"item_name": "타이레놀정", "context_block": "[제품명] 미리 렌더링됨"}
+    assert format_drug_info(row) == "[제품명] 미리 렌더링됨"
+    assert format_drug_info({"item_name": "타이레놀정"}) == "[제품명] 타이레놀정"
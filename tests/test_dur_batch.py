@@ -0,0 +1,80 @@
+import pytest
+
+import src.chain.retriever as retriever
+from src.repository.factory import set_repository
+from src.repository.memory_repository import MemoryRepository
+
+
+def _dur(row_id, code, name, mixture):
+    return {
+        "id": row_id, "TYPE_NAME": "병용금기", "INGR_CODE": code, "INGR_KOR_NAME": name,
+        "MIXTURE_INGR_CODE": f"X{row_id}", "MIXTURE_INGR_KOR_NAME": mixture,
+        "PROHBT_CONTENT": "금기", "DEL_YN": False,
+    }
+
+
+# 이트라코나졸 행이 먼저 나와 일괄 조회의 행 수 제한을 모두 채우는 데이터
+DUR = [_dur(i, "A1", "이트라코나졸", f"약{i}") for i in range(1, 31)] + [
+    _dur(100, "B1", "심바스타틴", "이트라코나졸"),
+    _dur(101, "C1", "세티리진염산염", "알코올"),
+]
+
+
+class CountingRepository(MemoryRepository):
+    """조회 요청 횟수를 세는 메모리 리포지토리."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def search_dur_by_names(self, names, limit):
+        self.requests.append(("names", tuple(names)))
+        return super().search_dur_by_names(names, limit)
+
+    def fetch_dur_by_codes(self, codes, limit):
+        self.requests.append(("codes", tuple(codes)))
+        return super().fetch_dur_by_codes(codes, limit)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    repo = CountingRepository()
+    repo.upsert_rows("dur", DUR)
+    set_repository(repo)
+    retriever.invalidate_retrieval_cache()
+    monkeypatch.setattr(retriever, "DUR_ENGINE", "remote")
+    monkeypatch.setattr(retriever, "DUR_BATCH_ROW_LIMIT", 25)
+    monkeypatch.setattr(retriever, "LOCAL_INDEX_VERSION_CHECK_INTERVAL", 10**9)
+    monkeypatch.setattr(retriever, "_crosswalk", None)
+    monkeypatch.setattr(retriever, "_crosswalk_loaded", True)
+    repo.requests.clear()
+    yield repo
+    set_repository(None)
+    retriever.invalidate_retrieval_cache()
+
+
+def test_one_request_for_all_ingredients(repository):
+    result = retriever.search_dur_for_ingredients(["심바스타틴", "세티리진"])
+    assert [row["id"] for row in result["심바스타틴"]] == [100]
+    # 원본 이름에 없으면 염 접미사를 뗀 이름으로 찾은 행을 사용
+    assert [row["id"] for row in result["세티리진"]] == [101]
+    assert len(repository.requests) == 1
+
+    # 두 번째 조회는 성분별 캐시에서 반환
+    retriever.search_dur_for_ingredients(["심바스타틴"])
+    assert len(repository.requests) == 1
+
+
+def test_truncated_batch_refetches_short_ingredients(repository):
+    result = retriever.search_dur_for_ingredients(["이트라코나졸", "심바스타틴"])
+    assert len(result["이트라코나졸"]) == retriever.DUR_ROWS_PER_INGREDIENT
+    assert [row["id"] for row in result["심바스타틴"]] == [100]
+    assert len(repository.requests) == 2
+
+
+def test_crosswalk_codes_use_exact_code_batch(repository, monkeypatch):
+    monkeypatch.setattr(retriever, "_crosswalk", {"by_name": {"심바스타틴": ["B1"], "세티리진": ["C1"]}})
+    result = retriever.search_dur_for_ingredients(["심바스타틴", "세티리진"])
+    assert [row["id"] for row in result["심바스타틴"]] == [100]
+    assert [row["id"] for row in result["세티리진"]] == [101]
+    assert repository.requests == [("codes", ("B1", "C1"))]
@@ -0,0 +1,41 @@
+from src.chain.dur_graph import DurGraph, is_deleted_row
+
+DUR_ROWS = [
+    {"id": 1, "INGR_CODE": "D1", "INGR_KOR_NAME": "심바스타틴", "MIXTURE_INGR_CODE": "D2",
+     "MIXTURE_INGR_KOR_NAME": "이트라코나졸", "PROHBT_CONTENT": "근육병증", "DEL_YN": False},
+    {"id": 2, "INGR_CODE": "D3", "INGR_KOR_NAME": "클래리트로마이신", "MIXTURE_INGR_CODE": "D1",
+     "MIXTURE_INGR_KOR_NAME": "심바스타틴", "PROHBT_CONTENT": "횡문근융해", "DEL_YN": "N"},
+    {"id": 3, "INGR_CODE": "D1", "INGR_KOR_NAME": "심바스타틴", "MIXTURE_INGR_CODE": "D4",
+     "MIXTURE_INGR_KOR_NAME": "케토코나졸", "PROHBT_CONTENT": "삭제된 행", "DEL_YN": "Y"},
+]
+
+
+def test_is_deleted_row_accepts_bool_and_flags():
+    assert is_deleted_row({"DEL_YN": True})
+    assert is_deleted_row({"del_yn": "y"})
+    assert not is_deleted_row({"DEL_YN": "N"})
+    assert not is_deleted_row({})
+
+
+def test_graph_skips_deleted_rows():
+    graph = DurGraph(DUR_ROWS)
+    assert len(graph) == 3
+    assert graph.resolve_nodes("케토코나졸") == []
+    assert [row["id"] for row in graph.lookup("심바스타틴")] == [1]
+
+
+def test_lookup_matches_substrings_and_codes():
+    graph = DurGraph(DUR_ROWS)
+    assert [row["id"] for row in graph.lookup("스타틴")] == [1]
+    assert [row["id"] for row in graph.lookup_codes(["D3", "D1"])] == [1, 2]
+    assert graph.lookup("아세트아미노펜") == []
+
+
+def test_mutual_finds_pairs_in_either_direction_once():
+    graph = DurGraph(DUR_ROWS)
+    warnings = graph.mutual(["심바스타틴", "이트라코나졸", "클래리트로마이신"])
+    assert warnings == [
+        {"drug1": "심바스타틴", "drug2": "이트라코나졸", "reason": "근육병증"},
+        {"drug1": "클래리트로마이신", "drug2": "심바스타틴", "reason": "횡문근융해"},
+    ]
+    assert graph.mutual(["이트라코나졸", "클래리트로마이신"]) == []
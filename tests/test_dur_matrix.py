@@ -0,0 +1,45 @@
+from src.chain.dur_graph import DurGraph
+from src.chain.dur_matrix import DurConflictMatrix
+
+
+def _row(row_id, code1, name1, code2, name2, reason, deleted=False):
+    return {
+        "id": row_id, "INGR_CODE": code1, "INGR_KOR_NAME": name1,
+        "MIXTURE_INGR_CODE": code2, "MIXTURE_INGR_KOR_NAME": name2,
+        "PROHBT_CONTENT": reason, "DEL_YN": deleted,
+    }
+
+
+DUR_ROWS = [
+    _row(1, "D1", "심바스타틴", "D2", "이트라코나졸", "근육병증"),
+    _row(2, "D2", "이트라코나졸", "D1", "심바스타틴", "근육병증(역방향)"),
+    _row(3, "D3", "클래리트로마이신", "D4", "로바스타틴", "횡문근융해"),
+    _row(4, "D5", "케토코나졸", "D1", "심바스타틴", "삭제됨", deleted=True),
+]
+
+
+def test_matrix_is_symmetric_over_dense_indexes():
+    matrix = DurConflictMatrix.from_codes(DUR_ROWS)
+    assert len(matrix) == 4
+    assert (matrix.matrix == matrix.matrix.T).all()
+    assert matrix.matrix.sum() == 4  # (D1, D2), (D3, D4) 양방향
+    assert "D5" not in matrix.index
+
+
+def test_conflicts_between_different_drugs_only():
+    matrix = DurConflictMatrix.from_codes(DUR_ROWS)
+    # 한 약품 안의 성분끼리(D3, D4)는 처방 충돌로 보지 않음
+    assert matrix.conflicts([["D3", "D4"], ["D9"]]) == []
+    warnings = matrix.conflicts([["D1"], ["D3"], ["D2", "D9"]])
+    assert [w["reason"] for w in warnings] == ["근육병증", "근육병증(역방향)"]
+    assert matrix.conflicts([["D1"]]) == []
+
+
+def test_matrix_from_graph_matches_graph_mutual():
+    graph = DurGraph(DUR_ROWS)
+    matrix = DurConflictMatrix.from_graph(graph)
+    ingredients = ["심바스타틴", "이트라코나졸", "클래리트로마이신", "로바스타틴", "케토코나졸"]
+    groups = [graph.resolve_nodes(name) for name in ingredients]
+    expected = graph.mutual(ingredients)
+    assert sorted(map(str, matrix.conflicts(groups))) == sorted(map(str, expected))
+    assert len(expected) == 3
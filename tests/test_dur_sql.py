@@ -0,0 +1,38 @@
+from src.chain.dur_sql import (
+    MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL,
+    find_mutual_contraindications_sqlite,
+    load_dur_sqlite,
+)
+from src.repository.migrations import MIGRATIONS
+
+DUR_ROWS = [
+    {"id": 1, "INGR_KOR_NAME": "심바스타틴", "MIXTURE_INGR_KOR_NAME": "이트라코나졸", "PROHBT_CONTENT": "근육병증", "DEL_YN": False},
+    {"id": 2, "INGR_KOR_NAME": "이트라코나졸", "MIXTURE_INGR_KOR_NAME": "심바스타틴", "PROHBT_CONTENT": "근육병증", "DEL_YN": False},
+    {"id": 3, "INGR_KOR_NAME": "심바스타틴", "MIXTURE_INGR_KOR_NAME": "케토코나졸", "PROHBT_CONTENT": "삭제됨", "DEL_YN": True},
+    {"id": 4, "INGR_KOR_NAME": "A성분", "MIXTURE_INGR_KOR_NAME": "B성분", "PROHBT_CONTENT": "와일드카드", "DEL_YN": False},
+]
+
+
+def test_sqlite_finds_both_directions_and_skips_deleted():
+    conn = load_dur_sqlite(DUR_ROWS)
+    warnings = find_mutual_contraindications_sqlite(conn, ["심바스타틴", "이트라코나졸", "케토코나졸"])
+    assert [(w["drug1"], w["drug2"]) for w in warnings] == [
+        ("심바스타틴", "이트라코나졸"),
+        ("이트라코나졸", "심바스타틴"),
+    ]
+
+
+def test_sqlite_treats_like_wildcards_literally():
+    conn = load_dur_sqlite(DUR_ROWS)
+    assert find_mutual_contraindications_sqlite(conn, ["%", "_성분"]) == []
+    assert find_mutual_contraindications_sqlite(conn, ["심바스타틴"]) == []
+
+
+def test_rpc_sql_escapes_like_wildcards():
+    assert "ESCAPE '\\'" in MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL
+    assert "'%', '\\%'" in MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL
+    assert "'_', '\\_'" in MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL
+    # 이미 003을 적용한 DB도 새 함수 본문을 받도록 별도 마이그레이션으로 다시 적용
+    assert ("007_mutual_contraindications_rpc_escape", MUTUAL_CONTRAINDICATIONS_FUNCTION_SQL) in [
+        (mid, sql) for mid, _, sql in MIGRATIONS
+    ]
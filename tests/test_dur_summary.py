@@ -0,0 +1,33 @@
+from src.data.crosswalk import build_dur_summaries, build_ingredient_crosswalk
+
+DRUGS = [
+    {"item_seq": "1", "main_item_ingr": "[M1]심바스타틴(20mg)"},
+    {"item_seq": "2", "main_item_ingr": "[M2]아세트아미노펜"},
+]
+
+
+def _dur(row_id, mixture, deleted=False):
+    return {
+        "id": row_id, "INGR_CODE": "D1", "INGR_KOR_NAME": "심바스타틴",
+        "MIXTURE_INGR_CODE": f"X{row_id}", "MIXTURE_INGR_KOR_NAME": mixture,
+        "PROHBT_CONTENT": "근육병증", "DEL_YN": deleted, "TYPE_NAME": "병용금기",
+    }
+
+
+DUR = [_dur(3, "클래리트로마이신"), _dur(1, "이트라코나졸"), _dur(2, "케토코나졸", deleted=True)]
+
+
+def test_summary_joins_through_crosswalk_in_id_order():
+    crosswalk = build_ingredient_crosswalk(DRUGS, DUR)
+    summaries = build_dur_summaries(DRUGS, DUR, crosswalk, limit=20)
+    rows = summaries["1"]["심바스타틴"]
+    assert [row["MIXTURE_INGR_KOR_NAME"] for row in rows] == ["이트라코나졸", "클래리트로마이신"]
+    # 컨텍스트 포맷에 필요한 컬럼만 보관
+    assert set(rows[0]) == {"INGR_CODE", "MIXTURE_INGR_CODE", "MIXTURE_INGR_KOR_NAME", "PROHBT_CONTENT"}
+    assert summaries["2"] == {}
+
+
+def test_summary_respects_per_ingredient_limit():
+    crosswalk = build_ingredient_crosswalk(DRUGS, DUR)
+    summaries = build_dur_summaries(DRUGS, DUR, crosswalk, limit=1)
+    assert len(summaries["1"]["심바스타틴"]) == 1
@@ -0,0 +1,47 @@
+from src.chain.fuzzy_index import (
+    ProductNameIndex,
+    base_product_name,
+    decompose_jamo,
+    edit_distance,
+    extract_choseong,
+)
+
+ROWS = [
+    {"item_seq": "1", "item_name": "타이레놀정500밀리그람(아세트아미노펜)"},
+    {"item_seq": "2", "item_name": "타이레놀정160밀리그람(아세트아미노펜)"},
+    {"item_seq": "3", "item_name": "게보린정(아세트아미노펜,이소프로필안티피린,카페인무수물)"},
+    {"item_seq": "4", "item_name": "판콜에이내복액"},
+]
+
+
+def test_jamo_helpers():
+    assert decompose_jamo("레") == "ㄹㅔ"
+    assert extract_choseong("타이레놀") == "ㅌㅇㄹㄴ"
+    assert base_product_name("타이레놀정500밀리그람(아세트아미노펜)") == "타이레놀"
+
+
+def test_edit_distance_counts_jamo_typos_and_transpositions():
+    # "래" ↔ "레"는 모음 한 글자 차이
+    assert edit_distance(decompose_jamo("타이래놀"), decompose_jamo("타이레놀"), 2) == 1
+    assert edit_distance("abcd", "abdc", 2) == 1
+    assert edit_distance("abcd", "wxyz", 2) == 3
+
+
+def test_corrects_typo_to_base_product_name():
+    index = ProductNameIndex(ROWS)
+    assert len(index) == 3
+    assert index.correct("타이래놀") == ["타이레놀"]
+    assert index.correct("타이래놀정500") == ["타이레놀"]
+    assert index.correct("게보린") == ["게보린"]
+    assert index.correct("아스피린") == []
+
+
+def test_choseong_query():
+    index = ProductNameIndex(ROWS)
+    assert index.correct("ㅌㅇㄹㄴ") == ["타이레놀"]
+
+
+def test_lookup_returns_all_strengths_up_to_limit():
+    index = ProductNameIndex(ROWS)
+    assert index.lookup("타이래놀", 10) == ["1", "2"]
+    assert index.lookup("타이래놀", 1) == ["1"]
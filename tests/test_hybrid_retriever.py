@@ -0,0 +1,41 @@
+import pytest
+
+from src.chain import hybrid_retriever
+from src.chain.hybrid_retriever import hybrid_search, reciprocal_rank_fusion
+
+
+def test_rrf_rewards_items_ranked_by_both_lists():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d", "b"]], k=60)
+    assert fused[:2] == ["c", "b"]
+    assert set(fused) == {"a", "b", "c", "d"}
+
+
+def test_rrf_keeps_first_seen_order_on_ties():
+    assert reciprocal_rank_fusion([["a", "b"], ["b", "a"]], k=60) == ["a", "b"]
+
+
+@pytest.fixture
+def lexical(monkeypatch):
+    monkeypatch.setattr(hybrid_retriever, "search_drugs", lambda category, keyword: [{"item_seq": "1"}, {"item_seq": "2"}])
+    monkeypatch.setattr(hybrid_retriever, "fetch_rows_by_seq", lambda seqs: [{"item_seq": seq, "hydrated": True} for seq in seqs])
+    monkeypatch.setattr(hybrid_retriever, "SEARCH_LIMIT", 3)
+
+
+def test_hybrid_fuses_vector_only_hits(lexical, monkeypatch):
+    monkeypatch.setattr(hybrid_retriever, "vector_search", lambda query: ["3", "1"])
+    rows = hybrid_search("efficacy", "두통", "머리가 깨질 것 같아요")
+    assert [row["item_seq"] for row in rows] == ["1", "3", "2"]
+    assert rows[1]["hydrated"]
+
+
+def test_hybrid_falls_back_to_lexical_when_vector_search_fails(lexical, monkeypatch):
+    def fail(query):
+        raise RuntimeError("pgvector down")
+
+    monkeypatch.setattr(hybrid_retriever, "vector_search", fail)
+    rows = hybrid_search("efficacy", "두통")
+    assert [row["item_seq"] for row in rows] == ["1", "2"]
+
+
+def test_hybrid_unknown_category():
+    assert hybrid_search("unknown", "두통") == []
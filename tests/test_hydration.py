@@ -0,0 +1,53 @@
+import pytest
+
+import src.chain.retriever as retriever
+from src.repository.factory import set_repository
+from src.repository.memory_repository import MemoryRepository
+
+DRUGS = [{"item_seq": str(i), "item_name": f"약{i}", "efcy_qesitm": "두통"} for i in range(1, 4)]
+
+
+class CountingRepository(MemoryRepository):
+    """item_seq 전체 행 조회 요청을 기록하는 메모리 리포지토리."""
+
+    def __init__(self):
+        super().__init__()
+        self.fetches = []
+
+    def fetch_drugs_by_seq(self, item_seqs):
+        self.fetches.append(list(item_seqs))
+        return super().fetch_drugs_by_seq(item_seqs)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    repo = CountingRepository()
+    repo.upsert_rows("drugs", DRUGS)
+    set_repository(repo)
+    monkeypatch.setattr(retriever, "LOCAL_SEARCH_ENABLED", False)
+    retriever.reset_hydration_cache()
+    yield repo
+    set_repository(None)
+    retriever.reset_hydration_cache()
+
+
+def test_hydrates_only_uncached_rows_in_requested_order(repository):
+    assert [row["item_seq"] for row in retriever.fetch_rows_by_seq(["2", "1"])] == ["2", "1"]
+    assert [row["item_seq"] for row in retriever.fetch_rows_by_seq(["3", "2", "9"])] == ["3", "2"]
+    assert repository.fetches == [["2", "1"], ["3", "9"]]
+
+
+def test_rows_fetched_across_a_reset_are_not_cached(repository, monkeypatch):
+    fetch = repository.fetch_drugs_by_seq
+
+    def fetch_then_reset(item_seqs):
+        rows = fetch(item_seqs)
+        # 조회 도중 적재가 끝나 캐시가 무효화된 상황
+        retriever.reset_hydration_cache()
+        return rows
+
+    monkeypatch.setattr(repository, "fetch_drugs_by_seq", fetch_then_reset)
+    assert [row["item_seq"] for row in retriever.fetch_rows_by_seq(["1"])] == ["1"]
+    monkeypatch.setattr(repository, "fetch_drugs_by_seq", fetch)
+    retriever.fetch_rows_by_seq(["1"])
+    assert repository.fetches == [["1"], ["1"]]
@@ -0,0 +1,61 @@
+from src.data.incremental_sync import (
+    compute_delta,
+    find_conflicting_keys,
+    format_delta,
+    load_sync_state,
+    record_fingerprint,
+    save_sync_state,
+)
+
+COLUMNS = ["INGR_CODE", "MIXTURE_INGR_CODE", "PROHBT_CONTENT"]
+
+
+def _key(record: dict) -> str:
+    return f"{record['INGR_CODE']}|{record['MIXTURE_INGR_CODE']}"
+
+
+def _row(code1, code2, reason):
+    return {"INGR_CODE": code1, "MIXTURE_INGR_CODE": code2, "PROHBT_CONTENT": reason}
+
+
+def test_fingerprint_depends_only_on_columns():
+    row = _row("D1", "D2", "근육병증")
+    assert record_fingerprint(row, COLUMNS) == record_fingerprint({**row, "id": 99}, COLUMNS)
+    assert record_fingerprint(row, COLUMNS) != record_fingerprint(_row("D1", "D2", "변경"), COLUMNS)
+
+
+def test_compute_delta_classifies_records():
+    before = [_row("D1", "D2", "근육병증"), _row("D3", "D4", "횡문근융해"), _row("D5", "D6", "QT 연장")]
+    previous = compute_delta(before, _key, COLUMNS, {})["fingerprints"]
+
+    after = [_row("D1", "D2", "근육병증"), _row("D3", "D4", "사유 변경"), _row("D7", "D8", "신규")]
+    delta = compute_delta(after, _key, COLUMNS, previous)
+    assert [_key(r) for r in delta["new"]] == ["D7|D8"]
+    assert [_key(r) for r in delta["changed"]] == ["D3|D4"]
+    assert delta["deleted"] == ["D5|D6"]
+    assert delta["unchanged"] == 1
+    assert format_delta(delta) == "신규 1건 / 변경 1건 / 삭제 1건 / 변경 없음 1건"
+
+
+def test_duplicate_keys_keep_the_last_record():
+    records = [_row("D1", "D2", "첫 번째"), _row("D1", "D2", "마지막")]
+    delta = compute_delta(records, _key, COLUMNS, {})
+    assert [r["PROHBT_CONTENT"] for r in delta["new"]] == ["마지막"]
+
+
+def test_find_conflicting_keys_ignores_identical_duplicates():
+    records = [
+        _row("D1", "D2", "근육병증"),
+        _row("D1", "D2", "근육병증"),
+        _row("D3", "D4", "사유 A"),
+        _row("D3", "D4", "사유 B"),
+        _row("D3", "D4", "사유 A"),
+    ]
+    assert find_conflicting_keys(records, _key, COLUMNS) == {"D3|D4": 3}
+
+
+def test_sync_state_round_trip(tmp_path):
+    path = str(tmp_path / "state" / "dur_sync.json")
+    assert load_sync_state(path) == {}
+    save_sync_state(path, {"D1|D2": "abc"})
+    assert load_sync_state(path) == {"D1|D2": "abc"}
@@ -0,0 +1,23 @@
+from src.data.preprocessor import build_ingredient_index, parse_main_item_ingr
+
+
+def test_parse_main_item_ingr_splits_codes_and_strengths():
+    assert parse_main_item_ingr("[M040548]창출|[M223204]아세트아미노펜(500mg)") == [
+        {"code": "M040548", "name": "창출"},
+        {"code": "M223204", "name": "아세트아미노펜"},
+    ]
+    assert parse_main_item_ingr("카페인무수물") == [{"code": "", "name": "카페인무수물"}]
+    assert parse_main_item_ingr(None) == []
+    assert parse_main_item_ingr(" | ") == []
+
+
+def test_build_ingredient_index_by_name_and_code():
+    rows = [
+        {"item_seq": 1, "main_item_ingr": "[M223204]아세트아미노펜(500mg)"},
+        {"item_seq": 2, "main_item_ingr": "[m223204]아세트 아미노펜|[M040548]창출"},
+        {"item_seq": 3, "main_ingredients": [{"code": "", "name": "Caffeine"}]},
+    ]
+    index = build_ingredient_index(rows)
+    assert index["by_name"]["아세트아미노펜"] == ["1", "2"]
+    assert index["by_name"]["caffeine"] == ["3"]
+    assert index["by_code"] == {"M223204": ["1", "2"], "M040548": ["2"]}
@@ -0,0 +1,40 @@
+from src.chain.local_index import DrugSnapshot, char_ngrams
+
+ROWS = [
+    {"item_seq": "1", "item_name": "타이레놀정500밀리그람", "main_item_ingr": "[M040702]아세트아미노펜", "efcy_qesitm": "두통, 치통"},
+    {"item_seq": "2", "item_name": "어린이타이레놀현탁액", "main_item_ingr": "[M040702]아세트아미노펜", "efcy_qesitm": "해열"},
+    {"item_seq": "3", "item_name": "Tylenol ER", "main_item_ingr": "[M040702]acetaminophen", "efcy_qesitm": "Headache"},
+]
+
+
+def test_char_ngrams():
+    assert char_ngrams("타이레놀", 2) == {"타이", "이레", "레놀"}
+    assert char_ngrams("약", 2) == set()
+
+
+def _ilike(column, keyword):
+    return [row["item_seq"] for row in ROWS if keyword.lower() in str(row.get(column) or "").lower()]
+
+
+def test_search_matches_ilike_semantics():
+    snapshot = DrugSnapshot(ROWS)
+    for column, keyword in [
+        ("item_name", "타이레놀"),
+        ("item_name", "tylenol"),
+        ("main_item_ingr", "M040702"),
+        ("efcy_qesitm", "통"),  # n-gram보다 짧은 키워드는 전체 행 검사
+        ("efcy_qesitm", "변비"),
+    ]:
+        found = [row["item_seq"] for row in snapshot.search(column, keyword, 10)]
+        assert found == _ilike(column, keyword), (column, keyword)
+
+
+def test_search_respects_limit_and_unknown_column():
+    snapshot = DrugSnapshot(ROWS)
+    assert [row["item_seq"] for row in snapshot.search("item_name", "타이레놀", 1)] == ["1"]
+    assert snapshot.search("entp_name", "제약", 10) == []
+
+
+def test_get_rows_keeps_requested_order():
+    snapshot = DrugSnapshot(ROWS)
+    assert [row["item_seq"] for row in snapshot.get_rows(["3", "9", "1"])] == ["3", "1"]
@@ -0,0 +1,91 @@
+import pytest
+
+from src.repository.migrations import (
+    MIGRATIONS,
+    TRGM_INDEXES,
+    apply_migrations,
+    migrations_sql,
+    plan_index_names,
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=()):
+        if sql in self.conn.failing:
+            raise RuntimeError("syntax error")
+        self.conn.pending.append((sql, params))
+        if sql.startswith("SELECT id FROM schema_migrations"):
+            self.rows = [(mid,) for mid in self.conn.applied]
+        elif sql.startswith("INSERT INTO schema_migrations"):
+            self.conn.pending_ids.append(params[0])
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    """schema_migrations 기록만 흉내 내는 DB-API 연결."""
+
+    def __init__(self, applied=(), failing=()):
+        self.applied = list(applied)
+        self.failing = set(failing)
+        self.pending = []
+        self.pending_ids = []
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.executed.extend(self.pending)
+        self.applied.extend(self.pending_ids)
+        self.pending, self.pending_ids = [], []
+
+    def rollback(self):
+        self.pending, self.pending_ids = [], []
+
+
+def test_migration_ids_are_unique_and_ordered():
+    ids = [mid for mid, _, _ in MIGRATIONS]
+    assert len(ids) == len(set(ids))
+    assert ids == sorted(ids)
+
+
+def test_migrations_sql_contains_every_trgm_index():
+    script = migrations_sql()
+    for name, _, _ in TRGM_INDEXES:
+        assert name in script
+    assert "CREATE EXTENSION IF NOT EXISTS pg_trgm;" in script
+
+
+def test_apply_skips_already_applied_migrations():
+    first = MIGRATIONS[0][0]
+    conn = FakeConnection(applied=[first])
+    applied = apply_migrations(conn)
+    assert applied == [mid for mid, _, _ in MIGRATIONS[1:]]
+    assert apply_migrations(conn) == []
+
+
+def test_failed_migration_is_rolled_back_and_stops():
+    failing = MIGRATIONS[1][2]
+    conn = FakeConnection(failing=[failing])
+    with pytest.raises(RuntimeError):
+        apply_migrations(conn)
+    assert conn.applied == [MIGRATIONS[0][0]]
+
+
+def test_plan_index_names_walks_nested_plans():
+    plan = {"Plan": {"Node Type": "Limit", "Plans": [
+        {"Node Type": "Bitmap Heap Scan", "Plans": [{"Node Type": "Bitmap Index Scan", "Index Name": "idx_a"}]},
+    ]}}
+    assert plan_index_names(plan) == ["idx_a"]
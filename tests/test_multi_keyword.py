@@ -0,0 +1,31 @@
+import src.chain.retriever as retriever
+
+
+def _row(seq, efcy):
+    return {"item_seq": seq, "efcy_qesitm": efcy}
+
+
+def test_split_keywords_dedupes_and_caps():
+    assert retriever.split_keywords("요통, 두통，요통、 ") == ["요통", "두통"]
+    assert retriever.split_keywords("") == []
+    many = ", ".join(f"증상{i}" for i in range(retriever.MAX_SEARCH_TERMS + 2))
+    assert len(retriever.split_keywords(many)) == retriever.MAX_SEARCH_TERMS
+
+
+def test_merge_prefers_rows_covering_more_terms():
+    results = [
+        [_row("1", "요통"), _row("2", "요통, 두통")],
+        [_row("2", "요통, 두통"), _row("3", "두통")],
+    ]
+    merged = retriever._merge_by_coverage("efcy_qesitm", ["요통", "두통"], results, 3)
+    assert [row["item_seq"] for row in merged] == ["2", "1", "3"]
+
+
+def test_merge_reserves_a_slot_for_every_term(monkeypatch):
+    monkeypatch.setattr(retriever, "SEARCH_TERM_QUOTA", 1)
+    results = [
+        [_row("1", "요통"), _row("2", "요통"), _row("3", "요통")],
+        [_row("4", "치통")],
+    ]
+    merged = retriever._merge_by_coverage("efcy_qesitm", ["요통", "치통"], results, 2)
+    assert {row["item_seq"] for row in merged} == {"1", "4"}
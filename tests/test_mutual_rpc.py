@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+from src.chain.dur_graph import DurGraph
+from src.chain.dur_sql import MUTUAL_CONTRAINDICATIONS_RPC, find_mutual_contraindications_sqlite, load_dur_sqlite
+from src.repository.supabase_repository import SupabaseRepository
+
+
+def _dur(row_id, name1, name2, reason, deleted=False):
+    return {"id": row_id, "INGR_KOR_NAME": name1, "MIXTURE_INGR_KOR_NAME": name2,
+            "PROHBT_CONTENT": reason, "DEL_YN": deleted}
+
+
+DUR = [
+    _dur(1, "심바스타틴", "이트라코나졸", "근육병증"),
+    _dur(2, "클래리트로마이신", "심바스타틴", "횡문근융해"),
+    _dur(3, "로바스타틴", "이트라코나졸", "근육병증"),
+    _dur(4, "심바스타틴", "케토코나졸", "삭제됨", deleted=True),
+]
+INGREDIENTS = ["심바스타틴", "이트라코나졸", "클래리트로마이신", "케토코나졸"]
+
+
+def test_sqlite_stand_in_matches_graph():
+    conn = load_dur_sqlite(DUR)
+    expected = DurGraph(DUR).mutual(INGREDIENTS)
+    assert sorted(map(str, find_mutual_contraindications_sqlite(conn, INGREDIENTS))) == sorted(map(str, expected))
+    assert len(expected) == 2
+
+
+class FakeRpcClient:
+    """rpc() 호출을 기록하고 정해진 행을 돌려주는 Supabase 클라이언트 대역."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def rpc(self, name, params):
+        self.calls.append((name, params))
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=self.rows))
+
+
+def test_supabase_repository_calls_rpc_once(monkeypatch):
+    client = FakeRpcClient([{"id": 1, "drug1": "심바스타틴", "drug2": "이트라코나졸", "reason": "근육병증"}])
+    repository = SupabaseRepository()
+    monkeypatch.setattr(repository, "_client", lambda: client)
+    warnings = repository.find_mutual_contraindications(INGREDIENTS[:2])
+    assert warnings == [{"drug1": "심바스타틴", "drug2": "이트라코나졸", "reason": "근육병증"}]
+    assert client.calls == [(MUTUAL_CONTRAINDICATIONS_RPC, {"ingredients": INGREDIENTS[:2]})]
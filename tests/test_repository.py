@@ -0,0 +1,75 @@
+import pytest
+
+from src.repository.factory import create_repository
+from src.repository.memory_repository import MemoryRepository
+from src.repository.sqlite_repository import SQLiteRepository
+
+DRUGS = [
+    {"item_seq": "1", "item_name": "타이레놀정500밀리그람", "main_item_ingr": "[M1]아세트아미노펜", "efcy_qesitm": "두통, 치통"},
+    {"item_seq": "2", "item_name": "조코정20밀리그램", "main_item_ingr": "[M2]심바스타틴", "efcy_qesitm": "고지혈증"},
+    {"item_seq": "3", "item_name": "스포라녹스캡슐", "main_item_ingr": "[M3]이트라코나졸", "efcy_qesitm": "진균 감염, 두통 주의"},
+]
+
+
+def _dur(row_id, code1, name1, code2, name2, deleted=False):
+    return {
+        "id": row_id, "INGR_CODE": code1, "INGR_KOR_NAME": name1,
+        "MIXTURE_INGR_CODE": code2, "MIXTURE_INGR_KOR_NAME": name2,
+        "PROHBT_CONTENT": f"{name1}-{name2}", "DEL_YN": deleted,
+    }
+
+
+DUR = [
+    _dur(1, "D2", "심바스타틴", "D3", "이트라코나졸"),
+    _dur(2, "D3", "이트라코나졸", "D2", "심바스타틴"),
+    _dur(3, "D2", "심바스타틴", "D4", "클래리트로마이신"),
+    _dur(4, "D2", "심바스타틴", "D5", "케토코나졸", deleted=True),
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    repo = MemoryRepository() if request.param == "memory" else SQLiteRepository(str(tmp_path / "replica.sqlite3"))
+    repo.upsert_rows("drugs", [dict(row) for row in DRUGS])
+    repo.upsert_rows("dur", [dict(row) for row in DUR])
+    yield repo
+    if isinstance(repo, SQLiteRepository):
+        repo.close()
+
+
+def _ids(rows, key="id"):
+    return sorted(str(row[key]) for row in rows)
+
+
+def test_drug_queries(repository):
+    assert _ids(repository.fetch_all("drugs"), "item_seq") == ["1", "2", "3"]
+    assert _ids(repository.fetch_drugs_by_seq(["3", "9"]), "item_seq") == ["3"]
+    rows = repository.search_drugs("efcy_qesitm", "두통", ["item_seq"], 10)
+    assert _ids(rows, "item_seq") == ["1", "3"]
+    assert set(rows[0]) == {"item_seq"}
+
+
+def test_dur_queries_skip_deleted_rows(repository):
+    assert [row["id"] for row in repository.fetch_dur_by_codes(["D2"], 10)] == [1, 3]
+    assert [row["id"] for row in repository.fetch_dur_code_pairs(["D2", "D3", "D5"], 10)] == [1, 2]
+    assert [row["id"] for row in repository.fetch_dur_code_pairs(["D2", "D3"], 1, after_id=1)] == [2]
+    assert _ids(repository.search_dur_by_name("스타틴", 10)) == ["1", "3"]
+    assert _ids(repository.search_dur_pair("심바스타틴", "이트라코나졸", 10)) == ["1"]
+
+
+def test_mutual_contraindications(repository):
+    warnings = repository.find_mutual_contraindications(["심바스타틴", "이트라코나졸", "케토코나졸"])
+    assert [(w["drug1"], w["drug2"]) for w in warnings] == [("심바스타틴", "이트라코나졸"), ("이트라코나졸", "심바스타틴")]
+
+
+def test_soft_delete_and_data_version(repository):
+    before = repository.data_version("dur")
+    assert before is not None
+    assert repository.soft_delete("dur", [3]) == 1
+    assert repository.data_version("dur") != before
+    assert _ids(repository.search_dur_by_name("심바스타틴", 10)) == ["1"]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_repository("nope")
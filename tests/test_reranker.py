@@ -0,0 +1,31 @@
+from src.chain.reranker import rerank_candidates
+
+
+def _seqs(rows):
+    return [row["item_seq"] for row in rows]
+
+
+def test_exact_product_name_ranks_first():
+    candidates = [
+        {"item_seq": "1", "item_name": "어린이타이레놀"},
+        {"item_seq": "2", "item_name": "타이레놀정500밀리그람"},
+        {"item_seq": "3", "item_name": "타이레놀"},
+    ]
+    assert _seqs(rerank_candidates(candidates, "item_name", "타이레놀")) == ["3", "2", "1"]
+
+
+def test_cancelled_products_sink():
+    candidates = [
+        {"item_seq": "1", "item_name": "타이레놀", "cancel_date": "20200101"},
+        {"item_seq": "2", "item_name": "타이레놀정"},
+    ]
+    assert _seqs(rerank_candidates(candidates, "item_name", "타이레놀")) == ["2", "1"]
+
+
+def test_prior_score_breaks_lexical_ties():
+    candidates = [
+        {"item_seq": "1", "item_name": "가", "efcy_qesitm": "두통에 사용"},
+        {"item_seq": "2", "item_name": "나", "efcy_qesitm": "두통에 사용"},
+    ]
+    assert _seqs(rerank_candidates(candidates, "efcy_qesitm", "두통")) == ["1", "2"]
+    assert _seqs(rerank_candidates(candidates, "efcy_qesitm", "두통", prior=[1.0, 4.0])) == ["2", "1"]
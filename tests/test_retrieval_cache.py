@@ -0,0 +1,63 @@
+import pytest
+
+import src.chain.retriever as retriever
+from src.repository.factory import set_repository
+from src.repository.memory_repository import MemoryRepository
+
+DRUGS = [{"item_seq": "1", "item_name": "타이레놀정", "efcy_qesitm": "두통"}]
+
+
+class CountingRepository(MemoryRepository):
+    """drugs 검색 요청 횟수를 세는 메모리 리포지토리."""
+
+    def __init__(self):
+        super().__init__()
+        self.searches = 0
+
+    def search_drugs(self, column, keyword, columns, limit):
+        self.searches += 1
+        return super().search_drugs(column, keyword, columns, limit)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    repo = CountingRepository()
+    repo.upsert_rows("drugs", DRUGS)
+    set_repository(repo)
+    retriever.invalidate_retrieval_cache()
+    monkeypatch.setattr(retriever, "RETRIEVAL_CACHE_ENABLED", True)
+    monkeypatch.setattr(retriever, "LOCAL_SEARCH_ENABLED", False)
+    monkeypatch.setattr(retriever, "BM25_SEARCH_ENABLED", False)
+    monkeypatch.setattr(retriever, "LOCAL_INDEX_VERSION_CHECK_INTERVAL", 10**9)
+    yield repo
+    set_repository(None)
+    retriever.invalidate_retrieval_cache()
+
+
+def test_repeated_search_is_served_from_cache(repository):
+    first = retriever.search_drugs("product_name", "타이레놀")
+    searches = repository.searches
+    # 키워드 정규화(대소문자, 공백)가 같은 검색은 같은 캐시 항목 사용
+    second = retriever.search_drugs("product_name", "  타이레놀 ")
+    assert second == first
+    assert repository.searches == searches
+
+    # 반환값을 수정해도 캐시에는 영향 없음
+    second.clear()
+    assert retriever.search_drugs("product_name", "타이레놀") == first
+
+
+def test_empty_results_are_cached(repository):
+    assert retriever.search_drugs("efficacy", "관절염") == []
+    searches = repository.searches
+    assert retriever.search_drugs("efficacy", "관절염") == []
+    assert repository.searches == searches
+    assert retriever.get_retrieval_cache_stats()["negative_hits"] >= 1
+
+
+def test_invalidation_drops_cached_results(repository):
+    retriever.search_drugs("product_name", "타이레놀")
+    repository.upsert_rows("drugs", [{"item_seq": "2", "item_name": "타이레놀현탁액", "efcy_qesitm": "해열"}])
+    retriever.invalidate_retrieval_cache("drugs")
+    rows = retriever.search_drugs("product_name", "타이레놀")
+    assert sorted(row["item_seq"] for row in rows) == ["1", "2"]
@@ -0,0 +1,39 @@
+import pytest
+
+import src.chain.retriever as retriever
+from src.chain.bm25_index import BM25Index
+from src.repository.factory import set_repository
+from src.repository.memory_repository import MemoryRepository
+
+DRUGS = [
+    {"item_seq": "1", "item_name": "두통약A", "efcy_qesitm": "두통, 치통, 생리통에 사용합니다.", "cancel_date": "20200101"},
+    {"item_seq": "2", "item_name": "두통약B", "efcy_qesitm": "두통, 치통, 생리통에 사용합니다."},
+    {"item_seq": "3", "item_name": "기침약", "efcy_qesitm": "기침, 가래에 사용합니다."},
+    {"item_seq": "4", "item_name": "연고", "efcy_qesitm": "SPF50 자외선 차단"},
+]
+
+
+@pytest.fixture
+def memory_backend(monkeypatch):
+    repository = MemoryRepository()
+    repository.upsert_rows("drugs", DRUGS)
+    set_repository(repository)
+    retriever.invalidate_retrieval_cache()
+    monkeypatch.setattr(retriever, "LOCAL_SEARCH_ENABLED", False)
+    monkeypatch.setattr(retriever, "BM25_SEARCH_ENABLED", True)
+    # 색인에는 "SPF50" 약품이 빠진 상태 (색인 생성 후 추가된 약품)
+    monkeypatch.setattr(retriever, "_bm25_index", BM25Index.build(DRUGS[:3]))
+    monkeypatch.setattr(retriever, "_bm25_loaded", True)
+    yield repository
+    set_repository(None)
+    retriever.invalidate_retrieval_cache()
+
+
+def test_bm25_results_go_through_cancelled_penalty(memory_backend):
+    rows = retriever._search_exact("efcy_qesitm", "두통", 3)
+    assert [row["item_seq"] for row in rows] == ["2", "1"]
+
+
+def test_falls_back_to_substring_search_when_bm25_is_empty(memory_backend):
+    rows = retriever._search_exact("efcy_qesitm", "SPF50", 3)
+    assert [row["item_seq"] for row in rows] == ["4"]
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+import src.chain.rag_chain as rag_chain
+
+DRUG = {"item_seq": "1", "item_name": "복합제", "main_item_ingr": "[M1]이부프로펜(200mg)|[M2]케토롤락"}
+QUERY = {"question": "같이 먹어도 되나요?", "category": "product_name", "keyword": "복합제"}
+MUTUAL = [{"drug1": "이부프로펜", "drug2": "케토롤락", "reason": "위장관 출혈"}]
+
+
+@pytest.fixture
+def stages(monkeypatch):
+    monkeypatch.setattr(rag_chain, "RETRIEVAL_MODE", "lexical")
+    monkeypatch.setattr(rag_chain, "search_drugs", lambda category, keyword: [dict(DRUG)])
+    monkeypatch.setattr(rag_chain, "DUR_STAGE_TIMEOUT", 2.0)
+    monkeypatch.setattr(rag_chain, "MUTUAL_STAGE_TIMEOUT", 2.0)
+    monkeypatch.setattr(rag_chain, "check_mutual_contraindication", lambda ingredients: MUTUAL)
+    return monkeypatch
+
+
+def test_dur_and_mutual_stages_run_concurrently(stages):
+    mutual_started = threading.Event()
+
+    def dur(ingredients):
+        # 두 단계가 순서대로 실행되면 상호 체크가 시작되지 않아 대기 시간이 끝남
+        assert mutual_started.wait(1.5)
+        return {"이부프로펜": [{"MIXTURE_INGR_KOR_NAME": "아스피린", "PROHBT_CONTENT": "출혈"}]}
+
+    def mutual(ingredients):
+        mutual_started.set()
+        return MUTUAL
+
+    stages.setattr(rag_chain, "search_dur_for_ingredients", dur)
+    stages.setattr(rag_chain, "check_mutual_contraindication", mutual)
+    out = rag_chain._search(QUERY)
+    assert out["ingredients"] == ["이부프로펜", "케토롤락"]
+    assert "아스피린" in out["dur_context"]
+    assert out["mutual_warnings"] == MUTUAL
+
+
+def test_slow_dur_stage_times_out_without_dropping_mutual(stages):
+    release = threading.Event()
+
+    def slow_dur(ingredients):
+        release.wait(5)
+        return {}
+
+    stages.setattr(rag_chain, "search_dur_for_ingredients", slow_dur)
+    stages.setattr(rag_chain, "DUR_STAGE_TIMEOUT", 0.05)
+    try:
+        out = rag_chain._search(QUERY)
+        assert out["dur_context"] == rag_chain.DUR_TIMEOUT_CONTEXT
+        assert out["dur_data"] == {}
+        assert out["mutual_warnings"] == MUTUAL
+    finally:
+        release.set()
+
+
+def test_materialized_summary_skips_dur_stage(stages):
+    def fail(ingredients):
+        raise AssertionError("DUR 단계가 실행되면 안 됨")
+
+    stages.setattr(rag_chain, "search_dur_for_ingredients", fail)
+    drug = {**DRUG, "dur_summary": {}, "dur_context": "(병용금지 정보 없음)"}
+    stages.setattr(rag_chain, "search_drugs", lambda category, keyword: [drug])
+    out = rag_chain._search(QUERY)
+    assert out["dur_data"] == {}
+    assert out["mutual_warnings"] == MUTUAL
@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.chain.single_flight import SingleFlight
+
+CALLERS = 6
+
+
+def _wait_for_callers(flight: SingleFlight) -> None:
+    """모든 호출이 실행 중 Future에 합류할 때까지 기다립니다."""
+    deadline = time.monotonic() + 5
+    while flight.stats()["calls"] < CALLERS and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    executions = []
+
+    def slow():
+        executions.append(1)
+        release.wait(5)
+        return ["row"]
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(flight.do, "k", slow) for _ in range(CALLERS)]
+        _wait_for_callers(flight)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert executions == [1]
+    assert results == [["row"]] * CALLERS
+    stats = flight.stats()
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == CALLERS - 1
+    assert stats["inflight"] == 0
+
+
+def test_exception_is_shared_and_key_is_released():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise RuntimeError("backend down")
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(flight.do, "k", failing) for _ in range(CALLERS)]
+        _wait_for_callers(flight)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="backend down"):
+                future.result(timeout=5)
+
+    # 실패한 결과는 보관하지 않으므로 다음 호출은 새로 실행
+    assert flight.do("k", lambda: "ok") == "ok"
+    assert flight.stats()["executions"] == 2
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.stats()["coalesced"] == 0
@@ -0,0 +1,42 @@
+import os
+
+from src.repository.sqlite_repository import SQLiteRepository, build_sqlite_replica
+
+DRUGS = [
+    {"item_seq": "1", "item_name": "타이레놀정500밀리그람", "main_item_ingr": "[M1]아세트아미노펜", "efcy_qesitm": "두통, 치통"},
+    {"item_seq": "2", "item_name": "어린이타이레놀현탁액", "main_item_ingr": "[M1]아세트아미노펜", "efcy_qesitm": "해열"},
+]
+DUR = [
+    {"id": 1, "INGR_CODE": "D1", "INGR_KOR_NAME": "아세트아미노펜", "MIXTURE_INGR_CODE": "D2",
+     "MIXTURE_INGR_KOR_NAME": "와파린", "PROHBT_CONTENT": "출혈", "DEL_YN": False},
+]
+
+
+def test_build_replica_writes_single_file_with_meta(tmp_path):
+    path = str(tmp_path / "replica" / "drugs_replica.sqlite3")
+    meta = build_sqlite_replica(path, DRUGS, DUR)
+    assert meta["drugs_count"] == "2"
+    assert meta["dur_count"] == "1"
+    assert sorted(os.listdir(tmp_path / "replica")) == ["drugs_replica.sqlite3"]
+
+    repo = SQLiteRepository(path)
+    try:
+        assert repo.replica_info()["replica_version"] == meta["replica_version"]
+        rows = repo.search_drugs("item_name", "타이레놀", ["item_seq"], 10)
+        assert sorted(row["item_seq"] for row in rows) == ["1", "2"]
+        assert [row["id"] for row in repo.search_dur_by_name("아세트", 10)] == [1]
+    finally:
+        repo.close()
+
+
+def test_rebuild_replaces_existing_replica(tmp_path):
+    path = str(tmp_path / "drugs_replica.sqlite3")
+    build_sqlite_replica(path, DRUGS, DUR)
+    build_sqlite_replica(path, DRUGS[:1], [])
+
+    repo = SQLiteRepository(path)
+    try:
+        assert [row["item_seq"] for row in repo.fetch_all("drugs")] == ["1"]
+        assert repo.fetch_all("dur", order="id") == []
+    finally:
+        repo.close()
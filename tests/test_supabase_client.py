@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils import supabase_client
+
+
+@pytest.fixture
+def fake_project(monkeypatch):
+    monkeypatch.setattr(supabase_client, "SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setattr(supabase_client, "SUPABASE_KEY", "test-anon-key")
+    supabase_client.reset_supabase_client()
+    yield
+    supabase_client.reset_supabase_client()
+
+
+def test_client_is_created_once_across_threads(fake_project):
+    before = supabase_client.get_supabase_pool_stats()["clients_created"]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: supabase_client.get_supabase_client(), range(16)))
+    assert all(client is clients[0] for client in clients)
+    stats = supabase_client.get_supabase_pool_stats()
+    assert stats["clients_created"] == before + 1
+    assert stats["max_connections"] == supabase_client.SUPABASE_POOL_MAX_CONNECTIONS
+
+
+def test_reset_creates_a_new_client(fake_project):
+    first = supabase_client.get_supabase_client()
+    supabase_client.reset_supabase_client()
+    assert supabase_client.get_supabase_client() is not first
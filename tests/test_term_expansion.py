@@ -0,0 +1,25 @@
+from src.chain.term_expansion import AhoCorasick, expand_keyword
+
+
+def test_keeps_unmatched_symptoms():
+    assert expand_keyword("체한 것 같고 두통") == "체한 것 같고 두통, 소화불량"
+    assert expand_keyword("머리가 아프고 기침") == "머리가 아프고 기침, 두통"
+
+
+def test_keyword_without_lay_terms_is_unchanged():
+    assert expand_keyword("기침") == "기침"
+    assert expand_keyword("요통, 두통") == "요통, 두통"
+
+
+def test_does_not_duplicate_existing_terms():
+    assert expand_keyword("두통, 머리가 아파요") == "두통, 머리가 아파요"
+
+
+def test_child_is_not_a_toothache():
+    assert expand_keyword("아이가 아프대요") == "아이가 아프대요"
+    assert expand_keyword("이가 아프대요") == "이가 아프대요, 치통"
+
+
+def test_longest_non_overlapping_matches():
+    automaton = AhoCorasick({"ab": "X", "abc": "Y", "c": "Z", "d": "W"})
+    assert automaton.find_longest("abcd") == [(0, 3, "Y"), (3, 4, "W")]